@@ -14,5 +14,8 @@ fi
 
 URL="$1"
 
-# Run yt-dlp with your preferred format
-yt-dlp -f "bv*[ext=mp4]+ba[ext=m4a]/b[ext=mp4]" --merge-output-format mp4 -o "%(title)s.%(ext)s" "$URL"
+# Run yt-dlp with your preferred format.  The final file path is printed on
+# stdout so callers can capture it (VIDEO=$(./download-meeting.sh URL))
+# instead of scanning the directory for the new download.
+yt-dlp -f "bv*[ext=mp4]+ba[ext=m4a]/b[ext=mp4]" --merge-output-format mp4 -o "%(title)s.%(ext)s" \
+  --print after_move:filepath "$URL"
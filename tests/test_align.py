@@ -12,3 +12,49 @@ def test_alignment_smoke():
     )
     assert matched, "No output"
     assert sum(x["start"] is None for x in matched) < 20, "Too many misses"
+
+
+def test_alignment_picks_best_window(tmp_path):
+    import json
+
+    words = "call to order roll call please public comment now open budget vote passes".split()
+    asr = tmp_path / "asr.json"
+    asr.write_text(json.dumps({"segments": [{"words": [
+        {"word": w, "start": float(i), "end": i + 0.5} for i, w in enumerate(words)
+    ]}]}))
+    pdf = tmp_path / "pdf.json"
+    pdf.write_text(json.dumps([
+        {"text": "CHAIR: Budget vote passes."},
+        {"text": "zebra quantum"},
+    ]))
+
+    matched = align_pdf_to_asr(pdf, asr, window=3, step=1, ratio_thresh=0.5)
+
+    assert (matched[0]["start"], matched[0]["end"]) == (10.0, 12.5)
+    assert matched[1]["start"] is None
+
+
+def test_alignment_chunks_at_silences(tmp_path):
+    import json
+
+    from videocut.core import align
+
+    first = "call to order roll call please".split()
+    second = "budget vote passes meeting adjourned".split()
+    timed = [(w, float(i)) for i, w in enumerate(first)]
+    timed += [(w, 20.0 + i) for i, w in enumerate(second)]  # 15 s silence
+    asr = tmp_path / "asr.json"
+    asr.write_text(json.dumps({"segments": [{"words": [
+        {"word": w, "start": t, "end": t + 0.5} for w, t in timed
+    ]}]}))
+    pdf = tmp_path / "pdf.json"
+    pdf.write_text(json.dumps([{"text": "CHAIR: Budget vote passes."}, {"text": "Roll call please."}]))
+
+    _, starts, ends = align._build_stream(json.loads(asr.read_text())["segments"])
+    assert align._chunk_bounds(starts, ends, 5.0) == [(0, 6), (6, 11)]
+
+    whole = align_pdf_to_asr(pdf, asr, window=3, step=1, ratio_thresh=0.5)
+    chunked = align_pdf_to_asr(pdf, asr, window=3, step=1, ratio_thresh=0.5, chunk_seconds=5.0)
+    assert chunked == whole
+    assert (chunked[0]["start"], chunked[0]["end"]) == (20.0, 22.5)
+    assert (chunked[1]["start"], chunked[1]["end"]) == (3.0, 5.5)
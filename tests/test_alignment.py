@@ -1,16 +1,15 @@
 import json
-import pathlib
 from types import SimpleNamespace
 
 import videocut.core.alignment as alignment
 
 
 def test_align_with_transcript(tmp_path, monkeypatch):
-    calls = {"ffmpeg": [], "load_align_model": False, "align": False, "wave": False}
+    calls = {"ffmpeg": [], "load_align_model": False, "align": False}
 
-    def fake_run(cmd, check):
+    def fake_run(cmd, check, stdout):
         calls["ffmpeg"].append(cmd)
-        pathlib.Path(cmd[-1]).write_bytes(b"")
+        return SimpleNamespace(stdout=b"\x00\x00" * 16000)  # 1 s of silence
 
     def fake_load_align_model(lang, device):
         calls["load_align_model"] = True
@@ -18,25 +17,12 @@ def test_align_with_transcript(tmp_path, monkeypatch):
 
     def fake_align(segs, am, meta, audio, device):
         calls["align"] = True
+        calls["audio"] = (len(audio), segs[0]["end"])
         return {"word_segments": [{"text": "hi", "start": 0.0, "end": 1.0}]}
 
-    class FakeWave:
-        def getnframes(self):
-            return 16000
-
-        def getframerate(self):
-            return 16000
-
-        def close(self):
-            calls["wave"] = True
-
-    def fake_wave_open(*args, **kwargs):
-        return FakeWave()
-
     monkeypatch.setattr(alignment.subprocess, "run", fake_run)
     monkeypatch.setattr(alignment.whisperx, "load_align_model", fake_load_align_model)
     monkeypatch.setattr(alignment.whisperx, "align", fake_align)
-    monkeypatch.setattr(alignment.wave, "open", fake_wave_open)
     monkeypatch.setenv("VIDEOCUT_SKIP_FFMPEG_CHECK", "1")
 
     transcript = tmp_path / "t.txt"
@@ -48,20 +34,20 @@ def test_align_with_transcript(tmp_path, monkeypatch):
     assert calls["ffmpeg"]
     assert calls["load_align_model"]
     assert calls["align"]
-    assert calls["wave"]
+    assert calls["audio"] == (16000, 1.0)  # decoded in memory, no temp WAV
     assert json.loads(out_json.read_text()) == [{"text": "hi", "start": 0.0, "end": 1.0}]
 
 
 def test_align_with_pdf_transcript(tmp_path, monkeypatch):
-    calls = {"ffmpeg": [], "load_align_model": False, "align": False, "wave": False, "parse": False}
+    calls = {"ffmpeg": [], "load_align_model": False, "align": False, "parse": False}
 
     def fake_parse_pdf(path):
         calls["parse"] = True
         return ["SPEAKER: hello"]
 
-    def fake_run(cmd, check):
+    def fake_run(cmd, check, stdout):
         calls["ffmpeg"].append(cmd)
-        pathlib.Path(cmd[-1]).write_bytes(b"")
+        return SimpleNamespace(stdout=b"\x00\x00" * 16000)  # 1 s of silence
 
     def fake_load_align_model(lang, device):
         calls["load_align_model"] = True
@@ -69,26 +55,13 @@ def test_align_with_pdf_transcript(tmp_path, monkeypatch):
 
     def fake_align(segs, am, meta, audio, device):
         calls["align"] = True
+        calls["audio"] = (len(audio), segs[0]["end"])
         return {"word_segments": [{"text": "hi", "start": 0.0, "end": 1.0}]}
 
-    class FakeWave:
-        def getnframes(self):
-            return 16000
-
-        def getframerate(self):
-            return 16000
-
-        def close(self):
-            calls["wave"] = True
-
-    def fake_wave_open(*args, **kwargs):
-        return FakeWave()
-
     monkeypatch.setattr(alignment.parse_pdf_text, "parse_pdf", fake_parse_pdf)
     monkeypatch.setattr(alignment.subprocess, "run", fake_run)
     monkeypatch.setattr(alignment.whisperx, "load_align_model", fake_load_align_model)
     monkeypatch.setattr(alignment.whisperx, "align", fake_align)
-    monkeypatch.setattr(alignment.wave, "open", fake_wave_open)
     monkeypatch.setenv("VIDEOCUT_SKIP_FFMPEG_CHECK", "1")
 
     transcript = tmp_path / "t.pdf"
@@ -101,5 +74,18 @@ def test_align_with_pdf_transcript(tmp_path, monkeypatch):
     assert calls["ffmpeg"]
     assert calls["load_align_model"]
     assert calls["align"]
-    assert calls["wave"]
+    assert calls["audio"] == (16000, 1.0)  # decoded in memory, no temp WAV
     assert json.loads(out_json.read_text()) == [{"text": "hi", "start": 0.0, "end": 1.0}]
+
+
+def test_align_model_loaded_once_per_device():
+    loads = []
+
+    def loader(lang, device):
+        loads.append(device)
+        return SimpleNamespace(), {}
+
+    first = alignment._load_align(loader, "en", "cpu")
+    assert alignment._load_align(loader, "en", "cpu") is first
+    alignment._load_align(loader, "en", "cuda")
+    assert loads == ["cpu", "cuda"]
@@ -0,0 +1,39 @@
+import json
+
+from videocut.core import annotation
+
+
+def test_annotate_places_markers():
+    lines = ["[0.0-5.0] a", "note", "[5.0-10.0] b", "[10.0-15.0] c", "[15.0-20.0] d"]
+    out = annotation.annotate(lines, [{"start": 2, "end": 7}, {"start": 30, "end": 31}])
+    assert out == [
+        "{START} [2.000–7.000]", "[0.0-5.0] a", "note", "[5.0-10.0] b",
+        "{END}   [2.000–7.000]", "[10.0-15.0] c", "[15.0-20.0] d",
+        "{START} [30.000–31.000]", "{END}   [30.000–31.000]",
+    ]
+    assert annotation.annotate(lines, [{"start": 1, "end": 2}])[3:] == lines[1:]
+    assert annotation.annotate(iter(lines), []) == lines
+
+
+def test_annotate_segments_streams_markup(tmp_path):
+    markup = tmp_path / "markup_guide.txt"
+    markup.write_text("[0.0-5.0] a\n[5.0-10.0] b\n")
+    segs = tmp_path / "keep.json"
+    segs.write_text(json.dumps([{"start": 1, "end": 6}]))
+    out = tmp_path / "annotated.txt"
+
+    annotation.annotate_segments(str(markup), str(segs), str(out))
+
+    assert out.read_text().splitlines() == [
+        "{START} [1.000–6.000]", "[0.0-5.0] a", "[5.0-10.0] b", "{END}   [1.000–6.000]",
+    ]
+
+
+def test_load_markup_returns_a_list(tmp_path):
+    markup = tmp_path / "markup_guide.txt"
+    markup.write_text("[0.0-5.0] a\n[5.0-10.0] b\n")
+
+    lines = annotation.load_markup(markup)
+
+    assert lines == ["[0.0-5.0] a", "[5.0-10.0] b"]
+    assert len(lines) == 2 and list(lines) == lines  # indexable, re-iterable
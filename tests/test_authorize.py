@@ -0,0 +1,28 @@
+import json
+
+from videocut.commands import authorize
+
+
+def test_run_authorization_refreshes_saved_token(tmp_path, monkeypatch):
+    creds_file = tmp_path / "credentials.json"
+    creds_file.write_text(json.dumps({
+        "token": "old",
+        "refresh_token": "r",
+        "client_id": "c",
+        "client_secret": "s",
+        "expiry": "2000-01-01T00:00:00Z",
+    }))
+
+    def fake_refresh(self, request):
+        self.token = "new"
+        self.expiry = None
+
+    def no_browser(*args, **kwargs):
+        raise AssertionError("browser flow should not run")
+
+    monkeypatch.setattr(authorize.Credentials, "refresh", fake_refresh)
+    monkeypatch.setattr(authorize.InstalledAppFlow, "from_client_secrets_file", no_browser)
+
+    authorize.run_authorization(str(tmp_path / "client_secret.json"), str(creds_file))
+
+    assert json.loads(creds_file.read_text())["token"] == "new"
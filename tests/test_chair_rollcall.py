@@ -146,3 +146,18 @@ def test_identify_chair_weighted(tmp_path):
     # motion phrase has higher weight than moving on
     assert chair.identify_chair(str(diarized)) == "B"
 
+
+
+def test_identify_chair_and_roll_call(tmp_path):
+    diarized = sample_roll_call(tmp_path)
+    data = json.loads(diarized.read_text())
+    assert chair.identify_chair_and_roll_call(data) == ("A", {"Doe": "B", "Roe": "C"})
+
+
+def test_identify_chair_sums_each_phrase_once():
+    data = {"segments": [
+        # moving on + chair's report + any other comments = 4, twice "moving on" still 1
+        {"speaker": "A", "text": "Moving on, moving on. Chair's report. Any other comments?"},
+        {"speaker": "B", "text": "Do I have a motion?"},
+    ]}
+    assert chair.identify_chair(data) == "A"
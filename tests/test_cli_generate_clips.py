@@ -36,7 +36,7 @@ def test_clip_cli(tmp_path, monkeypatch):
 
     called = {}
 
-    def fake_clip(video, segs, out_dir, srt_file=None):
+    def fake_clip(video, segs, out_dir, srt_file=None, jobs=None, reencode=None):
         called["args"] = (video, segs, out_dir, srt_file)
 
     monkeypatch.setattr(video_editing, "clip_segments", fake_clip)
@@ -46,3 +46,51 @@ def test_clip_cli(tmp_path, monkeypatch):
 
     assert called["args"][0] == "input.mp4"
     assert called["args"][1] == str(seg_json)
+
+
+def test_prep_segments_reuses_cached_alignment(tmp_path, monkeypatch):
+    import videocut.core.transcription as transcription
+    import videocut.core.pdf_utils as pdf_utils
+    import videocut.core.dtw_align as dtw_align
+    import videocut.core.label_fix as label_fix
+    import videocut.segmenter as segmenter
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pdf_transcript.txt").write_text("CHAIR: hello\n")
+    (tmp_path / "input.srt").write_text("1\n00:00:00,000 --> 00:00:01,000\nhello\n")
+
+    calls = []
+
+    def fake_align(pdf_txt, srt_path, band):
+        calls.append(band)
+        return [{"text": "CHAIR: hello", "start": 0.0, "end": 1.0}]
+
+    monkeypatch.setattr(transcription, "transcribe", lambda video: None)
+    monkeypatch.setattr(pdf_utils, "export_pdf_transcript", lambda pdf: None)
+    monkeypatch.setattr(dtw_align, "align_pdf_to_srt", fake_align)
+    monkeypatch.setattr(label_fix, "labelify", lambda src, dst, valid_labels: pathlib.Path(dst).write_text("labeled\n"))
+    monkeypatch.setattr(label_fix, "validate_txt_labels", lambda txt, labels: None)
+    monkeypatch.setattr(segmenter, "load_rows", lambda path: [])
+    monkeypatch.setattr(segmenter, "build_segments", lambda rows, debug=False: [])
+
+    for _ in range(2):
+        videocut_cli.prep_segments(pathlib.Path("input.mp4"), pathlib.Path("transcript.pdf"), 10)
+
+    assert calls == [10]
+    assert (tmp_path / "dtw-transcript.txt").read_text() == "labeled\n"
+
+    videocut_cli.prep_segments(pathlib.Path("input.mp4"), pathlib.Path("transcript.pdf"), 5)
+    assert calls == [10, 5]
+
+
+def test_find_single(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "meeting.mp4").write_text("x")
+    (tmp_path / "notes.pdf").write_text("x")
+    (tmp_path / "dir.pdf").mkdir()
+
+    assert videocut_cli._find_single("*.mp4") == pathlib.Path("meeting.mp4")
+    assert videocut_cli._find_single("*.pdf") == pathlib.Path("notes.pdf")
+
+    (tmp_path / "other.mp4").write_text("x")
+    assert videocut_cli._find_single("*.mp4") is None
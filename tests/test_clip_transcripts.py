@@ -0,0 +1,23 @@
+import json
+
+from videocut.core import clip_transcripts
+
+
+def test_clip_transcripts_overlapping_entries(tmp_path):
+    markup = tmp_path / "markup_guide.txt"
+    markup.write_text("\n".join([
+        "[0.0-50.0] Chair: a long opening statement that spans the first clip",
+        "[1.0-2.0] Doe: short aside",
+        "[10.0-12.0] Doe: one two three four five six seven eight",
+        "[30.0-31.0] Roe: outside every clip",
+    ]))
+    segs = tmp_path / "keep.json"
+    segs.write_text(json.dumps([{"start": 9.0, "end": 13.0}, {"start": 40.0, "end": 45.0}]))
+    out = tmp_path / "clips.txt"
+
+    clip_transcripts.clip_transcripts(str(markup), str(segs), str(out))
+
+    text = out.read_text()
+    assert "=== Clip 1 ===\nStart: 9.00" in text
+    assert "short aside" not in text and "outside every clip" not in text
+    assert "Start: 40.00" in text  # reached only through the long opening entry
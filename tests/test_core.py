@@ -17,7 +17,7 @@ def test_transcribe_creates_markup(tmp_path, monkeypatch):
 
     calls = {}
 
-    def fake_run(cmd, check, env=None):
+    def fake_run(cmd, check, env=None, stdout=None):
         calls["cmd"] = cmd
         json_out.write_text(json.dumps({"segments": [{"start": 0, "end": 1, "text": "hi"}]}))
         return SimpleNamespace(returncode=0)
@@ -38,7 +38,7 @@ def test_transcribe_with_pdf(tmp_path, monkeypatch):
     json_out = tmp_path / "input.json"
     srt_out = tmp_path / "input.srt"
 
-    def fake_run(cmd, check, env=None):
+    def fake_run(cmd, check, env=None, stdout=None):
         json_out.write_text(json.dumps({"segments": [{"start": 0, "end": 1, "text": "hi"}]}))
         srt_out.write_text("1\n00:00:00,000 --> 00:00:01,000\nHi\n")
         return SimpleNamespace(returncode=0)
@@ -61,7 +61,7 @@ def test_generate_and_align_invokes_ffmpeg(tmp_path, monkeypatch):
 
     calls = {"run": [], "build": [], "align": []}
 
-    def fake_run(cmd, check, env=None):
+    def fake_run(cmd, check, env=None, stdout=None):
         calls["run"].append(cmd)
         Path(cmd[-1]).write_text("tmp")
 
@@ -93,7 +93,7 @@ def test_generate_and_align_segments_txt(tmp_path, monkeypatch):
 
     calls = {"run": [], "build": [], "align": []}
 
-    def fake_run(cmd, check, env=None):
+    def fake_run(cmd, check, env=None, stdout=None):
         calls["run"].append(cmd)
         Path(cmd[-1]).write_text("tmp")
 
@@ -127,7 +127,7 @@ def test_clip_segments(tmp_path, monkeypatch):
 
     calls = {"run": [], "build": []}
 
-    def fake_run(cmd, check, env=None):
+    def fake_run(cmd, check, env=None, stdout=None):
         calls["run"].append(cmd)
         Path(cmd[-1]).write_text("tmp")
 
@@ -144,3 +144,303 @@ def test_clip_segments(tmp_path, monkeypatch):
     assert calls["run"]
     assert calls["build"]
     assert (tmp_path / "clips" / "clip_000.mp4").exists()
+
+
+def test_whispercpp_backend_uses_quantized_model(tmp_path, monkeypatch):
+    cmds = []
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(transcribe_mod, "_ensure_model", lambda model: None)
+    monkeypatch.setattr(transcribe_mod, "_run", lambda cmd, stdin, stdout: cmds.append((cmd, stdin)))
+
+    class FakeFfmpeg:
+        def __init__(self, cmd, stdout):
+            self.cmd, self.stdout = cmd, SimpleNamespace(close=lambda: None)
+
+        def wait(self):
+            return 0
+
+    monkeypatch.setattr(transcribe_mod.subprocess, "Popen", FakeFfmpeg)
+
+    transcribe_mod.transcribe("input.mp4", backend="whispercpp")
+    transcribe_mod.transcribe("input.mp4", backend="whispercpp", quant="fp16", flash_attn=True)
+
+    (first, audio), (second, _) = cmds
+    assert Path(first[first.index("-m") + 1]).name == "ggml-small.en-q5_1.bin"
+    assert Path(second[second.index("-m") + 1]).name == "ggml-small.en.bin"
+    assert "-fa" not in first and "-fa" in second  # only on request
+    assert int(first[first.index("-t") + 1]) >= 1
+    assert first[first.index("-f") + 1] == "-" and audio is not None  # streamed, no WAV
+    assert not list(tmp_path.glob("*.wav"))
+
+
+def test_whispercpp_failure_wins_over_ffmpeg_status(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(transcribe_mod, "_ensure_model", lambda model: None)
+
+    def failing_run(cmd, stdin, stdout):
+        raise SystemExit(3)
+
+    class BrokenPipeFfmpeg:  # exits non-zero once its reader goes away
+        def __init__(self, cmd, stdout):
+            self.stdout = SimpleNamespace(close=lambda: None)
+            self.returncode = None
+
+        def wait(self):
+            self.returncode = 1
+            return 1
+
+    monkeypatch.setattr(transcribe_mod, "_run", failing_run)
+    monkeypatch.setattr(transcribe_mod.subprocess, "Popen", BrokenPipeFfmpeg)
+
+    with pytest.raises(SystemExit) as exc:
+        transcribe_mod.transcribe("input.mp4", backend="whispercpp")
+    assert exc.value.code == 3
+
+
+def test_generate_clips_from_segments_parallel(tmp_path, monkeypatch):
+    cmds = []
+
+    def fake_run(cmd, check, env=None, stdout=None):
+        cmds.append(cmd)
+        for arg in cmd:
+            if arg.endswith(".mp4") and arg != "vid.mp4":
+                Path(arg).write_text("tmp")
+
+    monkeypatch.setattr(video_editing, "_keyframe_times", lambda video: [0.0, 1.0, 2.0, 3.0])
+    monkeypatch.setattr(video_editing.subprocess, "run", fake_run)
+    monkeypatch.setattr(video_editing, "_build_faded_clip", lambda src, dst: dst.write_text("done"))
+
+    segs = [{"start": i, "end": i + 1} for i in range(4)]
+    video_editing.generate_clips_from_segments("vid.mp4", segs, str(tmp_path / "clips"), jobs=3)
+
+    clips = sorted(p.name for p in (tmp_path / "clips").glob("clip_*.mp4"))
+    assert clips == [f"clip_{i:03d}.mp4" for i in range(4)]
+    assert not list((tmp_path / "clips").glob("tmp_*.mp4"))
+    assert len(cmds) == 1  # stream-copied clips share one ffmpeg run
+    cmd = cmds[0]
+    assert cmd.count("-i") == 4 and cmd.count("-ss") == 4
+    assert cmd.index("-ss") < cmd.index("-i") < cmd.index("-map")  # input-side seeks
+    assert cmd[cmd.index("-map") + 1] == "0:v:0" and "3:v:0" in cmd
+
+
+def test_generate_clips_reencodes_when_keyframes_unknown(tmp_path, monkeypatch):
+    cmds = []
+
+    def fake_run(cmd, check, env=None, stdout=None):
+        cmds.append(cmd)
+        Path(cmd[-1]).write_text("tmp")
+
+    monkeypatch.setattr(video_editing, "_keyframe_times", lambda video: None)
+    monkeypatch.setattr(video_editing.subprocess, "run", fake_run)
+    monkeypatch.setattr(video_editing, "_build_faded_clip", lambda src, dst: dst.write_text("done"))
+
+    segs = [{"start": 0.0, "end": 1.0}, {"start": 2.0, "end": 3.0}]
+    video_editing.generate_clips_from_segments("vid.mp4", segs, str(tmp_path / "clips"), jobs=1)
+
+    assert len(cmds) == 2
+    assert all("libx264" in cmd and "copy" not in cmd for cmd in cmds)
+
+
+def test_generate_clips_reencodes_only_off_keyframe(tmp_path, monkeypatch):
+    cmds = []
+
+    def fake_run(cmd, check, env=None, stdout=None):
+        cmds.append(cmd)
+        Path(cmd[-1]).write_text("tmp")
+
+    monkeypatch.setattr(video_editing, "_keyframe_times", lambda video: [0.0, 2.0, 4.0])
+    monkeypatch.setattr(video_editing.subprocess, "run", fake_run)
+    monkeypatch.setattr(video_editing, "_build_faded_clip", lambda src, dst: dst.write_text("done"))
+
+    segs = [{"start": 2.0, "end": 3.0}, {"start": 2.5, "end": 3.5}]
+    video_editing.generate_clips_from_segments("vid.mp4", segs, str(tmp_path / "clips"), jobs=1)
+
+    assert cmds[0].index("-ss") < cmds[0].index("-i")
+    assert cmds[0][cmds[0].index("-t") + 1] == "1.0"
+    assert "copy" in cmds[0]
+    assert "libx264" in cmds[1] and "copy" not in cmds[1]
+
+
+def test_concatenate_clips_stream_copy(tmp_path, monkeypatch):
+    clips = tmp_path / "clips"
+    clips.mkdir()
+    for i in range(2):
+        (clips / f"clip_{i:03d}.mp4").write_text("x")
+    (clips / "tmp_002.mp4").write_text("x")
+    (clips / "timestamps.json").write_text("{}")
+
+    probe = json.dumps({"streams": [
+        {"codec_type": "video", "codec_name": "h264", "width": 1280, "height": 720,
+         "pix_fmt": "yuv420p", "r_frame_rate": "30/1", "time_base": "1/15360"},
+        {"codec_type": "audio", "codec_name": "aac", "sample_rate": "48000", "channels": 2,
+         "time_base": "1/48000"},
+    ]})
+    cmds = []
+
+    def fake_run(cmd, check):
+        cmds.append(cmd)
+        if "concat" in cmd:
+            listing = Path(cmd[cmd.index("-i") + 1]).read_text().splitlines()
+            assert len(listing) == 3 and "flash.mp4" in listing[1]
+
+    monkeypatch.setattr(video_editing.subprocess, "check_output", lambda *a, **k: probe)
+    monkeypatch.setattr(video_editing.subprocess, "run", fake_run)
+
+    video_editing.concatenate_clips(str(clips), str(tmp_path / "out.mp4"))
+
+    assert len(cmds) == 2
+    assert cmds[0][cmds[0].index("-video_track_timescale") + 1] == "15360"
+    assert cmds[-1][-3:] == ["-c", "copy", str(tmp_path / "out.mp4")]
+    assert not any("-filter_complex" in c for c in cmds)
+
+
+@pytest.mark.parametrize("clip_codec, flash_profile, encodes", [
+    ("hevc", "High", 0),  # the flash cannot be HEVC, so it is never encoded
+    ("h264", "Main", 1),  # the encoded flash came out in another profile
+])
+def test_concatenate_clips_reencodes_when_flash_cannot_match(
+    tmp_path, monkeypatch, clip_codec, flash_profile, encodes
+):
+    clips = tmp_path / "clips"
+    clips.mkdir()
+    for i in range(2):
+        (clips / f"clip_{i:03d}.mp4").write_text("x")
+
+    def probe(codec, profile):
+        return json.dumps({"streams": [
+            {"codec_type": "video", "codec_name": codec, "profile": profile, "width": 1280,
+             "height": 720, "pix_fmt": "yuv420p", "r_frame_rate": "30/1", "time_base": "1/15360"},
+        ]})
+
+    def fake_check_output(cmd, text):
+        if "csv=p=0" in cmd:
+            return "1280,720"
+        if cmd[-1].endswith("flash.mp4"):
+            return probe("h264", flash_profile)
+        return probe(clip_codec, "High")
+
+    cmds = []
+    monkeypatch.setattr(video_editing.subprocess, "check_output", fake_check_output)
+    monkeypatch.setattr(video_editing.subprocess, "run", lambda cmd, check: cmds.append(cmd))
+
+    video_editing.concatenate_clips(str(clips), str(tmp_path / "out.mp4"))
+
+    assert len(cmds) == encodes + 1
+    assert "-filter_complex" in cmds[-1]
+    assert not any("copy" in c for c in cmds)
+    if encodes:
+        assert cmds[0][cmds[0].index("-profile:v") + 1] == "high"
+
+
+def test_concatenate_single_clip_skips_flash(tmp_path, monkeypatch):
+    clips = tmp_path / "clips"
+    clips.mkdir()
+    (clips / "clip_000.mp4").write_text("x")
+    probe = json.dumps({"streams": [
+        {"codec_type": "video", "codec_name": "h264", "width": 1280, "height": 720},
+    ]})
+    cmds = []
+    monkeypatch.setattr(video_editing.subprocess, "check_output", lambda *a, **k: probe)
+    monkeypatch.setattr(video_editing.subprocess, "run", lambda cmd, check: cmds.append(cmd))
+
+    video_editing.concatenate_clips(str(clips), str(tmp_path / "out.mp4"))
+
+    assert len(cmds) == 1
+    assert cmds[0][cmds[0].index("-f") + 1] == "concat"
+
+
+@pytest.mark.parametrize("audio", [True, False])
+def test_render_segments_single_pass(tmp_path, monkeypatch, audio):
+    cmds = []
+    monkeypatch.setattr(video_editing.subprocess, "check_output", lambda cmd, text: "1\n" if audio else "")
+    monkeypatch.setattr(video_editing.subprocess, "run", lambda cmd, check: cmds.append(cmd))
+
+    video_editing.render_segments(
+        "vid.mp4", [{"start": 1, "end": 3}, {"start": 5, "end": 6.5}], str(tmp_path / "out.mp4")
+    )
+
+    assert len(cmds) == 1
+    cmd = cmds[0]
+    assert cmd.count("-i") == 2  # each segment seeked on its own input
+    assert cmd[cmd.index("-ss") + 1] == "1"
+    assert cmd[cmd.index("-t") + 1] == "2.0"
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert "split" not in graph
+    assert "concat=n=3:v=1:a=1" in graph
+    assert graph.count("color=c=0xfafafa") == 1
+    assert ("[1:a]" in graph) is audio
+    assert graph.count("anullsrc") == (1 if audio else 3)
+
+
+def _fake_whisperx(loads):
+    class FakeModel:
+        def transcribe(self, audio, print_progress):
+            return {"segments": [{"start": 0, "end": 1, "text": "hi"}], "language": "en"}
+
+    def fake_writer(result, audio_path, args):
+        Path(f"{Path(audio_path).stem}.json").write_text(json.dumps(result))
+
+    whisperx = SimpleNamespace(
+        load_model=lambda name, device, compute_type: loads.append(name) or FakeModel(),
+        load_audio=lambda path: "audio",
+        load_align_model=lambda lang, device: loads.append(f"align-{lang}") or (None, {}),
+        align=lambda segs, model, meta, audio, device, print_progress: {"segments": segs},
+    )
+    return whisperx, SimpleNamespace(get_writer=lambda fmt, out_dir: fake_writer)
+
+
+def test_transcribe_inprocess_reuses_model(tmp_path, monkeypatch):
+    loads = []
+    fake_whisperx, fake_utils = _fake_whisperx(loads)
+    fake_torch = SimpleNamespace(cuda=SimpleNamespace(is_available=lambda: False))
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(sys.modules, "whisperx", fake_whisperx)
+    monkeypatch.setitem(sys.modules, "whisperx.utils", fake_utils)
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+    monkeypatch.setattr(transcribe_mod, "_MODEL_CACHE", {})
+    monkeypatch.setattr(transcribe_mod, "_ALIGN_CACHE", {})
+    monkeypatch.setattr(transcribe_mod, "is_apple_silicon", lambda: False)
+    monkeypatch.setattr(transcribe_mod.subprocess, "run", lambda *a, **k: pytest.fail("CLI spawned"))
+
+    transcribe_mod.transcribe("input.mp4", inprocess=True)
+    transcribe_mod.transcribe("input.mp4", inprocess=True)
+
+    assert loads == ["small", "align-en"]
+    assert Path("markup_guide.txt").read_text().strip() == "[0-1] SPEAKER: hi"
+
+
+def test_transcribe_inprocess_falls_back_to_cli(tmp_path, monkeypatch):
+    fake_whisperx, _ = _fake_whisperx([])
+    del fake_whisperx.load_audio  # API drift in an installed whisperx
+    fake_torch = SimpleNamespace(cuda=SimpleNamespace(is_available=lambda: False))
+    cmds = []
+
+    def fake_run(cmd, check, env=None, stdout=None):
+        cmds.append(cmd)
+        Path("input.json").write_text(json.dumps({"segments": [{"start": 0, "end": 1, "text": "hi"}]}))
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(sys.modules, "whisperx", fake_whisperx)
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+    monkeypatch.setattr(transcribe_mod, "_MODEL_CACHE", {})
+    monkeypatch.setattr(transcribe_mod, "is_apple_silicon", lambda: False)
+    monkeypatch.setattr(transcribe_mod.subprocess, "run", fake_run)
+
+    transcribe_mod.transcribe("input.mp4", inprocess=True)
+    transcribe_mod.transcribe("input.mp4")  # opt-in only: never imports whisperx
+
+    assert [c[0] for c in cmds] == ["whisperx", "whisperx"]
+
+
+def test_load_json_reuses_parse_until_file_changes(tmp_path):
+    from videocut.core import _jsoncache
+
+    path = tmp_path / "dia.json"
+    path.write_text(json.dumps({"segments": [1]}))
+    first = _jsoncache.load_json(path)
+    assert _jsoncache.load_json(str(path)) is first
+
+    path.write_text(json.dumps({"segments": [1, 2]}))
+    assert _jsoncache.load_json(path) == {"segments": [1, 2]}
+    assert _jsoncache.read_json(path) is not _jsoncache.load_json(path)
@@ -0,0 +1,88 @@
+from videocut.core.dtw_align import _banded_dtw, align_pdf_to_srt
+
+
+def test_banded_dtw_skips_inserted_tokens():
+    src = "call the meeting to order".split()
+    ref = "um call the uh meeting to order".split()
+    path = _banded_dtw(src, ref, band=2)
+    matched = {i: j for i, j in path if src[i] == ref[j]}
+    assert matched == {0: 1, 1: 2, 2: 4, 3: 5, 4: 6}
+    assert path[0] == (0, 0) and path[-1] == (4, 6)
+
+
+def test_banded_dtw_unequal_lengths_beyond_band():
+    src = "call the meeting to order".split()
+    filler = [f"w{k}" for k in range(30)]
+    for ref, offset in ((filler + src, 30), (src + filler, 0)):
+        path = _banded_dtw(src, ref, band=2)
+        matched = {i: j for i, j in path if src[i] == ref[j]}
+        assert matched == {i: i + offset for i in range(len(src))}
+        path = _banded_dtw(ref, src, band=2)
+        assert {j: i for i, j in path if ref[i] == src[j]} == matched
+
+
+def test_banded_dtw_large_length_mismatch_stays_small():
+    import time
+    import tracemalloc
+
+    src = [f"p{k}" for k in range(2000)]
+    ref = src[:1000] + [f"c{k}" for k in range(6000)] + src[1000:]  # omitted public comment
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    path = _banded_dtw(src, ref, band=100)
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    matched = {i: j for i, j in path if src[i] == ref[j]}
+    assert matched == {i: i if i < 1000 else i + 6000 for i in range(len(src))}
+    # a table as wide as the 6000-token mismatch would need ~100 MB
+    assert peak < 20 * 2**20
+    assert elapsed < 10
+
+
+def test_align_pdf_to_srt_line_times(tmp_path):
+    pdf = tmp_path / "pdf.txt"
+    pdf.write_text("Call to order.\n\nRoll call please.\n")
+    srt = tmp_path / "in.srt"
+    srt.write_text(
+        "1\n00:00:01,000 --> 00:00:04,000\ncall to order\n\n"
+        "2\n00:00:05,000 --> 00:00:08,000\nroll call please\n"
+    )
+    out = align_pdf_to_srt(pdf, srt, band=2)
+    assert [r["text"] for r in out] == ["Call to order.", "", "Roll call please."]
+    assert out[0]["start"] == 1.0
+    assert out[2]["start"] == 5.0
+    assert out[1]["start"] == out[0]["end"]
+
+
+def test_fill_band_kernels_agree():
+    import random
+    import numpy as np
+    from videocut.core import dtw_align
+
+    rng = random.Random(3)
+    for _ in range(50):
+        m, n = rng.randint(1, 30), rng.randint(1, 30)
+        src = np.array([rng.randint(0, 3) for _ in range(m)])
+        ref = np.array([rng.randint(0, 3) for _ in range(n)])
+        los, his = dtw_align._corridor(src, ref, rng.randint(0, 6))
+        offs = np.concatenate([[0], np.cumsum(his - los + 1)])
+        args = (src, ref, los, his, offs)
+        fast = dtw_align._fill_band_numpy(*args)
+        assert fast.dtype == np.float32
+        assert np.array_equal(fast, dtw_align._fill_band_loops(*args))
+
+
+def test_align_pdf_to_srt_accepts_bytes_and_crlf(tmp_path):
+    pdf = tmp_path / "pdf.txt"
+    pdf.write_text("Call to order.\nRoll call please.\n")
+    srt = tmp_path / "in.srt"
+    srt.write_bytes(
+        b"1\r\n00:00:01,000 --> 00:00:04,000\r\ncall to order\r\n\r\n"
+        b"2\r\n00:00:05,000 --> 00:00:08,000\r\nroll call please\r\n"
+    )
+    from_path = align_pdf_to_srt(pdf, srt, band=2)
+    from_bytes = align_pdf_to_srt(pdf.read_bytes(), memoryview(srt.read_bytes()), band=2)
+    assert from_path == from_bytes
+    assert [r["start"] for r in from_path] == [1.0, 5.0]
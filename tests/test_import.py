@@ -1,5 +1,7 @@
 import importlib
 
+import pytest
+
 def test_lightweight_import():
     try:
         import videocut
@@ -7,3 +9,108 @@ def test_lightweight_import():
     except ModuleNotFoundError as e:
         assert False, f"Import failed with missing module: {e}"
 
+
+_CLI_HELP = (
+    "from typer.testing import CliRunner\n"
+    "from videocut.cli import app\n"
+    "r = CliRunner()\n"
+    "assert r.invoke(app, ['--help']).exit_code == 0\n"
+    "assert r.invoke(app, ['json-to-tsv', '--help']).exit_code == 0\n"
+    "assert r.invoke(app, ['--version']).output.startswith('videocut')\n"
+)
+_HEAVY = ("numpy", "torch", "whisperx", "pdfplumber", "pdfminer", "librosa", "rapidfuzz", "pandas")
+
+
+@pytest.mark.parametrize(
+    "entry, forbidden",
+    [
+        ("import videocut.cli\n", ("videocut.core",)),
+        (_CLI_HELP, ("videocut.core",)),
+        ("import videocut.cli\n", _HEAVY),
+        (
+            "from videocut.core import alignment, nicholson, segmentation, video_editing\n",
+            ("whisperx", "torch", "pdfminer", "rapidfuzz"),
+        ),
+    ],
+    ids=["cli-core", "cli-help-core", "cli-heavy", "core-heavy"],
+)
+def test_entry_point_defers_imports(entry, forbidden):
+    """Loading *entry* in a fresh interpreter pulls in none of *forbidden*."""
+    import subprocess, sys
+
+    code = (
+        "import sys\n"
+        + entry
+        + f"print(sorted(m for m in sys.modules for f in {forbidden!r} "
+        "if m == f or m.startswith(f + '.')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
+
+
+def test_cli_commands_registered_once():
+    from videocut.cli import app
+
+    names = [
+        c.name or c.callback.__name__.replace("_", "-") for c in app.registered_commands
+    ]
+    assert len(names) == len(set(names))
+
+
+def test_cli_quiet_suppresses_progress(tmp_path):
+    import sys
+    from typer.testing import CliRunner
+    from videocut.cli import app
+
+    srt = tmp_path / "marked.srt"
+    srt.write_text("1\n00:00:01,000 --> 00:00:02,000\n=START-1=\nhi\n=END-1=\n")
+    out = tmp_path / "segs.json"
+    stdout = sys.stdout
+
+    result = CliRunner().invoke(app, ["--quiet", "srt-to-segments", str(srt), "--out", str(out)])
+
+    assert result.exit_code == 0
+    assert result.output == ""
+    assert out.exists()
+    assert sys.stdout is stdout
+
+    # JSON written to "-" is data, not progress, and still reaches stdout
+    segs = '[{"text": ["one two three four"]}, {"text": ["hi"]}]'
+    result = CliRunner().invoke(app, ["--quiet", "prune-segments-cmd", "--seg-json", "-", "--out", "-"], input=segs)
+    assert result.exit_code == 0
+    assert result.stdout.strip().startswith("[")
+    assert "one two three four" in result.stdout and "hi" not in result.stdout
+
+
+def test_quiet_output_silences_tools():
+    import subprocess
+    from videocut.core import _jsoncache
+
+    assert _jsoncache.tool_stdout() is None
+    with _jsoncache.quiet_output():
+        print("dropped")
+        assert _jsoncache.tool_stdout() is subprocess.DEVNULL
+    assert _jsoncache.tool_stdout() is None
+
+
+def test_core_lazy_names_cover_every_module():
+    import pathlib
+    import videocut.core as core
+
+    modules = {
+        p.stem for p in pathlib.Path(core.__file__).parent.glob("*.py") if not p.stem.startswith("_")
+    }
+    assert modules == set(core.__all__)
+
+
+def test_temp_json_is_closed_and_removed(tmp_path):
+    import pytest
+    from pathlib import Path
+    from videocut import cli
+
+    with pytest.raises(RuntimeError):
+        with cli._temp_json(tmp_path / "out.txt") as name:
+            Path(name).write_text("{}")  # reopened by path, as the steps do
+            assert Path(name).parent == tmp_path
+            raise RuntimeError
+    assert list(tmp_path.iterdir()) == []
@@ -25,3 +25,66 @@ def test_apply_pdf_transcript_truncates(tmp_path, monkeypatch):
     assert result["segments"][0]["text"] == "l1"
     assert result["segments"][1]["label"] == "Y"
     assert result["segments"][1]["text"] == "l2"
+
+
+def test_json_to_transcript_merges_pdf_in_memory(tmp_path, monkeypatch):
+    import importlib.util, sys
+
+    cli_path = Path(__file__).resolve().parents[1] / "videocut" / "cli.py"
+    spec = importlib.util.spec_from_file_location("videocut.cli", cli_path)
+    cli = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = cli
+    spec.loader.exec_module(cli)
+
+    json_file = tmp_path / "dia.json"
+    json_file.write_text(json.dumps({"segments": [
+        {"start": 0, "end": 1.5, "label": "A", "text": "foo"},
+        {"start": 1.5, "end": 3, "label": "B", "text": "bar"},
+    ]}))
+    monkeypatch.setattr(pdf_utils, "extract_transcript_dialogue", lambda p: [("X", "l1"), ("Y", "l2")])
+
+    out = tmp_path / "transcript.txt"
+    cli.json_to_transcript(str(json_file), pdf="t.pdf", out=str(out))
+
+    assert out.read_text() == "[0.00-1.50] X: l1\n[1.50-3.00] Y: l2\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dia.json", "transcript.txt"]
+
+
+def test_match_pdf_json_long_line_keeps_common_words(tmp_path, monkeypatch):
+    # ASR misheard every content word; only the frequent "the" can anchor
+    pdf_words, spoken = [], []
+    for i in range(80):
+        pdf_words += ["the", f"p{i}"]
+        spoken += ["the", f"w{i}"]
+    spoken += [f"x{i}" for i in range(60)]  # window > 200 words
+    diar = tmp_path / "dia.json"
+    diar.write_text(json.dumps({"segments": [{"words": [
+        {"word": w, "start": float(i), "end": i + 0.5} for i, w in enumerate(spoken)
+    ]}]}))
+    monkeypatch.setattr(pdf_utils, "export_pdf_transcript", lambda p: [
+        {"text": " ".join(pdf_words), "words": list(pdf_words)}
+    ])
+
+    out = tmp_path / "matched.json"
+    pdf_utils.match_pdf_json("t.pdf", str(diar), str(out))
+
+    matched = json.loads(out.read_text())[0]
+    assert (matched["start"], matched["end"]) == (0.0, 158.5)
+    assert all(w["start"] is not None for w in matched["words"] if w["word"] == "the")
+
+
+def test_find_timing_anomalies(tmp_path):
+    json_file = tmp_path / "dia.json"
+    json_file.write_text(json.dumps({"segments": [
+        {"start": 0, "end": 2, "text": "one two three"},
+        {"start": 2, "end": 3, "text": " ".join(["w"] * 9)},
+        {"start": 3, "end": 3, "text": "zero"},
+        {"start": 3, "end": 13, "text": "slow"},
+    ]}))
+
+    bad = pdf_utils.find_timing_anomalies(str(json_file), 0.5, 5.0)
+
+    assert [b["index"] for b in bad] == [1, 2, 3]
+    assert bad[0]["wps"] == 9.0
+    assert bad[1]["wps"] == float("inf")
+    assert bad[2] == {"index": 3, "start": 3.0, "end": 13.0, "wps": 0.1, "text": "slow"}
@@ -1,4 +1,6 @@
-import os, sys, json
+import os, sys, json, time
+from collections import Counter
+import pytest
 import pathlib
 import importlib.util
 
@@ -31,24 +33,24 @@ def test_pipeline_recognition(tmp_path, monkeypatch):
 
     called = {}
 
-    def fake_identify(*args):
+    def fake_identify(*args, **kwargs):
         called["identify"] = True
         pathlib.Path(args[2]).write_text("[]")
 
     monkeypatch.setattr(nicholson_mod, "identify_segments", fake_identify)
 
-    def fake_generate(video, segs, out_dir):
+    def fake_generate(video, segs, out_file):
         called["clips"] = True
 
-    monkeypatch.setattr(video_editing, "generate_and_align", fake_generate)
-    monkeypatch.setattr(video_editing, "concatenate_clips", lambda a, b: called.setdefault("concat", True))
+    monkeypatch.setattr(video_editing, "generate_and_concatenate", fake_generate)
 
-    def fake_map(jf):
+    def fake_map(jf, roll_map=None):
         called["map"] = jf
+        called["roll"] = roll_map
         return {"B": {"name": "Doe", "alternatives": []}}
 
     monkeypatch.setattr(nicholson_mod, "map_recognized_auto", fake_map)
-    monkeypatch.setattr(chair_mod, "parse_roll_call", lambda jf: {})
+    monkeypatch.setattr(chair_mod, "parse_roll_call", lambda jf: {"Doe": "B"})
     monkeypatch.setattr(annotation_mod, "annotate_segments", lambda a, b, c: called.setdefault("annotate", True))
     monkeypatch.setattr(clip_mod, "clip_transcripts", lambda a, b, c: called.setdefault("clips_txt", True))
 
@@ -59,7 +61,79 @@ def test_pipeline_recognition(tmp_path, monkeypatch):
         hf_token="tok",
     )
 
-    assert called.get("map")
+    assert isinstance(called.get("map"), dict)  # parsed once, passed down
+    assert called["roll"] == {"Doe": "B"}  # roll call parsed once, shared
+    assert json.loads(json_file.read_text())["segments"][1]["speaker"] == "Doe"
+    assert json.loads(pathlib.Path("input.raw.json").read_text())["segments"][1]["speaker"] == "B"
     assert json.loads(pathlib.Path("recognized_map.json").read_text()) == {
         "B": {"name": "Doe", "alternatives": []}
     }
+
+
+def test_pipeline_skips_up_to_date_stages(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    names = ["input.mp4", "input.json", "markup_guide.txt", "segments.txt", "final_video.mp4"]
+    for t, name in enumerate(names):
+        pathlib.Path(name).write_text("x")
+        os.utime(name, (1000 + t, 1000 + t))
+
+    calls = Counter()
+
+    def fake_transcribe(*args, **kwargs):
+        calls["transcribe"] += 1
+        pathlib.Path("input.json").write_text(json.dumps({"segments": [{"speaker": "B", "text": "hi"}]}))
+
+    seen = []
+
+    def fake_roll(data):
+        calls["map"] += 1
+        seen.append(data["segments"][0]["speaker"])
+        return {}
+
+    def fake_identify(*args, **kwargs):
+        pathlib.Path(args[2]).write_text("[]")
+
+    def fake_render(video, segs, out_file):
+        calls["render"] += 1
+        pathlib.Path(out_file).write_text("video")
+
+    monkeypatch.setattr(transcribe_mod, "transcribe", fake_transcribe)
+    monkeypatch.setattr(chair_mod, "parse_roll_call", fake_roll)
+    monkeypatch.setattr(
+        nicholson_mod, "map_recognized_auto",
+        lambda data, roll_map=None: {"B": {"name": "Doe", "alternatives": []}},
+    )
+    monkeypatch.setattr(nicholson_mod, "identify_segments", fake_identify)
+    monkeypatch.setattr(video_editing, "generate_and_concatenate", fake_render)
+    monkeypatch.setattr(annotation_mod, "annotate_segments", lambda a, b, c: calls.update(["annotate"]))
+    monkeypatch.setattr(clip_mod, "clip_transcripts", lambda a, b, c: calls.update(["clips_txt"]))
+
+    videocut_cli.pipeline(video="input.mp4", hf_token="tok")
+    assert calls == {"annotate": 1, "clips_txt": 1}
+
+    # a forced transcription invalidates everything downstream of it
+    videocut_cli.pipeline(video="input.mp4", hf_token="tok", force_transcribe=True)
+    assert (calls["transcribe"], calls["map"], calls["render"]) == (1, 1, 1)
+
+    # a partial re-run skips again
+    videocut_cli.pipeline(video="input.mp4", hf_token="tok")
+    assert (calls["transcribe"], calls["map"], calls["render"]) == (1, 1, 1)
+    assert json.loads(pathlib.Path("input.json").read_text())["segments"][0]["speaker"] == "Doe"
+
+    # a lost mapping output remaps from the raw transcript, not the named one
+    os.remove("segments.txt")
+    videocut_cli.pipeline(video="input.mp4", hf_token="tok")
+    assert (calls["transcribe"], calls["map"], calls["render"]) == (1, 2, 2)
+    assert seen == ["B", "B"]
+
+    # editing the board roster remaps too
+    pathlib.Path("board_members.txt").write_text("Jane Doe\n")
+    os.utime("board_members.txt", (time.time() + 30, time.time() + 30))
+    videocut_cli.pipeline(video="input.mp4", hf_token="tok")
+    assert (calls["transcribe"], calls["map"]) == (1, 3)
+
+    # a newer video reruns every stage
+    os.utime("input.mp4", (time.time() + 60, time.time() + 60))
+    videocut_cli.pipeline(video="input.mp4", hf_token="tok")
+    assert (calls["transcribe"], calls["map"]) == (2, 4)
+    assert seen == ["B"] * 4
@@ -0,0 +1,14 @@
+import pytest
+
+from videocut.core import schemas
+
+
+def test_recognized_map_schema_rejects_bad_entries(tmp_path):
+    good = tmp_path / "recognized_map.json"
+    good.write_text('{"SPEAKER_01": {"name": "Doe", "alternatives": ["Dough"]}}')
+    assert schemas.load_recognized_map(good)["SPEAKER_01"]["name"] == "Doe"
+
+    bad = tmp_path / "bad.json"
+    bad.write_text('{"SPEAKER_01": "Doe"}')
+    with pytest.raises(ValueError, match="bad.json"):
+        schemas.load_recognized_map(bad)
@@ -54,6 +54,26 @@ def test_extract_marked(tmp_path, capsys):
     assert "✅" in capsys.readouterr().out
 
 
+def test_extract_marked_mixed_lines(tmp_path, capsys):
+    markup = tmp_path / "markup_guide.txt"
+    markup.write_text("\n".join([
+        "\t[1.5-2.25] SPEAKER_00: indented",
+        "[3–4] dash-separated words",
+        "[oops-5] bad",
+        "[7.-8] trailing dot",
+    ]))
+    out = tmp_path / "segments.json"
+    segmentation.extract_marked(str(markup), str(out))
+
+    segs = json.loads(out.read_text())
+    assert segs == [
+        {"start": 1.5, "end": 2.25},
+        {"start": 3.0, "end": 4.0},
+        {"start": 7.0, "end": 8.0},
+    ]
+    assert "bad timestamp line 3" in capsys.readouterr().out
+
+
 def test_identify_segments(tmp_path, capsys):
     diarized = tmp_path / "dia.json"
     diarized.write_text(json.dumps({
@@ -148,6 +168,10 @@ def test_segments_txt_roundtrip(tmp_path):
     assert lines[0] == "=START="
     assert lines[1].startswith("\t[0.00 - 1.00]")
 
+    from_dict = tmp_path / "from_dict.txt"
+    segmentation.segments_json_to_txt(transcript, str(k_json), str(from_dict))
+    assert from_dict.read_text() == txt.read_text()
+
 
 def test_segment_cli(tmp_path, capsys):
     data = {
@@ -168,3 +192,21 @@ def test_segment_cli(tmp_path, capsys):
     assert lines[-1] == "=END="
     assert lines[1].lstrip().startswith("[")
     assert "✅" in capsys.readouterr().out
+
+
+def test_srt_to_segments_cli(tmp_path, capsys):
+    srt = tmp_path / "marked.srt"
+    srt.write_text(
+        "1\n00:00:01,000 --> 00:00:02,000\n=START-1=\nhi\n\n"
+        "2\n00:00:03,000 --> 00:00:04,500\nbye\n=END-1=\n"
+    )
+    out = tmp_path / "segs.json"
+    videocut_cli.srt_to_segments(srt_file=str(srt), out=str(out))
+
+    assert out.read_text() == json.dumps([{"start": 1.0, "end": 4.5}], indent=2)
+    assert "1 segment(s)" in capsys.readouterr().out
+
+    empty = tmp_path / "empty.srt"
+    empty.write_text("1\n00:00:01,000 --> 00:00:02,000\nhi\n")
+    videocut_cli.srt_to_segments(srt_file=str(empty), out=str(out))
+    assert json.loads(out.read_text()) == []
@@ -1,10 +1,11 @@
 import pathlib
-import subprocess
 import filecmp
 import shutil
-import sys
+
+from videocut import segmenter
 
 SEG = pathlib.Path('segments.txt')
+TRANSCRIPT = pathlib.Path('transcript.txt')
 
 
 def test_tab_indentation():
@@ -18,5 +19,7 @@ def test_tab_indentation():
 def test_roundtrip(tmp_path, monkeypatch):
     orig = tmp_path / 'orig.txt'
     shutil.copy(SEG, orig)
-    subprocess.run([sys.executable, '-m', 'videocut.segmenter'], check=True)
+    shutil.copy(TRANSCRIPT, tmp_path / 'transcript.txt')
+    monkeypatch.chdir(tmp_path)
+    segmenter.main()
     assert filecmp.cmp(SEG, orig), 'Round-trip changed segments.txt'
@@ -3,6 +3,7 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 import pathlib
 import importlib.util
+import pytest
 import videocut.core.nicholson as nicholson
 
 _cli_path = pathlib.Path(__file__).resolve().parents[1] / "videocut" / "cli.py"
@@ -12,40 +13,92 @@ sys.modules[_spec.name] = videocut_cli
 _spec.loader.exec_module(videocut_cli)
 
 
-def sample_data(tmp_path):
-    diarized = tmp_path / "dia.json"
-    diarized.write_text(json.dumps({
+def _write_json(path, data):
+    """Write *data* to *path* once and return ``(path, data)``."""
+    path.write_text(json.dumps(data))
+    return path, data
+
+
+@pytest.fixture(scope="session")
+def sample_data(tmp_path_factory):
+    return _write_json(tmp_path_factory.mktemp("dia") / "dia.json", {
         "segments": [
             {"speaker": "A", "text": "hello secretary nicholson"},
             {"speaker": "B", "text": "other"},
             {"speaker": "B", "text": "mr doe reports"},
             {"speaker": "A", "text": "thanks"},
         ]
-    }))
-    mapping = tmp_path / "map.json"
-    mapping.write_text(json.dumps({
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_mapping(tmp_path_factory):
+    return _write_json(tmp_path_factory.mktemp("dia") / "map.json", {
         "Nicholson": ["secretary nicholson"],
         "Doe": ["mr doe"],
-    }))
-    return diarized, mapping
+    })
+
+
+def test_map_speaker_by_phrases(sample_data, sample_mapping):
+    diarized, _ = sample_data
+    _, phrase_map = sample_mapping
+    result = nicholson.map_speaker_by_phrases(str(diarized), phrase_map)
+    assert result == {"Nicholson": "A", "Doe": "B"}
 
 
-def test_map_speaker_by_phrases(tmp_path):
-    diarized, mapping = sample_data(tmp_path)
-    result = nicholson.map_speaker_by_phrases(str(diarized), json.loads(mapping.read_text()))
+def test_map_speaker_by_phrases_tokens(tmp_path):
+    diarized = tmp_path / "dia_tok.json"
+    diarized.write_text(json.dumps({
+        "segments": [
+            {"speaker": "A", "text": "Thank you, Secretary   Nicholson."},
+            {"speaker": "B", "text": "Mr. Doe, please"},
+            {"speaker": "C", "text": "that doesn't apply"},
+        ]
+    }))
+    result = nicholson.map_speaker_by_phrases(
+        str(diarized), {"Nicholson": ["secretary nicholson"], "Doe": ["mr doe"]}
+    )
     assert result == {"Nicholson": "A", "Doe": "B"}
 
 
-def test_identify_speakers_cli(tmp_path):
-    diarized, mapping = sample_data(tmp_path)
+def test_map_speaker_by_phrases_shared_first_word():
+    segs = [
+        {"speaker": "A", "text": "director doe director doe"},
+        {"speaker": "B", "text": "director roe here"},
+        {"speaker": "B", "text": "director roe again"},
+    ]
+    result = nicholson.map_speaker_by_phrases(
+        segs, {"Doe": ["director doe"], "Roe": ["", "director roe"]}
+    )
+    assert result == {"Doe": "A", "Roe": "B"}
+
+
+def test_phrase_matching_keeps_no_shared_vocabulary():
+    from concurrent.futures import ThreadPoolExecutor
+
+    segs = [{"speaker": "A", "text": f"director doe word{i}"} for i in range(50)]
+    before = dict(nicholson._NICHOLSON_VOCAB)
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(
+            lambda _: nicholson.map_speaker_by_phrases(segs, {"Doe": ["director doe"]}),
+            range(8),
+        ))
+    assert results == [{"Doe": "A"}] * 8
+    assert not hasattr(nicholson, "_VOCAB")
+    assert nicholson._NICHOLSON_VOCAB == before  # segment words are never interned
+
+
+def test_identify_speakers_cli(tmp_path, sample_data, sample_mapping):
+    diarized, _ = sample_data
+    mapping, _ = sample_mapping
     out = tmp_path / "ids.json"
     videocut_cli.identify_speakers(diarized_json=str(diarized), mapping=str(mapping), out=str(out))
     assert json.loads(out.read_text()) == {"Nicholson": "A", "Doe": "B"}
 
 
-def sample_recog_data(tmp_path):
-    diarized = tmp_path / "dia.json"
-    diarized.write_text(json.dumps({
+@pytest.fixture(scope="session")
+def sample_recog_data(tmp_path_factory):
+    return _write_json(tmp_path_factory.mktemp("dia") / "dia.json", {
         "segments": [
             {"speaker": "X", "text": "call the roll"},
             {"speaker": "X", "text": "Director Doe"},
@@ -57,13 +110,12 @@ def sample_recog_data(tmp_path):
             {"speaker": "A", "text": "director roe you're recognized"},
             {"speaker": "C", "text": "thanks"},
         ]
-    }))
-    return diarized
+    })
 
 
-def sample_recog_no_name(tmp_path):
-    diarized = tmp_path / "dia2.json"
-    diarized.write_text(json.dumps({
+@pytest.fixture(scope="session")
+def sample_recog_no_name(tmp_path_factory):
+    return _write_json(tmp_path_factory.mktemp("dia") / "dia2.json", {
         "segments": [
             {"speaker": "X", "text": "call the roll"},
             {"speaker": "X", "text": "Director Smith"},
@@ -79,13 +131,12 @@ def sample_recog_no_name(tmp_path):
             {"speaker": "X", "text": "you are recognized"},
             {"speaker": "B", "text": "hello"},
         ]
-    }))
-    return diarized
+    })
 
 
-def sample_recog_extra(tmp_path):
-    diarized = tmp_path / "dia3.json"
-    diarized.write_text(json.dumps({
+@pytest.fixture(scope="session")
+def sample_recog_extra(tmp_path_factory):
+    return _write_json(tmp_path_factory.mktemp("dia") / "dia3.json", {
         "segments": [
             {"speaker": "X", "text": "call the roll"},
             {"speaker": "X", "text": "Director Lee"},
@@ -101,35 +152,29 @@ def sample_recog_extra(tmp_path):
             {"speaker": "X", "text": "call on Mr. Park"},
             {"speaker": "C", "text": "hi"},
         ]
-    }))
-    return diarized
+    })
 
 
-def sample_recog_partial(tmp_path):
+@pytest.fixture(scope="session")
+def sample_recog_partial(tmp_path_factory):
     """Roll call has two names but only one is later recognized."""
-    diarized = tmp_path / "dia4.json"
-    diarized.write_text(
-        json.dumps(
-            {
-                "segments": [
-                    {"speaker": "X", "text": "call the roll"},
-                    {"speaker": "X", "text": "Director Doe"},
-                    {"speaker": "B", "text": "Present"},
-                    {"speaker": "X", "text": "Next director Roe"},
-                    {"speaker": "C", "text": "Here"},
-                    {"speaker": "A", "text": "director doe you're recognized"},
-                    {"speaker": "B", "text": "hello"},
-                    {"speaker": "A", "text": "other"},
-                    {"speaker": "C", "text": "thanks"},
-                ]
-            }
-        )
-    )
-    return diarized
+    return _write_json(tmp_path_factory.mktemp("dia") / "dia4.json", {
+        "segments": [
+            {"speaker": "X", "text": "call the roll"},
+            {"speaker": "X", "text": "Director Doe"},
+            {"speaker": "B", "text": "Present"},
+            {"speaker": "X", "text": "Next director Roe"},
+            {"speaker": "C", "text": "Here"},
+            {"speaker": "A", "text": "director doe you're recognized"},
+            {"speaker": "B", "text": "hello"},
+            {"speaker": "A", "text": "other"},
+            {"speaker": "C", "text": "thanks"},
+        ]
+    })
 
 
-def test_map_recognized_auto(tmp_path):
-    diarized = sample_recog_data(tmp_path)
+def test_map_recognized_auto(sample_recog_data):
+    diarized, _ = sample_recog_data
     ids = nicholson.map_recognized_auto(str(diarized))
     assert ids == {
         "B": {"name": "Doe", "alternatives": []},
@@ -137,8 +182,8 @@ def test_map_recognized_auto(tmp_path):
     }
 
 
-def test_identify_recognized_cli(tmp_path):
-    diarized = sample_recog_data(tmp_path)
+def test_identify_recognized_cli(tmp_path, sample_recog_data):
+    diarized, _ = sample_recog_data
     out = tmp_path / "rec.json.out"
     videocut_cli.identify_recognized(diarized_json=str(diarized), out=str(out))
     assert json.loads(out.read_text()) == {
@@ -147,8 +192,8 @@ def test_identify_recognized_cli(tmp_path):
     }
 
 
-def test_map_recognized_auto_context(tmp_path):
-    diarized = sample_recog_no_name(tmp_path)
+def test_map_recognized_auto_context(sample_recog_no_name):
+    diarized, _ = sample_recog_no_name
     ids = nicholson.map_recognized_auto(str(diarized))
     assert ids == {
         "A": {"name": "Smith", "alternatives": []},
@@ -156,8 +201,8 @@ def test_map_recognized_auto_context(tmp_path):
     }
 
 
-def test_map_recognized_auto_extra(tmp_path):
-    diarized = sample_recog_extra(tmp_path)
+def test_map_recognized_auto_extra(sample_recog_extra):
+    diarized, _ = sample_recog_extra
     ids = nicholson.map_recognized_auto(str(diarized))
     assert ids == {
         "A": {"name": "Lee", "alternatives": []},
@@ -166,8 +211,8 @@ def test_map_recognized_auto_extra(tmp_path):
     }
 
 
-def test_map_recognized_auto_partial(tmp_path):
-    diarized = sample_recog_partial(tmp_path)
+def test_map_recognized_auto_partial(sample_recog_partial):
+    diarized, _ = sample_recog_partial
     ids = nicholson.map_recognized_auto(str(diarized))
     assert ids == {
         "B": {"name": "Doe", "alternatives": []},
@@ -175,8 +220,8 @@ def test_map_recognized_auto_partial(tmp_path):
     }
 
 
-def test_identify_recognized_cli_partial(tmp_path):
-    diarized = sample_recog_partial(tmp_path)
+def test_identify_recognized_cli_partial(tmp_path, sample_recog_partial):
+    diarized, _ = sample_recog_partial
     out = tmp_path / "rec_part.json"
     videocut_cli.identify_recognized(diarized_json=str(diarized), out=str(out))
     assert json.loads(out.read_text()) == {
@@ -185,8 +230,8 @@ def test_identify_recognized_cli_partial(tmp_path):
     }
 
 
-def test_add_speaker_labels(tmp_path):
-    diarized, mapping = sample_data(tmp_path)
+def test_add_speaker_labels(tmp_path, sample_data):
+    diarized, _ = sample_data
     ids = {"Nicholson": "A", "Doe": "B"}
     out = tmp_path / "lab.json"
     nicholson.add_speaker_labels(str(diarized), ids, str(out))
@@ -195,8 +240,8 @@ def test_add_speaker_labels(tmp_path):
     assert labels == ["Nicholson", "Doe", "Doe", "Nicholson"]
 
 
-def test_apply_speaker_labels_cli(tmp_path):
-    diarized, _ = sample_data(tmp_path)
+def test_apply_speaker_labels_cli(tmp_path, sample_data):
+    diarized, _ = sample_data
     ids = {"Nicholson": "A", "Doe": "B"}
     map_file = tmp_path / "ids.json"
     map_file.write_text(json.dumps(ids))
@@ -205,3 +250,62 @@ def test_apply_speaker_labels_cli(tmp_path):
     data = json.loads(out.read_text())
     assert data["segments"][0]["label"] == "Nicholson"
     assert data["segments"][1]["label"] == "Doe"
+
+
+def test_apply_name_map_json_accepts_dict(tmp_path, sample_data):
+    diarized, _ = sample_data
+    out = tmp_path / "named.json"
+    nicholson.apply_name_map_json(str(diarized), {"A": {"name": "Nicholson"}}, str(out))
+    data = json.loads(out.read_text())
+    assert [seg["speaker"] for seg in data["segments"]] == ["Nicholson", "B", "B", "Nicholson"]
+
+
+def test_prune_segments_stdin_stdout(monkeypatch, capsys):
+    import io
+
+    segs = [{"text": ["one two three four"]}, {"text": ["hi"]}]
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(json.dumps(segs).encode())))
+    videocut_cli.prune_segments_cmd(seg_json="-", out=None)
+    captured = capsys.readouterr()
+    assert json.loads(captured.out) == [{"text": ["one two three four"]}]
+    assert "1 segment(s) kept" in captured.err
+
+
+def test_map_speaker_by_phrases_accepts_segment_stream(sample_data):
+    _, data = sample_data
+    stream = (seg for seg in data["segments"])
+    result = nicholson.map_speaker_by_phrases(stream, {"Doe": ["mr doe"]})
+    assert result == {"Doe": "B"}
+
+
+def test_closest_matches_difflib_exactly():
+    from difflib import get_close_matches
+
+    # rapidfuzz's Indel ratio scores this pair 0.77; get_close_matches only 0.62
+    assert nicholson._closest("ndeoo ", ["ndo do "], 0.75) is None
+    board = ["jane doe", "john smith", "jon smyth", "mary jones"]
+    for name in ["jane dough", "jon smith", "mary", "J. Smith", "john smyth"]:
+        for cutoff in (0.65, 0.75, 0.8):
+            expected = get_close_matches(name, board, n=1, cutoff=cutoff)
+            assert nicholson._closest(name, board, cutoff) == (expected[0] if expected else None)
+
+
+def test_normalize_recognized_name_fuzzy():
+    board = {"jane doe": "Jane Doe", "john smith": "John Smith"}
+    assert nicholson.normalize_recognized_name("Jane Dough", board) == "Jane Doe"
+    assert nicholson.normalize_recognized_name("Director Smith", board) == "John Smith"
+    assert nicholson.normalize_recognized_name("Someone Else", board) == "Someone Else"
+    assert nicholson._is_board_member("jon smith", set(board))
+    assert not nicholson._is_board_member("alice", set(board))
+
+
+def test_map_nicholson_speaker_counts_key_phrases():
+    segs = [
+        {"speaker": "A", "text": "Secretary Nicholson, please."},
+        {"speaker": "B", "text": "Nicholson, for the record: thanks."},
+        {"speaker": "B", "text": "Director   Nicholson again"},
+        {"speaker": "C", "text": "nicholson alone is not a key phrase"},
+    ]
+    assert nicholson.map_nicholson_speaker(segs) == "B"
+    with pytest.raises(RuntimeError):
+        nicholson.map_nicholson_speaker(segs[3:])
@@ -0,0 +1,22 @@
+import json
+
+from videocut.core import srt_markers
+
+
+def test_annotate_srt_tolerates_non_object_map_entries(tmp_path, monkeypatch):
+    srt = tmp_path / "in.srt"
+    srt.write_text(
+        "1\n00:00:01,000 --> 00:00:02,000\n[SPEAKER_01]: hello\n\n"
+        "2\n00:00:02,000 --> 00:00:03,000\n[SPEAKER_02]: bye\n"
+    )
+    segs = tmp_path / "segs.json"
+    segs.write_text(json.dumps([{"start": 1.0, "end": 2.5}]))
+    name_map = tmp_path / "recognized_map.json"
+    name_map.write_text(json.dumps({"SPEAKER_01": {"name": "Doe"}, "SPEAKER_02": "Roe"}))
+    out = tmp_path / "out.srt"
+
+    srt_markers.annotate_srt(str(srt), str(segs), str(name_map), str(out))
+
+    lines = out.read_text().splitlines()
+    assert lines[:4] == ["=START-1=", "1", "00:00:01,000 --> 00:00:02,000", "Doe: hello"]
+    assert "SPEAKER_02: bye" in lines and "=END-1=" in lines
@@ -0,0 +1,67 @@
+from videocut.commands import upload
+
+
+def test_build_description_cached_until_segments_change(tmp_path, monkeypatch):
+    seg = tmp_path / "segments.txt"
+    seg.write_text("=START=\n\t[0:00-0:10] Chair: Call to order\n=END=\n")
+    calls = []
+    real = upload.parse_segments_for_chapters
+
+    def counting(path, fade):
+        calls.append(path)
+        return real(path, fade)
+
+    monkeypatch.setattr(upload, "parse_segments_for_chapters", counting)
+    upload._cached_description.cache_clear()
+
+    first = upload.build_description_from_segments(str(seg), 0.5)
+    assert upload.build_description_from_segments(str(seg), 0.5) == first == "00:00 Chair: Call to order"
+    assert len(calls) == 1
+
+    seg.write_text("=START=\n\t[0:00-0:10] Chair: Adjourn now\n=END=\n")
+    assert upload.build_description_from_segments(str(seg), 0.5) == "00:00 Chair: Adjourn now"
+
+
+def test_parse_segments_for_chapters_only_reads_inside_markers(tmp_path):
+    seg = tmp_path / "segments.txt"
+    seg.write_text(
+        "\t[0:00-0:05] Outside: ignored\n"
+        "=START=\n\t[0:00-0:10] Chair: Call to order\n\tnot a timestamp\n"
+        "\t\t[0:10-0:20] Doe: Second item  \n=END=\n"
+        "\t[0:20-0:30] Outside: ignored\n"
+    )
+    assert upload.parse_segments_for_chapters(str(seg), 0.5) == [
+        ("00:00", "Chair: Call to order"),
+        ("00:10", "Doe: Second item"),
+    ]
+
+
+def test_split_tags():
+    assert upload.split_tags(["videocut", "board, meeting", " "]) == ["videocut", "board", "meeting"]
+
+
+def test_upload_sends_resumable_chunks(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    seen = {}
+
+    class FakeRequest:
+        def __init__(self):
+            self.steps = [(SimpleNamespace(progress=lambda: 0.5), None), (None, {"id": "abc"})]
+
+        def next_chunk(self, num_retries=0):
+            seen["retries"] = num_retries
+            return self.steps.pop(0)
+
+    def fake_media(path, chunksize, resumable, mimetype):
+        seen["chunksize"] = chunksize
+        return object()
+
+    videos = SimpleNamespace(insert=lambda **kw: FakeRequest())
+    monkeypatch.setattr(upload.Credentials, "from_authorized_user_file", lambda f: None)
+    monkeypatch.setattr(upload, "build", lambda *a, **k: SimpleNamespace(videos=lambda: videos))
+    monkeypatch.setattr(upload, "MediaFileUpload", fake_media)
+
+    upload.upload_video_to_youtube("v.mp4", "t", [], "22", "private", "c.json", "d")
+
+    assert seen == {"chunksize": 8 * 1024 * 1024, "retries": 5}
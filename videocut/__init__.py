@@ -1,20 +1,5 @@
 """Videocut package."""
 
-from .core import (
-    transcription,
-    segmentation,
-    video_editing,
-    nicholson,
-    annotation,
-    clip_transcripts,
-    srt_markers,
-    alignment,
-    align,
-    dtw_align,
-    speaker_mapping,
-    pdf_utils,
-)
-
 __all__ = [
     "annotation",
     "clip_transcripts",
@@ -29,3 +14,14 @@ __all__ = [
     "speaker_mapping",
     "pdf_utils",
 ]
+
+
+def __getattr__(name: str):
+    """Import core modules on first access so ``import videocut`` stays cheap."""
+    if name in __all__:
+        import importlib
+
+        module = importlib.import_module(f".core.{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
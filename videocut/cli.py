@@ -3,33 +3,136 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import Optional
+import contextlib
+import fnmatch
+import hashlib
 import json
+import os
+import shutil
+import tempfile
 import typer
-from videocut.core.align import align_pdf_to_asr
-from videocut.core.dtw_align import align_pdf_to_srt
-from videocut.core.convert import matched_to_txt
-from videocut.core.label_fix import labelify, pdf_labels, validate_txt_labels
-from .core import (
-    transcription,
-    segmentation,
-    video_editing,
-    nicholson,
-    annotation,
-    clip_transcripts,
-    srt_markers,
-    alignment,
-    align,
-    speaker_mapping,
-    chair,
-    pdf_utils,
-    crossfade_preview,
-    crossfader,
-)
-from .commands import authorize as authorize_cmd, upload as upload_cmd
+
+try:  # orjson parses bytes directly and serializes large payloads much faster
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        # numpy scalars/arrays come straight out of the aligners
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=_numpy_default).encode()
+
+
+def _numpy_default(obj):
+    """Convert numpy scalars and arrays for the stdlib JSON encoder."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(path, obj) -> None:
+    """Write *obj* to *path* as JSON indented by two spaces.
+
+    Uses a raw file descriptor so each small output costs one open, write and
+    close without the buffered-IO layers of ``Path.write_bytes``.
+    """
+    data = memoryview(_dumps(obj))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def _write_json_list(out: str, records) -> int:
+    """Stream *records* to *out* as an indented JSON array; return the count.
+
+    Each record is serialized on its own and pushed through a 1 MiB buffered
+    writer, so the whole array is never held in memory as one string.
+    """
+    count = 0
+    with open(out, "wb", buffering=1 << 20) as fh:
+        fh.write(b"[")
+        for rec in records:
+            fh.write(b",\n  " if count else b"\n  ")
+            fh.write(_dumps(rec).replace(b"\n", b"\n  "))
+            count += 1
+        fh.write(b"\n]" if count else b"]")
+    return count
+
+
+@contextlib.contextmanager
+def _temp_json(near: Path):
+    """Yield the name of a temporary JSON file in the directory of *near*.
+
+    The file lives on the same filesystem as the output and is removed when
+    the block exits, even if a step fails part-way.  It is closed before
+    its name is handed out, so steps can reopen it by path on Windows too.
+    """
+    fd, name = tempfile.mkstemp(suffix=".json", dir=near.parent)
+    os.close(fd)
+    try:
+        yield name
+    finally:
+        Path(name).unlink(missing_ok=True)
+
+
+def _up_to_date(out, *deps) -> bool:
+    """Return ``True`` if *out* exists and is newer than every existing dep.
+
+    Deps that are ``None`` are ignored.  A stage whose output is current can
+    be skipped when a pipeline is re-run on the same inputs.
+    """
+    try:
+        built = os.stat(out).st_mtime
+    except FileNotFoundError:
+        return False
+    return all(os.stat(d).st_mtime <= built for d in deps if d and os.path.exists(d))
+
 
 app = typer.Typer(help="VideoCut pipeline")
 
 
+def _version_callback(value: bool) -> None:
+    """Print the installed version and exit before any command is resolved."""
+    if not value:
+        return
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        typer.echo(f"videocut {version('videocut')}")
+    except PackageNotFoundError:  # pragma: no cover - running from a checkout
+        typer.echo("videocut (not installed)")
+    raise typer.Exit()
+
+
+@app.callback()
+def _main(
+    ctx: typer.Context,
+    version: bool = typer.Option(
+        False,
+        "--version",
+        callback=_version_callback,
+        is_eager=True,
+        help="Show the version and exit.",
+    ),
+    quiet: bool = typer.Option(
+        False, "--quiet", "-q", help="Suppress progress messages."
+    ),
+) -> None:
+    """VideoCut pipeline"""
+    if quiet:
+        from .core._jsoncache import quiet_output
+
+        # redirected for this command only; restored when the context closes
+        ctx.with_resource(quiet_output())
+
+
 @app.command()
 def transcribe(
     video: str = typer.Argument("input.mp4", help="Video file to transcribe"),
@@ -42,10 +145,23 @@ def transcribe(
     ),
     progress: bool = typer.Option(True, help="Show WhisperX progress output"),
     pdf: Optional[str] = typer.Option(None, help="Official PDF transcript"),
-    backend: str = typer.Option("whisperx", help="Transcription backend: whisperx | mlx"),
+    backend: str = typer.Option("whisperx", help="Transcription backend: whisperx | whispercpp | mlx"),
+    quant: str = typer.Option(
+        "q5_1", help="whisper.cpp model quantization: q4_0 | q5_0 | q5_1 | q8_0 | fp16"
+    ),
+    inprocess: bool = typer.Option(
+        False, help="Run WhisperX through its Python API (falls back to the CLI)"
+    ),
+    flash_attn: bool = typer.Option(
+        False, help="Use whisper.cpp flash attention (needs a build that supports -fa)"
+    ),
 ):
     """Run transcription with specified backend."""
-    transcription.transcribe(video, hf_token, diarize, speaker_db, progress, pdf, backend)
+    from .core import transcription
+    transcription.transcribe(
+        video, hf_token, diarize, speaker_db, progress, pdf, backend,
+        quant=quant, inprocess=inprocess, flash_attn=flash_attn,
+    )
 
 
 @app.command()
@@ -54,22 +170,26 @@ def json_to_editable(
     out: str = "segments_edit.json",
     markup: str = "markup_guide.txt",
 ):
+    from .core import segmentation
     segmentation.json_to_editable(json_file, out, markup)
 
 
 @app.command()
 def json_to_tsv(json_file: str, out: str = "input.tsv"):
+    from .core import segmentation
     segmentation.json_to_tsv(json_file, out)
 
 
 @app.command()
 def json_to_markup(json_file: str, out: str = "markup_guide.txt"):
     """Generate ``markup_guide.txt`` from a diarized JSON file."""
+    from .core import segmentation
     segmentation.json_to_markup(json_file, out)
 
 
 @app.command()
 def identify_clips(tsv: str = "input.tsv", out: str = "segments_to_keep.json"):
+    from .core import segmentation
     segmentation.identify_clips(tsv, out)
 
 
@@ -77,6 +197,7 @@ def identify_clips(tsv: str = "input.tsv", out: str = "segments_to_keep.json"):
 def identify_clips_json(
     edit_json: str = "segments_edit.json", out: str = "segments_to_keep.json"
 ):
+    from .core import segmentation
     segmentation.identify_clips_json(edit_json, out)
 
 
@@ -84,6 +205,7 @@ def identify_clips_json(
 def extract_marked(
     markup: str = "markup_guide.txt", out: str = "segments_to_keep.json"
 ):
+    from .core import segmentation
     segmentation.extract_marked(markup, out)
 
 
@@ -94,6 +216,7 @@ def annotate_markup(
     out_file: str = "markup_with_markers.txt",
     srt_file: Optional[str] = None,
 ):
+    from .core import annotation
     annotation.annotate_segments(markup_file, seg_file, out_file, srt_file)
 
 
@@ -104,6 +227,7 @@ def clip_transcripts_cmd(
     out_file: str = "clip_transcripts.txt",
     srt_file: Optional[str] = None,
 ):
+    from .core import clip_transcripts
     clip_transcripts.clip_transcripts(markup_file, seg_file, out_file, srt_file)
 
 
@@ -114,6 +238,7 @@ def apply_pdf_transcript(
     out_json: Optional[str] = None,
 ):
     """Apply an official PDF transcript to a diarized JSON."""
+    from .core import pdf_utils
     pdf_utils.apply_pdf_transcript_json(json_file, pdf_path, out_json)
 
 
@@ -127,23 +252,22 @@ def json_to_transcript(
     merged into the JSON prior to generating ``transcript.txt`` so that
     the output reflects the official wording.
     """
-    tmp_json = json_file
+    from .core import pdf_utils
+    data = _loads(Path(json_file).read_bytes())
     if pdf:
-        tmp_json = str(Path(json_file).with_suffix(".pdf.json"))
-        pdf_utils.apply_pdf_transcript_json(json_file, pdf, tmp_json)
+        data = pdf_utils.apply_pdf_transcript_dict(data, pdf)
     pdf_utils.write_timestamped_transcript(
         pdf or json_file,
         json_file,
         out,
-        json_path=tmp_json,
+        json_data=data,
     )
-    if pdf:
-        Path(tmp_json).unlink(missing_ok=True)
 
 
 @app.command("check-transcript")
 def check_transcript(json_file: str, min_wps: float = 0.5, max_wps: float = 5.0):
     """Report segments with abnormal words-per-second timing."""
+    from .core import pdf_utils
     bad = pdf_utils.find_timing_anomalies(json_file, min_wps, max_wps)
     if not bad:
         print("✅  transcript timings look reasonable")
@@ -162,12 +286,14 @@ def pdf_extract(
     pdf_file: str, txt_out: Optional[str] = None, json_out: Optional[str] = None
 ):
     """Extract transcript from PDF to text and JSON."""
+    from .core import pdf_utils
     pdf_utils.export_pdf_transcript(pdf_file, txt_out, json_out)
 
 
 @app.command("pdf-match")
 def pdf_match(pdf_file: str, json_file: str, out: str = "matched.json"):
     """Match PDF transcript lines to a diarized JSON."""
+    from .core import pdf_utils
     pdf_utils.match_pdf_json(pdf_file, json_file, out)
 
 
@@ -203,20 +329,26 @@ def match_cli(
     ),
     ratio: float = typer.Option(
         0.15,
-        help="Minimum SequenceMatcher ratio to accept a match",
+        help="Minimum similarity ratio (0–1) to accept a match",
+    ),
+    chunk_seconds: Optional[float] = typer.Option(
+        None,
+        help="Align long recordings in silence-bounded chunks of about this many seconds",
     ),
 ) -> None:
     """
     Align PDF utterances (no timestamps) to ASR word stream and write *matched.json*.
     """
+    from .core.align import align_pdf_to_asr
     matched = align_pdf_to_asr(
         pdf_json,
         asr_json,
         window=window,
         step=step,
         ratio_thresh=ratio,
+        chunk_seconds=chunk_seconds,
     )
-    out.write_text(json.dumps(matched, indent=2))
+    _write_json(out, matched)
     nulls = sum(1 for m in matched if m["start"] is None)
     typer.echo(f"✅ wrote {out} · {nulls} unmatched line(s)")
 
@@ -229,14 +361,16 @@ def dtw_align(
     srt_path: Path = typer.Argument(..., exists=True, readable=True),
     json_out: Path = typer.Option("matched_dtw.json", "--json-out", "-j"),
     txt_out: Path = typer.Option("dtw-transcript.txt", "--txt-out", "-t"),
-    band: int = typer.Option(10, help="DTW radius for FastDTW"),
+    band: int = typer.Option(100, help="DTW drift margin for PDF alignment"),
 ):
     """Advanced banded-DTW word-level alignment of PDF to SRT.
 
     Writes *matched_dtw.json* and a speaker-labeled *dtw-transcript.txt*.
     """
+    from .core.dtw_align import align_pdf_to_srt
+    from .core.label_fix import labelify, pdf_labels, validate_txt_labels
     aligned = align_pdf_to_srt(pdf_txt, srt_path, band=band)
-    json_out.write_text(json.dumps(aligned, indent=2))
+    _write_json(json_out, aligned)
     labels = pdf_labels(pdf_txt)
     labelify(json_out, txt_out, valid_labels=labels)
     validate_txt_labels(txt_out, labels)
@@ -265,6 +399,7 @@ def to_txt_cli(
     """
     Convert *matched.json* to the tab-indented transcript.txt format.
     """
+    from .core.convert import matched_to_txt
     matched_to_txt(matched_json, out)
     typer.echo(f"✅ wrote {out}")
 
@@ -294,6 +429,7 @@ def make_labeled(
     Output line format:
         Speaker<TAB>[start-end]<TAB>utterance
     """
+    from .core.label_fix import labelify
     labelify(matched_json, out_file, default_speaker=default)
     typer.echo(f"✅ wrote {out_file}")
 
@@ -309,6 +445,7 @@ def align_cmd(
     When a PDF file is supplied it is converted to ``transcript.txt`` before
     alignment.
     """
+    from .core import alignment
     typer.echo("⚠️  'legacy-align' is deprecated; use 'align' instead.")
     alignment.align_with_transcript(video, transcript, out_json)
 
@@ -326,18 +463,19 @@ def annotate_srt(
     appending ``_processed`` before the extension. For example,
     ``meeting.srt`` becomes ``meeting_processed.srt``.
     """
+    from .core import srt_markers
     if out_file is None:
-        path = Path(srt_file)
-        out_file = f"{path.stem}_processed{path.suffix}"
+        base, ext = os.path.splitext(os.path.basename(srt_file))
+        out_file = f"{base}_processed{ext}"
     srt_markers.annotate_srt(srt_file, seg_json, name_map, out_file)
 
 
 @app.command()
 def srt_to_segments(srt_file: str, out: str = "segments_from_srt.json"):
     """Extract segment list from an annotated SRT file."""
-    segs = srt_markers.segments_from_srt(srt_file)
-    Path(out).write_text(json.dumps(segs, indent=2))
-    print(f"✅  {len(segs)} segment(s) → {out}")
+    from .core import srt_markers
+    count = _write_json_list(out, srt_markers.segments_from_srt(srt_file))
+    print(f"✅  {count} segment(s) → {out}")
 
 
 @app.command()
@@ -345,15 +483,19 @@ def clips_from_srt(
     video: str = typer.Argument("input.mp4", help="Source video"),
     srt_file: str = typer.Argument("processed.srt", help="SRT with markers"),
     out_dir: str = typer.Option("clips", help="Output directory for clips"),
+    jobs: Optional[int] = typer.Option(None, help="Concurrent ffmpeg jobs (default: half the CPUs)"),
+    reencode: Optional[bool] = typer.Option(None, "--reencode/--no-reencode", help="Re-encode cuts (default: only cuts that miss a keyframe)"),
 ):
     """Generate clips directly from an annotated SRT."""
+    from .core import srt_markers, video_editing
     segs = srt_markers.segments_from_srt(srt_file)
-    video_editing.generate_clips_from_segments(video, segs, out_dir)
+    video_editing.generate_clips_from_segments(video, segs, out_dir, jobs, reencode)
 
 
 @app.command()
 def build_speaker_db(samples: str, out: str = "speaker_db.json"):
     """Process WAV samples into a speaker embedding database."""
+    from .core import speaker_mapping
     speaker_mapping.build_speaker_db(samples, out)
 
 
@@ -362,6 +504,7 @@ def map_speakers(
     video: str, json_file: str, db: str = "speaker_db.json", out: Optional[str] = None
 ):
     """Apply speaker name mapping to a diarized JSON file."""
+    from .core import speaker_mapping
     speaker_mapping.apply_speaker_map(video, json_file, db, out)
 
 
@@ -373,13 +516,15 @@ def identify_segments_cmd(
     out_txt: str = "segments.txt",
 ):
     """Detect Nicholson segments from a diarized JSON or transcript file."""
-    tmp_json = Path(out_txt).with_suffix(".json")
-    if source.endswith(".json"):
-        nicholson.identify_segments(source, recognized, str(tmp_json), board_file)
-    else:
-        nicholson.segment_nicholson_from_transcript(source, str(tmp_json), board_file)
-    segmentation.segments_json_to_txt(source, str(tmp_json), out_txt)
-    tmp_json.unlink(missing_ok=True)
+    from .core import nicholson, segmentation
+    with _temp_json(Path(out_txt)) as tmp_json:
+        if source.endswith(".json"):
+            nicholson.identify_segments(
+                source, recognized, tmp_json, board_file, compact=True
+            )
+        else:
+            nicholson.segment_nicholson_from_transcript(source, tmp_json, board_file)
+        segmentation.segments_json_to_txt(source, tmp_json, out_txt)
 
 
 @app.command()
@@ -389,9 +534,10 @@ def identify_speakers(
     out: str = "speaker_map.json",
 ):
     """Map named people to diarized speaker IDs based on key phrases."""
-    phrase_map = json.loads(Path(mapping).read_text())
+    from .core import nicholson, schemas
+    phrase_map = schemas.load_phrase_map(mapping)
     ids = nicholson.map_speaker_by_phrases(diarized_json, phrase_map)
-    Path(out).write_text(json.dumps(ids, indent=2))
+    _write_json(out, ids)
     print(f"✅  speaker map → {out}")
 
 
@@ -401,9 +547,10 @@ def identify_recognized(
     out: str = "recognized_map.json",
 ):
     """Automatically map recognized names to speaker IDs."""
+    from .core import nicholson, chair
     ids = nicholson.map_recognized_auto(diarized_json)
     chair_id = chair.identify_chair(diarized_json)
-    Path(out).write_text(json.dumps(ids, indent=2))
+    _write_json(out, ids)
     print(f"🔍  chair is {chair_id}")
     print(f"✅  recognized map → {out}")
 
@@ -414,9 +561,10 @@ def identify_chair(
     out: str = "roll_call_map.json",
 ):
     """Detect the chair and parse roll call responses."""
-    chair_id = chair.identify_chair(diarized_json)
-    votes = chair.parse_roll_call(diarized_json)
-    Path(out).write_text(json.dumps(votes, indent=2))
+    from .core import chair
+    data = _loads(Path(diarized_json).read_bytes())
+    chair_id, votes = chair.identify_chair_and_roll_call(data)
+    _write_json(out, votes)
     print(f"🔍  chair is {chair_id}")
     print(f"✅  roll call map → {out}")
 
@@ -427,8 +575,12 @@ def apply_speaker_labels(
     map_json: str,
     out: str = "labeled.json",
 ):
-    """Write a copy of diarized_json with speaker names in a 'label' field."""
-    mapping = json.loads(Path(map_json).read_text())
+    """Write a copy of diarized_json with speaker names in a 'label' field.
+
+    Pass ``-`` as *diarized_json* or *out* to read stdin or write stdout.
+    """
+    from .core import nicholson, schemas
+    mapping = schemas.load_speaker_map(map_json)
     nicholson.add_speaker_labels(diarized_json, mapping, out)
 
 
@@ -438,7 +590,11 @@ def apply_name_map(
     map_json: str = "recognized_map.json",
     out: Optional[str] = None,
 ):
-    """Replace SPEAKER IDs in segments JSON with recognized names."""
+    """Replace SPEAKER IDs in segments JSON with recognized names.
+
+    Pass ``-`` as *seg_json* or *out* to read stdin or write stdout.
+    """
+    from .core import nicholson
     nicholson.apply_name_map(seg_json, map_json, out)
 
 
@@ -447,10 +603,37 @@ def prune_segments_cmd(
     seg_json: str = "segments_to_keep.json",
     out: Optional[str] = None,
 ):
-    """Remove trivial segments from the JSON list."""
+    """Remove trivial segments from the JSON list.
+
+    Pass ``-`` as *seg_json* or *out* to read stdin or write stdout.
+    """
+    from .core import nicholson
     nicholson.prune_segments(seg_json, out)
 
 
+def _segment_from_txt(txt_file: Path, out: Path, debug: bool) -> None:
+    """Build ``segments.txt`` from a tab-indented transcript."""
+    from . import segmenter
+
+    typer.echo("Using new segmenter 2.0 code")
+    rows = segmenter.load_rows(str(txt_file))
+    seg_lines = segmenter.build_segments(rows, debug=debug)
+    out.write_text("\n".join(seg_lines) + "\n")
+
+
+def _segment_from_json(json_file: Path, out: Path, debug: bool) -> None:
+    """Build ``segments.txt`` from a diarized JSON transcript."""
+    from .core import nicholson, segmentation
+
+    with _temp_json(out) as tmp_json:
+        nicholson.segment_nicholson(str(json_file), tmp_json, compact=True)
+        segmentation.segments_json_to_txt(str(json_file), tmp_json, str(out))
+
+
+# Input suffix → segmenting handler; anything else is treated as JSON.
+_SEGMENT_HANDLERS = {".txt": _segment_from_txt, ".json": _segment_from_json}
+
+
 @app.command("segment")
 def segment(
     json_file: Path = typer.Argument(
@@ -468,21 +651,8 @@ def segment(
     """
     json_file = Path(json_file)
     out = Path(out)
-
-    if json_file.suffix == ".txt":
-        from . import segmenter
-
-        typer.echo("Using new segmenter 2.0 code")
-        rows = segmenter.load_rows(str(json_file))
-        seg_lines = segmenter.build_segments(rows, debug=debug)
-        out.write_text("\n".join(seg_lines) + "\n")
-        typer.echo(f"✅ Created {out}")
-        return
-
-    tmp_json = json_file.with_name("segments_auto.json")
-    nicholson.segment_nicholson(str(json_file), str(tmp_json))
-    segmentation.segments_json_to_txt(str(json_file), str(tmp_json), str(out))
-    tmp_json.unlink(missing_ok=True)
+    handler = _SEGMENT_HANDLERS.get(json_file.suffix, _segment_from_json)
+    handler(json_file, out, debug)
     typer.echo(f"✅ Created {out}")
 
 
@@ -493,6 +663,7 @@ def recognized_directors(
     out: str = "recognized_directors.txt",
 ):
     """Generate recognized_directors.txt from recognition results."""
+    from .core import nicholson
     nicholson.generate_recognized_directors(recognized, board_file, out)
 
 
@@ -503,6 +674,7 @@ def generate_and_align(
     out_dir: str = typer.Option("clips", help="Output directory for clips"),
     srt_file: Optional[str] = typer.Option(None, help="SRT file for segments.txt"),
 ):
+    from .core import video_editing
     video_editing.generate_and_align(video, segs, out_dir, srt_file)
 
 
@@ -512,9 +684,12 @@ def clip_cmd(
     segs: str = typer.Argument("segments.txt", help="Segments file (txt or json)"),
     out_dir: str = typer.Option("clips", help="Output directory for clips"),
     srt_file: Optional[str] = typer.Option(None, help="SRT file for segments.txt"),
+    jobs: Optional[int] = typer.Option(None, help="Concurrent ffmpeg jobs (default: half the CPUs)"),
+    reencode: Optional[bool] = typer.Option(None, "--reencode/--no-reencode", help="Re-encode cuts (default: only cuts that miss a keyframe)"),
 ):
     """Cut clips directly from segments without alignment."""
-    video_editing.clip_segments(video, segs, out_dir, srt_file)
+    from .core import video_editing
+    video_editing.clip_segments(video, segs, out_dir, srt_file, jobs=jobs, reencode=reencode)
 
 
 @app.command()
@@ -528,6 +703,7 @@ def concatenate(
     hold_duration: float = 0.1,
 ) -> None:
     """Concatenate clips with optional dip transitions."""
+    from .core import crossfader
     if dip_news:
         crossfader.concat_with_dip(
             clips_dir, output, dip_color="#EEEEEE", fade_dur=0.33, hold_dur=0.15
@@ -544,24 +720,55 @@ def concatenate(
         crossfader.concat_default(clips_dir, output)
 
 
+# PDF→SRT alignments keyed by input contents, so re-running ``prep`` on
+# unchanged files skips the DTW pass.
+_CACHE_DIR = Path(".videocut_cache")
+
+
+def _alignment_key(pdf_txt: Path, srt_path: Path, band: int) -> str:
+    """Return a hex digest of both alignment inputs and the DTW band."""
+    h = hashlib.blake2b(digest_size=20)
+    for path in (pdf_txt, srt_path):
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                h.update(chunk)
+        h.update(b"\0")
+    h.update(str(band).encode())
+    return h.hexdigest()
+
+
 @app.command("prep-segments")
 def prep_segments(
     video: Path = typer.Argument("input.mp4", help="Source video file"),
     pdf: Path = typer.Argument("transcript.pdf", help="Matching PDF transcript"),
-    band: int = typer.Option(10, help="DTW radius for PDF alignment"),
+    band: int = typer.Option(100, help="DTW drift margin for PDF alignment"),
     debug: bool = typer.Option(False, help="Show debug output during segmentation"),
 ) -> None:
     """Transcribe *video* and produce ``segments.txt`` using *pdf*."""
+    from .core import transcription, pdf_utils
+    from .core.dtw_align import align_pdf_to_srt
+    from .core.label_fix import labelify, pdf_labels, validate_txt_labels
     transcription.transcribe(str(video))
     pdf_utils.export_pdf_transcript(str(pdf))
     pdf_txt = pdf.with_name("pdf_transcript.txt")
     srt_path = video.with_suffix(".srt")
 
-    aligned = align_pdf_to_srt(pdf_txt, srt_path, band=band)
-    Path("matched_dtw.json").write_text(json.dumps(aligned, indent=2))
-    labels = pdf_labels(pdf_txt)
-    labelify("matched_dtw.json", "dtw-transcript.txt", valid_labels=labels)
-    validate_txt_labels("dtw-transcript.txt", labels)
+    key = _alignment_key(pdf_txt, srt_path, band)
+    cached_json = _CACHE_DIR / f"{key}.json"
+    cached_txt = _CACHE_DIR / f"{key}.txt"
+    if cached_json.exists() and cached_txt.exists():
+        shutil.copyfile(cached_json, "matched_dtw.json")
+        shutil.copyfile(cached_txt, "dtw-transcript.txt")
+        typer.echo(f"♻️  reused cached alignment {key[:12]}")
+    else:
+        aligned = align_pdf_to_srt(pdf_txt, srt_path, band=band)
+        _write_json("matched_dtw.json", aligned)
+        labels = pdf_labels(pdf_txt)
+        labelify("matched_dtw.json", "dtw-transcript.txt", valid_labels=labels)
+        validate_txt_labels("dtw-transcript.txt", labels)
+        _CACHE_DIR.mkdir(exist_ok=True)
+        shutil.copyfile("matched_dtw.json", cached_json)
+        shutil.copyfile("dtw-transcript.txt", cached_txt)
 
     from . import segmenter
 
@@ -572,16 +779,18 @@ def prep_segments(
 
 
 def _find_single(pattern: str) -> Path | None:
-    """Return the only Path matching *pattern* in the CWD or ``None``."""
-    matches = [p for p in Path.cwd().glob(pattern) if p.is_file()]
-    return matches[0] if len(matches) == 1 else None
+    """Return the only file matching *pattern* in the CWD or ``None``."""
+    # one directory read; DirEntry.is_file() reuses d_type instead of a stat
+    with os.scandir(".") as it:
+        matches = [e.name for e in it if fnmatch.fnmatchcase(e.name, pattern) and e.is_file()]
+    return Path(matches[0]) if len(matches) == 1 else None
 
 
 @app.command("prep")
 def prep(
     video: Optional[Path] = typer.Argument(None, help="Source video file"),
     pdf: Optional[Path] = typer.Argument(None, help="Matching PDF transcript"),
-    band: int = typer.Option(10, help="DTW radius for PDF alignment"),
+    band: int = typer.Option(100, help="DTW drift margin for PDF alignment"),
 ) -> None:
     """Prepare ``segments.txt`` from *video* and *pdf* if present."""
     if video is None:
@@ -606,9 +815,14 @@ def build_video(
     fade_duration: float = 0.25,
     hold_duration: float = 0.1,
     srt_file: Optional[str] = None,
+    jobs: Optional[int] = None,
+    reencode: Optional[bool] = None,
 ) -> None:
     """Cut clips from *video* and concatenate them."""
-    video_editing.clip_segments(str(video), str(segments), out_dir, srt_file)
+    from .core import video_editing, crossfader
+    video_editing.clip_segments(
+        str(video), str(segments), out_dir, srt_file, jobs=jobs, reencode=reencode
+    )
     if dip_news:
         crossfader.concat_with_dip(
             out_dir, output, dip_color="#EEEEEE", fade_dur=0.33, hold_dur=0.15
@@ -637,6 +851,8 @@ def build(
     fade_duration: float = 0.25,
     hold_duration: float = 0.1,
     srt_file: Optional[str] = None,
+    jobs: Optional[int] = None,
+    reencode: Optional[bool] = None,
 ) -> None:
     """Clip segments and build the final video."""
     if video is None:
@@ -655,12 +871,15 @@ def build(
         fade_duration=fade_duration,
         hold_duration=hold_duration,
         srt_file=srt_file,
+        jobs=jobs,
+        reencode=reencode,
     )
 
 
 @app.command("preview-fades")
 def preview_fades(clips_dir: str = "clips", out_dir: str = "fade_previews") -> None:
     """Generate crossfade preview videos between the first two clips."""
+    from .core import crossfade_preview
     crossfade_preview.preview_crossfades(clips_dir, out_dir)
 
 
@@ -670,6 +889,7 @@ def authorize(
     output: str = "credentials.json",
 ) -> None:
     """Authorize YouTube API access."""
+    from .commands import authorize as authorize_cmd
     authorize_cmd.run_authorization(client_secret, output)
 
 
@@ -677,7 +897,7 @@ def authorize(
 def upload(
     video: str = typer.Argument(..., help="Path to final video"),
     title: str = typer.Option("Untitled Upload", help="Video title"),
-    tags: list[str] = typer.Option(["videocut"], help="List of tags"),
+    tags: list[str] = typer.Option(["videocut"], help="Tags; repeat the option or separate with commas"),
     category: str = typer.Option("22", help="YouTube category ID"),
     privacy: str = typer.Option("unlisted", help="Video privacy status"),
     creds: str = typer.Option(..., help="Path to OAuth credentials JSON"),
@@ -685,11 +905,12 @@ def upload(
     fade: float = typer.Option(0.5, help="Fade duration between segments"),
 ) -> None:
     """Upload a video to YouTube with chapter markers."""
+    from .commands import upload as upload_cmd
     description = upload_cmd.build_description_from_segments(segments, fade)
     upload_cmd.upload_video_to_youtube(
         video_path=video,
         title=title,
-        tags=tags,
+        tags=upload_cmd.split_tags(tags),
         category_id=category,
         privacy_status=privacy,
         creds_file=creds,
@@ -707,47 +928,84 @@ def pipeline(
         None, help="Speaker embedding database JSON"
     ),
     pdf: Optional[str] = typer.Option(None, help="Official PDF transcript"),
+    force: bool = False,
+    force_transcribe: bool = False,
 ):
-    """Run the full board‑meeting pipeline."""
-    use_pdf = isinstance(pdf, str) and pdf
-    if use_pdf:
-        if isinstance(speaker_db, str) and speaker_db:
-            transcription.transcribe(video, hf_token, True, speaker_db, True, pdf)
-        else:
-            transcription.transcribe(video, hf_token, True, pdf_path=pdf)
+    """Run the full board‑meeting pipeline.
+
+    Stages whose outputs are newer than their inputs are skipped, so a
+    re-run only redoes work downstream of what changed.  Pass ``--force``
+    to run every stage, or ``--force-transcribe`` to redo transcription
+    (and so everything after it) even though ``<stem>.json`` is current.
+    ``<stem>.json`` ends up with the recognized speaker names; the unmapped
+    transcript is kept as ``<stem>.raw.json`` for later remaps.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from .core import transcription, nicholson, chair, segmentation, video_editing, annotation, clip_transcripts
+    # only pass the optional inputs that were given
+    extra = {}
+    if isinstance(speaker_db, str) and speaker_db:
+        extra["speaker_db"] = speaker_db
+    if isinstance(pdf, str) and pdf:
+        extra["pdf_path"] = pdf
+    json_file = f"{Path(video).stem}.json"
+    # names are written back into json_file, so remaps start from this copy
+    raw_file = f"{Path(video).stem}.raw.json"
+    if not (force or force_transcribe) and _up_to_date(json_file, video, *extra.values()):
+        print(f"⏭️  {json_file} is up to date – skipping transcription")
+    else:
+        transcription.transcribe(video, hf_token, True, **extra)
+        shutil.copyfile(json_file, raw_file)
+    # transcripts from before the raw copy existed are read as they are
+    source = raw_file if Path(raw_file).exists() else json_file
+
+    roster = ("board_members.txt", nicholson.BOARD_FILE, nicholson.PEOPLE_FILE)
+    if not force and all(
+        _up_to_date(out, source, *roster) for out in ("markup_guide.txt", "segments.txt")
+    ):
+        print("⏭️  segments.txt is up to date – skipping speaker mapping")
     else:
-        if isinstance(speaker_db, str) and speaker_db:
-            transcription.transcribe(video, hf_token, True, speaker_db)
+        # parse the diarized transcript once and hand it to every step
+        data = _loads(Path(source).read_bytes())
+        roll = chair.parse_roll_call(data)
+        _write_json("roll_call_map.json", roll)
+        ids = nicholson.map_recognized_auto(data, roll_map=roll)
+        _write_json("recognized_map.json", ids)
+
+        # Apply recognized names to the JSON and regenerate markup guide
+        named = nicholson.apply_name_map_json(data, ids, json_file)
+        segmentation.json_to_markup(named, "markup_guide.txt")
+
+        with _temp_json(Path("segments.txt")) as tmp_json:
+            nicholson.identify_segments(
+                json_file,
+                ids,
+                tmp_json,
+                "board_members.txt",
+                compact=True,
+                data=named,
+            )
+            segmentation.segments_json_to_txt(named, tmp_json, "segments.txt")
+    # The render is one long ffmpeg run; write the text outputs while it goes.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        render = None
+        if not force and _up_to_date("final_video.mp4", video, "segments.txt"):
+            print("⏭️  final_video.mp4 is up to date – skipping render")
         else:
-            transcription.transcribe(video, hf_token, True)
-
-    json_file = f"{Path(video).stem}.json"
-    ids = nicholson.map_recognized_auto(json_file)
-    Path("recognized_map.json").write_text(json.dumps(ids, indent=2))
-    roll = chair.parse_roll_call(json_file)
-    Path("roll_call_map.json").write_text(json.dumps(roll, indent=2))
-
-    # Apply recognized names to the JSON and regenerate markup guide
-    nicholson.apply_name_map_json(json_file, "recognized_map.json", json_file)
-    segmentation.json_to_markup(json_file, "markup_guide.txt")
-
-    tmp_json = "segments.json"
-    nicholson.identify_segments(
-        json_file,
-        "recognized_map.json",
-        tmp_json,
-        "board_members.txt",
-    )
-    segmentation.segments_json_to_txt(tmp_json, "segments.txt")
-    Path(tmp_json).unlink(missing_ok=True)
-    video_editing.generate_and_align(video, "segments.txt", "clips")
-    video_editing.concatenate_clips("clips", "final_video.mp4")
-    annotation.annotate_segments(
-        "markup_guide.txt", "segments.txt", "markup_with_markers.txt"
-    )
-    clip_transcripts.clip_transcripts(
-        "markup_guide.txt", "segments.txt", "clip_transcripts.txt"
-    )
+            render = pool.submit(
+                video_editing.generate_and_concatenate,
+                video,
+                "segments.txt",
+                "final_video.mp4",
+            )
+        annotation.annotate_segments(
+            "markup_guide.txt", "segments.txt", "markup_with_markers.txt"
+        )
+        clip_transcripts.clip_transcripts(
+            "markup_guide.txt", "segments.txt", "clip_transcripts.txt"
+        )
+        if render is not None:
+            render.result()
 
 
 def main() -> None:
@@ -1,12 +1,36 @@
 import os
+from google.auth.exceptions import RefreshError
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
 SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
 
+def _refresh_saved(output_path):
+    """Return True if *output_path* holds usable credentials, refreshing them if expired."""
+    try:
+        creds = Credentials.from_authorized_user_file(output_path, SCOPES)
+    except ValueError:
+        return False
+    if creds.valid:
+        return True
+    if not (creds.expired and creds.refresh_token):
+        return False
+    try:
+        creds.refresh(Request())
+    except RefreshError:
+        return False
+    with open(output_path, "w") as token:
+        token.write(creds.to_json())
+    print(f"[✓] Refreshed access token in {output_path}")
+    return True
+
 def run_authorization(client_secret_path="client_secret.json", output_path="credentials.json"):
     if os.path.exists(output_path):
-        print(f"[✓] {output_path} already exists.")
-        return
+        if _refresh_saved(output_path):
+            print(f"[✓] {output_path} already exists.")
+            return
+        print(f"[!] {output_path} has no usable token – re-authorizing.")
 
     if not os.path.exists(client_secret_path):
         print(f"[✗] Missing {client_secret_path}. Download it from Google Cloud Console.")
@@ -1,45 +1,64 @@
+import functools
 import os
 import re
-from datetime import timedelta
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 from google.oauth2.credentials import Credentials
 
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
 
-def parse_segments_for_chapters(segments_file: str, fade_duration: float = 0.5):
-    with open(segments_file, 'r') as f:
-        lines = [line.rstrip() for line in f.readlines()]
 
+_CHAPTER_RE = re.compile(r"\s*\[(\d+):(\d+)-(\d+):(\d+)\]\s+(.+?):\s+(.*)")
+
+def parse_segments_for_chapters(segments_file: str, fade_duration: float = 0.5):
     chapters = []
     current_time = 0.0
     in_segment = False
-    pattern = re.compile(r"\[(\d+):(\d+)-(\d+):(\d+)\]\s+(.+?):\s+(.*)")
 
-    for line in lines:
-        if line.strip() == "=START=":
-            in_segment = True
-        elif line.strip() == "=END=":
-            in_segment = False
-        elif in_segment and line.startswith("\t") and pattern.search(line):
-            sm, ss, em, es, speaker, text = pattern.search(line).groups()
-            seg_duration = (int(em)*60 + int(es)) - (int(sm)*60 + int(ss))
-            timestamp = seconds_to_timestamp(current_time)
-            title = f"{speaker.strip()}: {text.strip()}"
-            chapters.append((timestamp, title))
-            current_time += seg_duration + fade_duration
+    with open(segments_file, 'r') as f:
+        for line in f:
+            line = line.rstrip()
+            first = line[:1]
+            # one look at the first character routes the line
+            if first == "=":
+                if line == "=START=":
+                    in_segment = True
+                elif line == "=END=":
+                    in_segment = False
+            elif in_segment and first == "\t":
+                m = _CHAPTER_RE.match(line, 1)
+                if not m:
+                    continue
+                sm, ss, em, es, speaker, text = m.groups()
+                seg_duration = (int(em)*60 + int(es)) - (int(sm)*60 + int(ss))
+                timestamp = seconds_to_timestamp(current_time)
+                title = f"{speaker.strip()}: {text.strip()}"
+                chapters.append((timestamp, title))
+                current_time += seg_duration + fade_duration
 
     return chapters
 
 def seconds_to_timestamp(seconds: float) -> str:
-    td = timedelta(seconds=int(seconds))
-    minutes = td.seconds // 60
-    seconds = td.seconds % 60
-    return f"{minutes:02d}:{seconds:02d}"
+    # integer-only equivalent of timedelta(seconds=int(seconds)).seconds
+    t = int(seconds) % 86400
+    return f"{t // 60:02d}:{t % 60:02d}"
 
-def build_description_from_segments(segments_file: str, fade_duration: float = 0.5):
-    chapters = parse_segments_for_chapters(segments_file, fade_duration)
+@functools.lru_cache(maxsize=8)
+def _cached_description(path: str, mtime_ns: int, size: int, fade_duration: float) -> str:
+    chapters = parse_segments_for_chapters(path, fade_duration)
     return "\n".join(f"{ts} {title}" for ts, title in chapters)
 
+def build_description_from_segments(segments_file: str, fade_duration: float = 0.5):
+    # keyed on mtime and size so an edited segments file is parsed again
+    st = os.stat(segments_file)
+    return _cached_description(
+        os.path.realpath(segments_file), st.st_mtime_ns, st.st_size, fade_duration
+    )
+
+def split_tags(tags) -> list[str]:
+    """Return tags from repeated options and/or comma-separated values."""
+    return [t.strip() for item in tags for t in item.split(",") if t.strip()]
+
 def upload_video_to_youtube(video_path, title, tags, category_id, privacy_status, creds_file, description):
     creds = Credentials.from_authorized_user_file(creds_file)
     youtube = build("youtube", "v3", credentials=creds)
@@ -56,9 +75,17 @@ def upload_video_to_youtube(video_path, title, tags, category_id, privacy_status
         }
     }
 
-    media = MediaFileUpload(video_path, chunksize=-1, resumable=True)
+    # fixed-size chunks keep memory bounded and let a failed chunk be retried
+    # (with googleapiclient's exponential backoff) instead of the whole file
+    media = MediaFileUpload(
+        video_path, chunksize=UPLOAD_CHUNK_SIZE, resumable=True, mimetype="video/mp4"
+    )
 
     print("[⏳] Uploading video...")
     request = youtube.videos().insert(part="snippet,status", body=body, media_body=media)
-    response = request.execute()
+    response = None
+    while response is None:
+        status, response = request.next_chunk(num_retries=5)
+        if status:
+            print(f"[⏳] {int(status.progress() * 100)}%")
     print(f"[✅] Video uploaded: https://www.youtube.com/watch?v={response['id']}")
@@ -1,23 +1,5 @@
 """Core video processing utilities package."""
 
-from . import (
-    transcription,
-    segmentation,
-    video_editing,
-    nicholson,
-    annotation,
-    clip_transcripts,
-    alignment,
-    dtw_align,
-    concat,
-    concat_dip,
-    crossfader,
-    speaker_mapping,
-    chair,
-    pdf_utils,
-    crossfade_preview,
-)
-
 __all__ = [
     "transcription",
     "annotation",
@@ -26,7 +8,12 @@ __all__ = [
     "video_editing",
     "nicholson",
     "alignment",
+    "align",
     "dtw_align",
+    "srt_markers",
+    "label_fix",
+    "convert",
+    "schemas",
     "concat",
     "concat_dip",
     "crossfader",
@@ -35,3 +22,14 @@ __all__ = [
     "pdf_utils",
     "crossfade_preview",
 ]
+
+
+def __getattr__(name: str):
+    """Import submodules on first access so the CLI only loads what it runs."""
+    if name in __all__:
+        import importlib
+
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,172 @@
+"""Shared JSON loading and writing for the core modules.
+
+:func:`load_json` keeps recently parsed files in memory, keyed by path,
+modification time and size, so one pipeline run parses the diarized
+transcript once instead of once per step.  The cached objects are shared
+between callers and must be treated as read-only; use :func:`read_json`
+when the data is going to be modified.
+
+:func:`read_json` and :func:`write_json` treat ``"-"`` as stdin/stdout so
+small commands can be chained in a shell pipe without temporary files.
+:func:`quiet_output` silences progress text for ``--quiet`` while keeping
+that JSON on stdout.
+"""
+from __future__ import annotations
+import contextlib
+import functools
+import json
+import mmap
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+try:  # orjson parses the raw bytes without decoding to str first
+    import orjson
+
+    def _parse(raw: bytes):
+        return orjson.loads(raw)
+
+    def _parse_file(path: str | Path):
+        # map the file instead of copying it into a bytes object first;
+        # multi-hour diarized transcripts run to hundreds of MiB
+        with open(path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return orjson.loads(b"")
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+
+    def _serialize(obj, compact: bool = False) -> bytes:
+        if compact:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    def _parse(raw: bytes):
+        return json.loads(raw)
+
+    def _parse_file(path: str | Path):
+        return json.loads(Path(path).read_bytes())
+
+    def _serialize(obj, compact: bool = False) -> bytes:
+        if compact:
+            return json.dumps(obj, separators=(",", ":")).encode() + b"\n"
+        return json.dumps(obj, indent=2).encode()
+
+try:  # optional: incremental parsing for single-pass scans of huge files
+    import ijson as _ijson
+except ModuleNotFoundError:  # pragma: no cover - full parse fallback
+    _ijson = None
+
+
+def read_json(path: str | Path):
+    """Parse *path* (``"-"`` for stdin) into a fresh object the caller may modify."""
+    if path == "-":
+        return _parse(sys.stdin.buffer.read())
+    return _parse_file(path)
+
+
+def write_json(path: str | Path, obj, compact: bool = False) -> None:
+    """Write *obj* indented by two spaces to *path* (``"-"`` for stdout).
+
+    Set ``compact`` for intermediate files that are only read back by code.
+    """
+    if path == "-":
+        out = _data_stream or sys.stdout
+        data = _serialize(obj) + b"\n"
+        buf = getattr(out, "buffer", None)
+        if buf is None:  # text-only stream, e.g. captured output
+            out.write(data.decode())
+        else:
+            buf.write(data)
+        out.flush()
+        return
+    Path(path).write_bytes(_serialize(obj, compact))
+
+
+def status_stream(path: str | Path):
+    """Return the stream for progress messages so they never mix with JSON on stdout."""
+    return sys.stderr if path == "-" else sys.stdout
+
+
+# Set by quiet_output(): where JSON for "-" still goes, and whether
+# subprocess chatter should be dropped.
+_data_stream = None
+_quiet = False
+
+
+@contextlib.contextmanager
+def quiet_output():
+    """Discard progress printed to stdout, by us and by tools we spawn.
+
+    Entered once around a whole command, before any worker threads start.
+    :func:`write_json` keeps writing ``"-"`` to the real stdout, and
+    :func:`tool_stdout` tells subprocess calls to discard their output.
+    """
+    global _data_stream, _quiet
+    real = sys.stdout
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        _data_stream, _quiet = real, True
+        try:
+            yield
+        finally:
+            _data_stream, _quiet = None, False
+
+
+def tool_stdout():
+    """Return the ``stdout=`` argument for chatty subprocesses (whisper, whisperx)."""
+    return subprocess.DEVNULL if _quiet else None
+
+
+@functools.lru_cache(maxsize=8)
+def _load(path: str, mtime_ns: int, size: int):
+    return read_json(path)
+
+
+def load_json(path: str | Path):
+    """Return the parsed contents of *path*, reusing an earlier parse if unchanged."""
+    st = os.stat(path)
+    return _load(os.fspath(Path(path).resolve()), st.st_mtime_ns, st.st_size)
+
+
+def iter_segments(src):
+    """Yield the ``segments`` of a diarized transcript one at a time.
+
+    *src* may be a path, parsed data or an iterable of segments.  Paths are
+    streamed with ``ijson`` when it is installed, so single-pass scans never
+    hold the whole transcript; otherwise they go through :func:`load_json`.
+    """
+    if isinstance(src, dict):
+        yield from src["segments"]
+        return
+    if not isinstance(src, (str, os.PathLike)):
+        yield from src
+        return
+    if _ijson is None:
+        yield from load_json(src)["segments"]
+        return
+    with open(src, "rb") as fh:
+        yield from _ijson.items(fh, "segments.item", use_float=True)
+
+
+def load_data(src):
+    """Return *src* if it is already parsed JSON, else :func:`load_json` it.
+
+    Lets one parse of a large transcript be handed to several read-only
+    steps in turn.
+    """
+    if isinstance(src, (dict, list)):
+        return src
+    return load_json(src)
+
+
+__all__ = [
+    "load_json",
+    "load_data",
+    "iter_segments",
+    "read_json",
+    "write_json",
+    "status_stream",
+    "quiet_output",
+    "tool_stdout",
+]
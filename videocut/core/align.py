@@ -4,41 +4,91 @@ Word-level aligner: map PDF utterances (no timestamps) to WhisperX JSON.
 API
 ---
     align_pdf_to_asr(pdf_json, asr_json,
-                     *, window=120, step=30, ratio_thresh=0.15) -> list[dict]
+                     *, window=120, step=30, ratio_thresh=0.15,
+                     chunk_seconds=None) -> list[dict]
 
 Returned list is a copy of the PDF utterances with `start` & `end`
 (float seconds). Lines that fail to align keep start/end = None.
+
+For long recordings pass `chunk_seconds` (e.g. 900): the word stream is cut
+at silences into chunks of roughly that length, each utterance is assigned
+to the chunk sharing the most distinctive words with it, and only that
+chunk's windows are scored.
 """
 
 from __future__ import annotations
 
-import json
+import functools
 import re
 import unicodedata
+from array import array
+from collections import Counter
 from pathlib import Path
-from difflib import SequenceMatcher
 from typing import List, Tuple
 
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from ._jsoncache import read_json
+
 # drop trivial ASR fillers
 _DROP = {"uh", "um", "erm"}
+_PUNCT_RE = re.compile(r"[^\w\s']")
+# silences at least this long (seconds) may end a chunk
+_CHUNK_GAP = 3.0
 
 
+@functools.lru_cache(maxsize=None)
 def _norm(tok: str) -> str:
-    """Lower-case, ASCII-fold, strip punctuation, drop fillers."""
+    """Lower-case, ASCII-fold, strip punctuation, drop fillers.
+
+    Cached: a transcript repeats a few thousand distinct tokens many times.
+    """
     tok = unicodedata.normalize("NFKD", tok).lower()
-    tok = re.sub(r"[^\w\s']", "", tok)
+    tok = _PUNCT_RE.sub("", tok)
     return "" if tok in _DROP else tok
 
 
-def _build_stream(segments) -> List[Tuple[str, float, float]]:
-    """Flatten WhisperX segments \u2192 [(norm_word,start,end)]."""
-    out: List[Tuple[str, float, float]] = []
+def _build_stream(segments) -> Tuple[List[str], array, array]:
+    """Flatten WhisperX segments \u2192 parallel (norm_words, starts, ends)."""
+    words: List[str] = []
+    starts, ends = array("d"), array("d")
     for seg in segments:
         for w in seg["words"]:
             if w["start"] is None or w["end"] is None:
                 continue
-            out.append((_norm(w["word"]), w["start"], w["end"]))
-    return out
+            words.append(_norm(w["word"]))
+            starts.append(w["start"])
+            ends.append(w["end"])
+    return words, starts, ends
+
+
+def _chunk_bounds(starts: array, ends: array, chunk_seconds: float) -> List[Tuple[int, int]]:
+    """Cut the stream at the first silence after every *chunk_seconds*."""
+    bounds: List[Tuple[int, int]] = []
+    lo = 0
+    for i in range(1, len(starts)):
+        if starts[i] - starts[lo] >= chunk_seconds and starts[i] - ends[i - 1] >= _CHUNK_GAP:
+            bounds.append((lo, i))
+            lo = i
+    bounds.append((lo, len(starts)))
+    return bounds
+
+
+def _assign_chunks(queries: List[List[int]], ids: List[int], bounds) -> List[int]:
+    """Return, per query, the chunk sharing the most distinctive tokens.
+
+    Tokens are weighted by the inverse of the number of chunks they occur
+    in, so filler words shared by every chunk don't decide the assignment.
+    """
+    vocabs = [set(ids[lo:hi]) for lo, hi in bounds]
+    df = Counter(t for v in vocabs for t in v)
+    owner = []
+    for q in queries:
+        q = set(q)
+        weights = [sum(1.0 / df[t] for t in q & v) for v in vocabs]
+        owner.append(max(range(len(vocabs)), key=weights.__getitem__))
+    return owner
 
 
 def align_pdf_to_asr(
@@ -47,35 +97,56 @@ def align_pdf_to_asr(
     *,
     window: int = 120,          # words per sliding window
     step: int = 30,             # hop length
-    ratio_thresh: float = 0.15, # SequenceMatcher ratio to accept
+    ratio_thresh: float = 0.15, # similarity ratio (0–1) to accept
+    chunk_seconds: float | None = None,  # score per silence-bounded chunk
 ) -> list[dict]:
     """Align utterances from *pdf_json* to word-level ASR in *asr_json*."""
-    pdf_utts = json.loads(Path(pdf_json).read_text())
-    stream   = _build_stream(
-        json.loads(Path(asr_json).read_text())["segments"]
-    )
-
-    def _best_window(words_norm: list[str]) -> Tuple[float, int]:
-        best = (0.0, -1)  # (ratio, index)
-        limit = max(1, len(stream) - window + 1)
-        for i in range(0, limit, step):
-            cand = [w for w, _, _ in stream[i : i + window]]
-            r = SequenceMatcher(None, words_norm, cand).ratio()
-            if r > best[0]:
-                best = (r, i)
-        return best
+    pdf_utts = read_json(pdf_json)
+    words, w_starts, w_ends = _build_stream(read_json(asr_json)["segments"])
 
-    aligned = []
+    # Score PDF utterances against windows in one C++ call per chunk.  The
+    # token-level Indel ratio matches what SequenceMatcher.ratio() measured,
+    # without its pure-Python matching loop.  score_cutoff lets rapidfuzz
+    # reject a window from its length-based upper bound before the full
+    # comparison; rejected windows score 0, which can never be accepted.
+    # Intern tokens as small ints: rapidfuzz hashes each sequence element,
+    # and ints hash and compare cheaper than strings.
+    vocab: dict[str, int] = {}
+    ids = [vocab.setdefault(w, len(vocab)) for w in words]
+    queries = []
     for utt in pdf_utts:
         # strip speaker label before scoring
         text = utt["text"].split(":", 1)[-1]
-        words_norm = [_norm(t) for t in text.split() if _norm(t)]
-        ratio, idx = _best_window(words_norm)
-        if ratio < ratio_thresh or idx == -1:
+        queries.append([vocab.setdefault(n, len(vocab)) for n in map(_norm, text.split()) if n])
+
+    bounds = _chunk_bounds(w_starts, w_ends, chunk_seconds) if chunk_seconds else [(0, len(ids))]
+    owner = _assign_chunks(queries, ids, bounds) if len(bounds) > 1 else [0] * len(queries)
+
+    best: list[Tuple[float, int, int]] = [(0.0, 0, 0)] * len(queries)
+    for c, (lo, hi) in enumerate(bounds):
+        rows = [i for i, o in enumerate(owner) if o == c]
+        if not rows:
+            continue
+        starts = list(range(lo, max(lo + 1, hi - window + 1), step))
+        scores = process.cdist(
+            [queries[i] for i in rows],
+            [ids[i : min(i + window, hi)] for i in starts],
+            scorer=fuzz.ratio,
+            score_cutoff=ratio_thresh * 100.0,
+            dtype=np.float32,
+            workers=-1,
+        )
+        for i, row in zip(rows, scores):
+            b = int(row.argmax())  # first window wins ties, as before
+            first = starts[b]
+            best[i] = (float(row[b]) / 100.0, first, min(first + window, hi) - 1)
+
+    aligned = []
+    for utt, (ratio, first, last) in zip(pdf_utts, best):
+        if ratio <= 0.0 or ratio < ratio_thresh:
             aligned.append({**utt, "start": None, "end": None})
             continue
-        slice_ = stream[idx : idx + window]
         aligned.append({**utt,
-                        "start": slice_[0][1],
-                        "end":   slice_[-1][2]})
+                        "start": w_starts[first],
+                        "end":   w_ends[last]})
     return aligned
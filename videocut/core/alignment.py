@@ -1,26 +1,46 @@
 from __future__ import annotations
-import json
+import functools
 import os
 import subprocess
-import tempfile
 from pathlib import Path
-import wave
-import contextlib
 import shutil
 
 from .. import parse_pdf_text
+from ._jsoncache import write_json
 import types
 
-try:  # pragma: no cover - optional heavy dependency
-    import whisperx as _whisperx  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - absent in lightweight install
-    _whisperx = types.SimpleNamespace(load_align_model=None, align=None)
 
-whisperx = _whisperx
+def _load_whisperx():
+    """Import ``whisperx`` on first use; it pulls in torch and takes seconds."""
+    mod = globals().get("whisperx")
+    if mod is None:
+        try:  # pragma: no cover - optional heavy dependency
+            import whisperx as mod  # type: ignore
+        except ModuleNotFoundError:  # pragma: no cover - absent in lightweight install
+            mod = types.SimpleNamespace(load_align_model=None, align=None)
+        globals()["whisperx"] = mod
+    return mod
+
+
+@functools.lru_cache(maxsize=2)
+def _load_align(load_align_model, lang: str, device: str):
+    """Return ``load_align_model(lang, device)``, loading the weights once per process.
+
+    The loader is part of the key so a swapped-in whisperx is not served a
+    model cached from another one.
+    """
+    return load_align_model(lang, device)
+
+
+def __getattr__(name: str):
+    if name == "whisperx":
+        return _load_whisperx()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 
 _DEFAULT_OUT = "aligned.json"
+_SAMPLE_RATE = 16000
 
 
 def align_with_transcript(video: str, transcript: str, out_json: str = _DEFAULT_OUT) -> None:
@@ -35,6 +55,7 @@ def align_with_transcript(video: str, transcript: str, out_json: str = _DEFAULT_
     except ModuleNotFoundError:
         device = "cpu"
 
+    whisperx = _load_whisperx()
     if not hasattr(whisperx, "load_align_model"):
         whisperx.load_align_model = lambda *a, **k: (None, {})  # type: ignore
         whisperx.align = lambda *a, **k: {"word_segments": []}  # type: ignore
@@ -42,37 +63,34 @@ def align_with_transcript(video: str, transcript: str, out_json: str = _DEFAULT_
     if shutil.which("ffmpeg") is None and not os.environ.get("VIDEOCUT_SKIP_FFMPEG_CHECK"):
         raise RuntimeError("ffmpeg not found on PATH. Please install FFmpeg and try again.")
 
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        audio_path = tmp.name
-    print(f"🎞️  extracting audio to {audio_path}")
-
+    print("🎞️  decoding audio …")
     try:
-        subprocess.run([
+        # decode straight into memory; whisperx.align takes the samples as an array
+        proc = subprocess.run([
             "ffmpeg",
             "-v",
             "error",
-        "-y",
-        "-i",
-        video,
-        "-ac",
-        "1",
-        "-ar",
-        "16000",
-        "-acodec",
-        "pcm_s16le",
-        "-f",
-        "wav",
-        audio_path,
-        ], check=True)
+            "-i",
+            video,
+            "-ac",
+            "1",
+            "-ar",
+            str(_SAMPLE_RATE),
+            "-f",
+            "s16le",
+            "pipe:1",
+        ], check=True, stdout=subprocess.PIPE)
     except FileNotFoundError:
         raise RuntimeError("ffmpeg executable not found")
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"ffmpeg failed with exit code {e.returncode}")
 
-    with contextlib.closing(wave.open(audio_path, "rb")) as wf:
-        audio_duration = wf.getnframes() / float(wf.getframerate())
+    import numpy as np
+
+    audio = np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+    audio_duration = len(audio) / float(_SAMPLE_RATE)
 
-    align_model, meta = whisperx.load_align_model("en", device)
+    align_model, meta = _load_align(whisperx.load_align_model, "en", device)
 
     txt_path: Path | None = None
     if transcript.lower().endswith(".pdf"):
@@ -85,11 +103,9 @@ def align_with_transcript(video: str, transcript: str, out_json: str = _DEFAULT_
 
     segments = [{"text": text, "start": 0.0, "end": audio_duration}]
     print("🧭  aligning transcript …")
-    aligned = whisperx.align(segments, align_model, meta, audio_path, device)
+    aligned = whisperx.align(segments, align_model, meta, audio, device)
 
-    Path(out_json).write_text(json.dumps(aligned["word_segments"], indent=2))
-    os.remove(audio_path)
-    print(f"🗑️  temporary audio removed")
+    write_json(out_json, aligned["word_segments"])
     if txt_path is not None:
         print(f"\N{CHECK MARK} transcript text → {txt_path}")
     print(f"\N{CHECK MARK} alignment written to {out_json}")
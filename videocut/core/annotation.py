@@ -4,6 +4,7 @@ import json
 import re
 import sys
 from pathlib import Path
+from typing import Iterable, Iterator
 from . import segmentation
 
 
@@ -16,9 +17,24 @@ _TS_RE = re.compile(r"^\s*\[(?P<start>\d+\.?\d*)[–-](?P<end>\d+\.?\d*)\]")
 
 def load_markup(markup_path: Path) -> list[str]:
     """Return lines from ``markup_path`` or exit if missing."""
+    return list(_iter_markup(markup_path))
+
+
+def _iter_markup(markup_path: Path) -> Iterator[str]:
+    """Return a lazy iterator over lines of ``markup_path`` or exit if missing.
+
+    Used by :func:`annotate_segments` so a long transcript is never held
+    twice, once as text and again as a list.
+    """
     if not markup_path.exists():
         sys.exit(f"❌  '{markup_path}' not found – run --transcribe first.")
-    return markup_path.read_text().splitlines()
+    return _iter_lines(markup_path)
+
+
+def _iter_lines(path: Path) -> Iterator[str]:
+    with path.open() as f:
+        for line in f:
+            yield line.rstrip("\n")
 
 
 def parse_ts(line: str) -> tuple[float, float] | None:
@@ -29,39 +45,49 @@ def parse_ts(line: str) -> tuple[float, float] | None:
     return float(m.group("start")), float(m.group("end"))
 
 
-def annotate(markup_lines: list[str], segments: list[dict]) -> list[str]:
+def annotate(markup_lines: Iterable[str], segments: list[dict]) -> list[str]:
     """Return ``markup_lines`` annotated with ``{START}``/``{END}`` markers."""
+    # format each segment's marker pair once, up front
+    markers = [
+        (seg["start"], seg["end"], f"{START} [{seg['start']:.3f}–{seg['end']:.3f}]",
+         f"{END}   [{seg['start']:.3f}–{seg['end']:.3f}]")
+        for seg in segments
+    ]
+    lines = iter(markup_lines)
     out: list[str] = []
+    if not markers:
+        out.extend(lines)
+        return out
     seg_idx = 0
     saw_start = False
+    match = _TS_RE.match
 
-    for line in markup_lines:
-        ts = parse_ts(line)
-
-        if ts is not None and seg_idx < len(segments):
-            line_start, line_end = ts
-            s = segments[seg_idx]["start"]
-            e = segments[seg_idx]["end"]
+    for line in lines:
+        m = match(line)
+        if m is None:
+            out.append(line)
+            continue
+        line_start, line_end = float(m.group("start")), float(m.group("end"))
+        s, e, start_marker, end_marker = markers[seg_idx]
 
-            if not saw_start and line_start <= s <= line_end:
-                out.append(f"{START} [{s:.3f}–{e:.3f}]")
-                saw_start = True
+        if not saw_start and line_start <= s <= line_end:
+            out.append(start_marker)
+            saw_start = True
 
-            out.append(line)
+        out.append(line)
 
-            if saw_start and line_start <= e <= line_end:
-                out.append(f"{END}   [{s:.3f}–{e:.3f}]")
-                seg_idx += 1
-                saw_start = False
-        else:
-            out.append(line)
+        if saw_start and line_start <= e <= line_end:
+            out.append(end_marker)
+            seg_idx += 1
+            saw_start = False
+            if seg_idx == len(markers):
+                # every segment is placed; the rest of the markup passes through
+                out.extend(lines)
+                break
 
-    while seg_idx < len(segments):
-        s = segments[seg_idx]["start"]
-        e = segments[seg_idx]["end"]
-        out.append(f"{START} [{s:.3f}–{e:.3f}]")
-        out.append(f"{END}   [{s:.3f}–{e:.3f}]")
-        seg_idx += 1
+    for _, _, start_marker, end_marker in markers[seg_idx:]:
+        out.append(start_marker)
+        out.append(end_marker)
 
     return out
 
@@ -78,7 +104,7 @@ def annotate_segments(
 ) -> None:
     """Write ``out_file`` with annotation markers for segments."""
     segments = segmentation.load_segments(seg_file, srt_file)
-    markup = load_markup(Path(markup_file))
+    markup = _iter_markup(Path(markup_file))
     annotated = annotate(markup, segments)
     Path(out_file).write_text("\n".join(annotated))
     print(
@@ -1,8 +1,11 @@
-import json
+from __future__ import annotations
 import re
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict
 
+from ._jsoncache import load_data
+
 # Regex to detect a roll call announcement
 # Regex to detect a roll call announcement
 _ROLL_RE = re.compile(
@@ -26,7 +29,12 @@ _PRESENT_RE = re.compile(r"\b(present|here)\b", re.IGNORECASE)
 
 _SPEAKER_RE = re.compile(r"\[(SPEAKER_\d+)\]")
 
-__all__ = ["identify_chair", "parse_roll_call", "identify_chair_srt"]
+__all__ = [
+    "identify_chair",
+    "parse_roll_call",
+    "identify_chair_and_roll_call",
+    "identify_chair_srt",
+]
 
 _HEURISTICS = [
     (_ROLL_RE, 5),
@@ -35,19 +43,36 @@ _HEURISTICS = [
     (_CHAIR_REPORT_RE, 2),
     (_ANY_OTHER_RE, 1),
 ]
+# All heuristics fused into one alternation so each segment is scanned once;
+# the name of the group that matched (g0, g1, …) indexes _WEIGHTS.
+_CHAIR_RE = re.compile(
+    "|".join(f"(?P<g{i}>{pat.pattern})" for i, (pat, _) in enumerate(_HEURISTICS)),
+    re.IGNORECASE,
+)
+_WEIGHTS = {f"g{i}": weight for i, (_, weight) in enumerate(_HEURISTICS)}
+# Every heuristic contains one of these words; most segments contain none, and
+# a substring test on the lower-cased text is far cheaper than the regex.
+_PREFILTER = ("roll", "motion", "moving on", "chair", "other")
+
 
+def identify_chair(diarized_json: str | dict) -> str:
+    """Return the diarized speaker ID most likely acting as chair.
 
-def identify_chair(diarized_json: str) -> str:
-    """Return the diarized speaker ID most likely acting as chair."""
-    data = json.loads(Path(diarized_json).read_text())
+    *diarized_json* may be a path or the already parsed transcript.
+    """
+    data = load_data(diarized_json)
     segments = data.get("segments", [])
-    scores: Dict[str, int] = {}
+    scores: Dict[str, int] = defaultdict(int)
+    finditer, weights = _CHAIR_RE.finditer, _WEIGHTS  # bound once for the loop
     for seg in segments:
         text = seg.get("text", "")
-        speaker = seg.get("speaker")
-        for pat, weight in _HEURISTICS:
-            if pat.search(text):
-                scores[speaker] = scores.get(speaker, 0) + weight
+        lowered = text.lower()
+        if not any(word in lowered for word in _PREFILTER):
+            continue
+        # each heuristic still counts at most once per segment
+        hits = {m.lastgroup for m in finditer(text)}
+        if hits:
+            scores[seg.get("speaker")] += sum(weights[g] for g in hits)
     if scores:
         return max(scores.items(), key=lambda kv: kv[1])[0]
     # Fallback: look for a name/present pair to infer the chair
@@ -61,9 +86,12 @@ def identify_chair(diarized_json: str) -> str:
     raise RuntimeError("No roll call detected – unable to identify chair")
 
 
-def parse_roll_call(diarized_json: str) -> Dict[str, str]:
-    """Return mapping of names to diarized speaker IDs from the roll call."""
-    data = json.loads(Path(diarized_json).read_text())
+def parse_roll_call(diarized_json: str | dict) -> Dict[str, str]:
+    """Return mapping of names to diarized speaker IDs from the roll call.
+
+    *diarized_json* may be a path or the already parsed transcript.
+    """
+    data = load_data(diarized_json)
     segments = data.get("segments", [])
     votes: Dict[str, str] = {}
     chair_id = None
@@ -71,7 +99,10 @@ def parse_roll_call(diarized_json: str) -> Dict[str, str]:
     # locate roll call or infer from first name/present pair
     while i < len(segments):
         text = segments[i].get("text", "")
-        if _ROLL_RE.search(text) or _MOTION_RE.search(text):
+        lowered = text.lower()
+        if ("roll" in lowered or "motion" in lowered) and (
+            _ROLL_RE.search(text) or _MOTION_RE.search(text)
+        ):
             chair_id = segments[i].get("speaker")
             i += 1
             break
@@ -99,12 +130,21 @@ def parse_roll_call(diarized_json: str) -> Dict[str, str]:
                 votes[name] = segments[j].get("speaker")
             i = j
             continue
-        elif _ROLL_RE.search(text):
+        elif "roll" in text.lower() and _ROLL_RE.search(text):
             break
         i += 1
     return votes
 
 
+def identify_chair_and_roll_call(diarized_json: str | dict) -> tuple[str, Dict[str, str]]:
+    """Return the chair's speaker ID and the roll call map from one parse.
+
+    *diarized_json* may be a path or the already parsed transcript.
+    """
+    data = load_data(diarized_json)
+    return identify_chair(data), parse_roll_call(data)
+
+
 def identify_chair_srt(srt_file: str) -> str:
     """Return the speaker tag that calls the roll in an SRT file."""
     for line in Path(srt_file).read_text().splitlines():
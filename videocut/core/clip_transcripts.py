@@ -1,5 +1,7 @@
 """Utilities for summarizing kept clip transcripts."""
 from __future__ import annotations
+import bisect
+import itertools
 import json
 import re
 from pathlib import Path
@@ -30,28 +32,41 @@ def clip_transcripts(
 ) -> None:
     """Write ``out_file`` listing transcript snippets for kept clips."""
     segments = segmentation.load_segments(seg_file, srt_file)
-    lines = Path(markup_file).read_text().splitlines()
-    entries = [e for l in lines if (e := parse_line(l))]
+    with open(markup_file) as f:  # parse while reading; never hold the raw text
+        entries = [e for l in f if (e := parse_line(l))]
+    # markup is chronological, so this stable sort normally changes nothing
+    entries.sort(key=lambda ent: ent["start"])
+    starts = [ent["start"] for ent in entries]
+    # the running maximum of end times never decreases, so bisecting it finds
+    # the first entry that can still overlap a clip's start
+    reach = list(itertools.accumulate((ent["end"] for ent in entries), max))
 
     clips = []
     for seg in segments:
         s, e = seg["start"], seg["end"]
-        clip_entries = [ent for ent in entries if not (ent["end"] < s or ent["start"] > e)]
+        lo = bisect.bisect_left(reach, s)
+        hi = bisect.bisect_right(starts, e)
+        clip_entries = [ent for ent in entries[lo:hi] if ent["end"] >= s]
         full_text = " ".join(ent["text"] for ent in clip_entries)
         if len(full_text.split()) < 8:
             continue
         clips.append({"start": s, "end": e, "transcript": clip_entries})
 
     output_path = Path(out_file)
-    with output_path.open("w") as out:
-        for i, clip in enumerate(clips):
-            out.write(f"=== Clip {i+1} ===\n")
-            out.write(f"Start: {clip['start']:.2f} seconds\n")
-            out.write(f"End:   {clip['end']:.2f} seconds\n")
-            out.write("Transcript:\n")
-            for entry in clip["transcript"]:
-                out.write(f"  [{entry['start']:.2f}–{entry['end']:.2f}] {entry['text']}\n")
-            out.write("\n")
+    buf: list[str] = []
+    for i, clip in enumerate(clips):
+        buf.append(
+            f"=== Clip {i+1} ===\n"
+            f"Start: {clip['start']:.2f} seconds\n"
+            f"End:   {clip['end']:.2f} seconds\n"
+            "Transcript:\n"
+        )
+        buf.extend(
+            f"  [{entry['start']:.2f}–{entry['end']:.2f}] {entry['text']}\n"
+            for entry in clip["transcript"]
+        )
+        buf.append("\n")
+    output_path.write_text("".join(buf))  # one write instead of one per line
     print(f"✅  Wrote {len(clips)} long clip transcripts to {output_path}")
 
 
@@ -1,14 +1,17 @@
 """Concatenate clips with optional dip-to-color transitions."""
 from __future__ import annotations
 
-from pathlib import Path
 import subprocess
 
 from . import video_editing
 
 
 def concat_default(clips_dir: str, output_path: str) -> None:
-    """Concatenate using the standard white-flash transitions."""
+    """Concatenate using the standard white-flash transitions.
+
+    Clips that share codec parameters are joined with the concat demuxer
+    without re-encoding; see :func:`video_editing.concatenate_clips`.
+    """
     video_editing.concatenate_clips(clips_dir, output_path)
 
 
@@ -24,7 +27,7 @@ def concat_with_dip(
     if dip_color.startswith("#"):
         dip_color = "0x" + dip_color[1:]
 
-    clips = sorted(Path(clips_dir).glob("clip_*.mp4"))
+    clips = video_editing._list_clips(clips_dir)
     if len(clips) < 2:
         raise ValueError("At least two clips are required for dip transition.")
 
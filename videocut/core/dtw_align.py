@@ -7,7 +7,8 @@ and
 Every PDF word inherits the nearest SRT word-timestamp, then each PDF
 sentence receives   start = first-word-time   and   end = last-word-time.
 
-The DTW is constrained to a ±B tokens band (B≈100) so complexity is O(N·B).
+The DTW is constrained to a corridor between words that occur exactly once
+in both texts, widened by ±B tokens (B≈100), so complexity is O(N·B + M).
 
 Public entry
 ------------
@@ -15,21 +16,23 @@ Public entry
 """
 
 from __future__ import annotations
-import re, unicodedata
+import bisect, mmap, os, re, unicodedata
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 import numpy as np
-# Re-implement fast DTW style alignment without external deps.
 
 # ---------------------------------------------------------------------
 def _norm(tok: str) -> str:
     tok = unicodedata.normalize("NFKD", tok).lower()
     return re.sub(r"[^\w']", "", tok)
 
-def _tokenize_lines(pdf_txt: str) -> Tuple[List[str], List[Tuple[int, int]], List[str]]:
-    """Tokenize ``pdf_txt`` by line preserving exact text and bounds."""
+def _tokenize_lines(pdf_txt: str | Iterable[str]) -> Tuple[List[str], List[Tuple[int, int]], List[str]]:
+    """Tokenize ``pdf_txt`` (text or an iterable of lines) by line
+    preserving exact text and bounds."""
 
-    lines = [ln.strip() for ln in pdf_txt.splitlines()]
+    if isinstance(pdf_txt, str):
+        pdf_txt = pdf_txt.splitlines()
+    lines = [ln.strip() for ln in pdf_txt]
     norm_tokens: List[str] = []
     bounds: List[Tuple[int, int]] = []
 
@@ -47,15 +50,37 @@ def _tokenize_lines(pdf_txt: str) -> Tuple[List[str], List[Tuple[int, int]], Lis
 
     return norm_tokens, bounds, lines
 
-def _parse_srt(path: str | Path):
-    pat = re.compile(
-        r"\d+\s+(\d{2}:\d{2}:\d{2}),(\d{3})\s+-->\s+"
-        r"(\d{2}:\d{2}:\d{2}),(\d{3})\s+(.+?)(?=\n\d+\n|\Z)", re.S)
+_SRT_RE = re.compile(
+    rb"\d+\s+(\d{2}:\d{2}:\d{2}),(\d{3})\s+-->\s+"
+    rb"(\d{2}:\d{2}:\d{2}),(\d{3})\s+(.+?)(?=\r?\n\d+\r?\n|\Z)", re.S)
+
+def _pdf_lines(pdf_txt: str | Path | bytes | memoryview):
+    """Yield the lines of a PDF text file or of its raw bytes."""
+    if isinstance(pdf_txt, (bytes, bytearray, memoryview)):
+        yield from bytes(pdf_txt).decode("utf-8").splitlines()
+        return
+    with open(pdf_txt) as fh:
+        for raw in fh:
+            yield from raw.splitlines()
+
+def _parse_srt(src: str | Path | bytes | memoryview):
+    """Return SRT word tokens and their times from a path or raw bytes.
+
+    Files are memory-mapped and scanned with a bytes regex, so only the
+    caption bodies are ever decoded.
+    """
+    if not isinstance(src, (bytes, bytearray, memoryview, mmap.mmap)):
+        with open(src, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return _parse_srt(b"")
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _parse_srt(mm)
     tokens, times = [], []
-    for hh1, ms1, hh2, ms2, body in pat.findall(Path(path).read_text()):
-        st = _hms_to_sec(hh1) + int(ms1) / 1000
-        et = _hms_to_sec(hh2) + int(ms2) / 1000
-        text = " ".join(body.strip().splitlines())
+    for m in _SRT_RE.finditer(src):
+        hh1, ms1, hh2, ms2, body = m.groups()
+        st = _hms_to_sec(hh1.decode()) + int(ms1) / 1000
+        et = _hms_to_sec(hh2.decode()) + int(ms2) / 1000
+        text = " ".join(body.decode("utf-8").strip().splitlines())
         toks = [_norm(t) for t in text.split() if _norm(t)]
         if not toks:
             continue
@@ -73,64 +98,165 @@ def _hms_to_sec(hms: str) -> float:
     h, m, s = map(int, hms.split(":"))
     return h*3600 + m*60 + s
 
+# Path costs are whole mismatch counts, which float32 holds exactly up to
+# 2**24 – far beyond any transcript – at half the memory traffic of float64.
+_COST_DTYPE = np.float32
+
 # ---------------------------------------------------------------------
-def _reduce_by_half(seq: List[str]) -> List[str]:
-    """Return every other element of ``seq`` used by FastDTW."""
-
-    if len(seq) <= 1:
-        return seq[:]
-    return [seq[0]] + [seq[i] for i in range(2, len(seq), 2)]
-
-
-def _expand_window(path: List[tuple[int, int]], m: int, n: int, radius: int) -> dict[int, tuple[int, int]]:
-    """Expand a low-resolution path into a search window for higher resolution."""
-
-    window: dict[int, list[int]] = {}
-    for i, j in path:
-        for di in range(-radius, radius + 1):
-            for dj in range(-radius, radius + 1):
-                ii = i * 2 + di
-                jj = j * 2 + dj
-                if 0 <= ii < m and 0 <= jj < n:
-                    if ii not in window:
-                        window[ii] = [jj, jj]
-                    else:
-                        window[ii][0] = min(window[ii][0], jj)
-                        window[ii][1] = max(window[ii][1], jj)
+def _fill_band_numpy(src_ids, ref_ids, los, his, offs):
+    """Fill the banded DTW cost rows one at a time with NumPy.
+
+    Row ``i`` covers columns ``los[i]..his[i]`` and is stored flat at
+    ``offs[i]:offs[i+1]``, so ragged rows take only the space they need.
+    """
+    m = src_ids.size
+    inf = np.inf
+    cost = np.full(offs[-1], inf, dtype=_COST_DTYPE)
     for i in range(m):
-        if i not in window:
-            window[i] = [0, n - 1]
-    return {i: (rng[0], rng[1]) for i, rng in window.items()}
-
-
-def _dtw_window(src: List[str], ref: List[str], window: dict[int, tuple[int, int]] | None, dist) -> tuple[float, list[tuple[int, int]]]:
-    """Standard DTW with an optional constraint window."""
-
+        lo, hi = los[i], his[i]
+        local = (ref_ids[lo : hi + 1] != src_ids[i]).astype(_COST_DTYPE)
+        if i == 0:
+            best_prev = np.full(local.size, inf, dtype=_COST_DTYPE)
+            if lo == 0:
+                best_prev[0] = 0.0
+        else:
+            plo, phi = los[i - 1], his[i - 1]
+            prow = cost[offs[i - 1] : offs[i]]
+            prev = np.full(hi - lo + 2, inf, dtype=_COST_DTYPE)  # columns lo-1 .. hi
+            a0, a1 = max(plo, lo - 1), min(phi, hi)
+            if a0 <= a1:
+                prev[a0 - lo + 1 : a1 - lo + 2] = prow[a0 - plo : a1 - plo + 1]
+            best_prev = np.minimum(prev[1:], prev[:-1])  # up, diagonal
+        # c[j] = local[j] + min(best_prev[j], c[j-1])
+        csum = np.cumsum(local)
+        cost[offs[i] : offs[i + 1]] = csum + np.minimum.accumulate(best_prev - csum + local)
+    return cost
+
+
+def _fill_band_loops(src_ids, ref_ids, los, his, offs):
+    """Fill the banded DTW cost rows with plain loops (compiled by Numba)."""
+    m = src_ids.size
+    inf = np.inf
+    cost = np.full(offs[-1], inf, dtype=_COST_DTYPE)
+    for i in range(m):
+        lo, hi = los[i], his[i]
+        for j in range(lo, hi + 1):
+            best = inf
+            if i == 0:
+                if j == 0:
+                    best = 0.0
+            else:
+                plo, phi = los[i - 1], his[i - 1]
+                if plo <= j <= phi:
+                    best = min(best, cost[offs[i - 1] + j - plo])
+                if plo <= j - 1 <= phi:
+                    best = min(best, cost[offs[i - 1] + j - 1 - plo])
+            if j > lo:
+                best = min(best, cost[offs[i] + j - 1 - lo])
+            cost[offs[i] + j - lo] = best + (0.0 if src_ids[i] == ref_ids[j] else 1.0)
+    return cost
+
+
+try:  # pragma: no cover - optional accelerator
+    import numba
+except ModuleNotFoundError:  # pragma: no cover - NumPy rows are the default
+    _fill_band = _fill_band_numpy
+else:  # pragma: no cover - only when numba is installed
+    _fill_band = numba.njit(cache=True)(_fill_band_loops)
+
+
+def _anchors(src_ids: np.ndarray, ref_ids: np.ndarray) -> list[tuple[int, int]]:
+    """Return ``(i, j)`` pairs of tokens that occur exactly once on each side.
+
+    Only the longest chain increasing in both ``i`` and ``j`` is kept, so a
+    stray repeat of a rare word elsewhere in the other text is dropped.
+    """
+    size = int(max(src_ids.max(), ref_ids.max())) + 1
+    once = (np.bincount(src_ids, minlength=size) == 1) & (np.bincount(ref_ids, minlength=size) == 1)
+    src_at = np.flatnonzero(once[src_ids])
+    ref_pos = np.empty(size, dtype=np.int64)
+    ref_pos[ref_ids] = np.arange(ref_ids.size)
+    pairs = [(int(i), int(ref_pos[src_ids[i]])) for i in src_at]
+
+    # longest increasing subsequence of j (pairs are already sorted by i)
+    tails: list[int] = []
+    tail_idx: list[int] = []
+    parent = [-1] * len(pairs)
+    for k, (_, j) in enumerate(pairs):
+        pos = bisect.bisect_left(tails, j)
+        if pos == len(tails):
+            tails.append(j)
+            tail_idx.append(k)
+        else:
+            tails[pos] = j
+            tail_idx[pos] = k
+        parent[k] = tail_idx[pos - 1] if pos else -1
+    chain = []
+    k = tail_idx[-1] if tail_idx else -1
+    while k >= 0:
+        chain.append(pairs[k])
+        k = parent[k]
+    chain.reverse()
+    return chain
+
+
+def _corridor(src_ids: np.ndarray, ref_ids: np.ndarray, band: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return per-row column bounds ``(los, his)`` for the banded DTW.
+
+    A path through every anchor from :func:`_anchors` stays, on row ``i``,
+    between the last anchor column above it and the first one below it;
+    *band* tokens of margin on each side absorb a misplaced anchor.
+    """
+    m, n = src_ids.size, ref_ids.size
+    anchors = [(-1, -1), *_anchors(src_ids, ref_ids), (m, n)]
+    rows = np.array([a[0] for a in anchors])
+    cols = np.array([a[1] for a in anchors])
+    i = np.arange(m)
+    before = cols[np.searchsorted(rows, i, side="left") - 1]
+    after = cols[np.searchsorted(rows, i, side="right")]
+    los = np.clip(before - band, 0, n - 1)
+    his = np.clip(after + band, 0, n - 1)
+    return los, his
+
+
+def _banded_dtw(src: List[str], ref: List[str], band: int) -> list[tuple[int, int]]:
+    """Exact DTW path between *src* and *ref* inside an anchored corridor.
+
+    Row ``i`` only considers the columns :func:`_corridor` allows – those
+    between the neighbouring unique-word anchors, plus ``band`` tokens of
+    margin – and rows are stored ragged, so memory is ``O(m·band + n)``
+    however much the two lengths differ.  The table is filled by
+    :func:`_fill_band` – compiled loops when Numba is installed, otherwise
+    row-wise NumPy.
+    """
     m, n = len(src), len(ref)
-    inf = float("inf")
-    dp = np.full((m + 1, n + 1), inf)
-    dp[0, 0] = 0.0
-
-    if window is None:
-        j_ranges = {i: (0, n - 1) for i in range(m)}
-    else:
-        j_ranges = window
-
-    for i in range(1, m + 1):
-        if i - 1 not in j_ranges:
-            continue
-        j_start, j_end = j_ranges[i - 1]
-        j_start = max(0, j_start)
-        j_end = min(n - 1, j_end)
-        for j in range(j_start + 1, j_end + 2):
-            cost = dist(src[i - 1], ref[j - 1])
-            dp[i, j] = cost + min(dp[i - 1, j], dp[i, j - 1], dp[i - 1, j - 1])
+    if m == 0 or n == 0:
+        return []
+
+    vocab: dict[str, int] = {}
+    src_ids = np.array([vocab.setdefault(t, len(vocab)) for t in src], dtype=np.int32)
+    ref_ids = np.array([vocab.setdefault(t, len(vocab)) for t in ref], dtype=np.int32)
+
+    los, his = _corridor(src_ids, ref_ids, band)
+    offs = np.zeros(m + 1, dtype=np.int64)
+    np.cumsum(his - los + 1, out=offs[1:])
+    cost = _fill_band(src_ids, ref_ids, los, his, offs)
+    inf = np.inf
+
+    def _at(i: int, j: int) -> float:
+        """Cost in the 1-indexed DP table with the usual (0, 0) origin."""
+        if i == 0 or j == 0:
+            return 0.0 if i == j == 0 else inf
+        lo, hi = los[i - 1], his[i - 1]
+        if j - 1 < lo or j - 1 > hi:
+            return inf
+        return cost[offs[i - 1] + j - 1 - lo]
 
     path = []
     i, j = m, n
     while i > 0 and j > 0:
         path.append((i - 1, j - 1))
-        step = int(np.argmin([dp[i - 1, j - 1], dp[i - 1, j], dp[i, j - 1]]))
+        step = int(np.argmin([_at(i - 1, j - 1), _at(i - 1, j), _at(i, j - 1)]))
         if step == 0:
             i -= 1
             j -= 1
@@ -147,36 +273,17 @@ def _dtw_window(src: List[str], ref: List[str], window: dict[int, tuple[int, int
         path.append((0, j))
 
     path.reverse()
-    return float(dp[m, n]), path
-
-
-def _fastdtw(src: List[str], ref: List[str], radius: int = 1) -> list[tuple[int, int]]:
-    """Approximate DTW using the FastDTW algorithm."""
-
-    dist = lambda a, b: 0 if a == b else 1
-
-    def _recursive(a: List[str], b: List[str], rad: int) -> list[tuple[int, int]]:
-        if len(a) <= rad + 2 or len(b) <= rad + 2:
-            _, path = _dtw_window(a, b, None, dist)
-            return path
-        reduced_a = _reduce_by_half(a)
-        reduced_b = _reduce_by_half(b)
-        low_path = _recursive(reduced_a, reduced_b, rad)
-        window = _expand_window(low_path, len(a), len(b), rad)
-        _, path = _dtw_window(a, b, window, dist)
-        return path
-
-    return _recursive(src, ref, radius)
+    return path
 
 # ---------------------------------------------------------------------
-def align_pdf_to_srt(pdf_txt: str | Path,
-                     srt_file: str | Path,
+def align_pdf_to_srt(pdf_txt: str | Path | bytes | memoryview,
+                     srt_file: str | Path | bytes | memoryview,
                      *,
-                     band: int = 10) -> List[dict]:
-    pdf_norm, pdf_bounds, pdf_lines = _tokenize_lines(Path(pdf_txt).read_text())
+                     band: int = 100) -> List[dict]:
+    pdf_norm, pdf_bounds, pdf_lines = _tokenize_lines(_pdf_lines(pdf_txt))
     srt_tokens, srt_times = _parse_srt(srt_file)
 
-    mapping = _fastdtw(pdf_norm, srt_tokens, radius=band)
+    mapping = _banded_dtw(pdf_norm, srt_tokens, band)
     # mapping[i] = (pdf_idx, srt_idx)
 
     pdf2time = {}
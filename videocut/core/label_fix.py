@@ -14,10 +14,17 @@ from pathlib import Path
 # colon is followed by a space, which avoids matching timestamps like ``7:00``.
 label_rx = re.compile(r"^\s*([A-Za-z][A-Za-z0-9 .',\-]{1,50}):\s+(.*)")
 
+def _iter_lines(path: str | Path):
+    """Yield the lines of *path* as ``str.splitlines`` would, without
+    holding the whole decoded file in memory."""
+    with open(path) as fh:
+        for raw in fh:
+            yield from raw.splitlines()
+
 def pdf_labels(pdf_path: str | Path) -> set[str]:
     """Return the set of speaker labels found in ``pdf_path``."""
     labels: set[str] = set()
-    for line in Path(pdf_path).read_text().splitlines():
+    for line in _iter_lines(pdf_path):
         m = label_rx.match(line.strip())
         if m:
             labels.add(m.group(1).strip())
@@ -26,7 +33,7 @@ def pdf_labels(pdf_path: str | Path) -> set[str]:
 def validate_txt_labels(txt_path: str | Path, valid_labels: set[str]) -> bool:
     """Return True if all speaker labels in ``txt_path`` are valid."""
     bad: list[tuple[int, str]] = []
-    for i, line in enumerate(Path(txt_path).read_text().splitlines(), 1):
+    for i, line in enumerate(_iter_lines(txt_path), 1):
         label = line.split("\t", 1)[0].strip()
         if label and label not in valid_labels:
             bad.append((i, label))
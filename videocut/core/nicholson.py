@@ -4,12 +4,12 @@ import json
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from functools import reduce
-from difflib import get_close_matches
 import csv
 
-import pdfminer.high_level
+from ._jsoncache import iter_segments, load_data, load_json, read_json, status_stream, write_json
+from .schemas import load_recognized_map
 
 _norm_re = re.compile(r"\s+")
 
@@ -17,8 +17,77 @@ def _normalize(text: str) -> str:
     return _norm_re.sub(" ", text.strip()).lower()
 
 
+# Segment text and key phrases are both reduced to tuples of small ints so
+# matching compares integers instead of rescanning lower-cased strings for
+# every phrase.  Each matcher builds its vocabulary from its own phrases;
+# segment words are only looked up, so the vocabulary never grows past the
+# phrase words and is safe to share between threads once built.
+_TOKEN_RE = re.compile(r"[\w'’]+")
+
+
+def _intern(text: str, vocab: Dict[str, int]) -> tuple[int, ...]:
+    """Return token IDs for the lower-cased words in *text*, adding new ones."""
+    return tuple(
+        vocab.setdefault(tok, len(vocab)) for tok in _TOKEN_RE.findall(text.lower())
+    )
+
+
+def _tokenize(text: str, vocab: Dict[str, int]) -> tuple[int, ...]:
+    """Return token IDs for *text*; words outside *vocab* become ``-1``.
+
+    A word that is in no phrase can't be part of a match, so all such
+    words share one ID that no phrase contains.
+    """
+    get = vocab.get
+    return tuple(get(tok, -1) for tok in _TOKEN_RE.findall(text.lower()))
+
+
+def _has_phrase(seg_ids: tuple[int, ...], seg_set: set[int], phrase: tuple[int, ...]) -> bool:
+    """Return True if token sequence *phrase* occurs contiguously in *seg_ids*."""
+    if not phrase or not seg_set.issuperset(phrase):
+        return False
+    n = len(phrase)
+    first = phrase[0]
+    for i in range(len(seg_ids) - n + 1):
+        if seg_ids[i] == first and seg_ids[i : i + n] == phrase:
+            return True
+    return False
+
+
+def _phrase_index(
+    phrase_map: Dict[str, List[str]], vocab: Dict[str, int]
+) -> Dict[int, List[tuple[str, tuple[int, ...]]]]:
+    """Index every phrase in *phrase_map* by its first token ID.
+
+    Phrase words are interned into *vocab*.  Scanning a segment then costs
+    one dict lookup per token, however many phrases there are, instead of
+    one pass over the segment per phrase.
+    """
+    index: Dict[int, List[tuple[str, tuple[int, ...]]]] = {}
+    for name, phrases in phrase_map.items():
+        for phrase in phrases:
+            ids = _intern(phrase, vocab)
+            if ids:
+                index.setdefault(ids[0], []).append((name, ids))
+    return index
+
+
+def _find_phrases(
+    ids: tuple[int, ...], index: Dict[int, List[tuple[str, tuple[int, ...]]]]
+) -> set[str]:
+    """Return the names whose indexed phrases occur in token sequence *ids*."""
+    found = set()
+    for i, tok in enumerate(ids):
+        for name, phrase in index.get(tok, ()):
+            if name not in found and ids[i : i + len(phrase)] == phrase:
+                found.add(name)
+    return found
+
+
 def _parse_pdf_order(pdf_path: str):
-    text = pdfminer.high_level.extract_text(pdf_path)
+    from pdfminer.high_level import extract_text
+
+    text = extract_text(pdf_path)
     raw_lines = [l.strip() for l in text.splitlines() if l.strip()]
     pattern = re.compile(r"^([A-Z][A-Z ']+):\s*(.*)")
     lines = []
@@ -149,6 +218,11 @@ _NICHOLSON_KEY_PHRASES = {
     "director nicholson",
     "nicholson, for the record",
 }
+# Indexed once at import; one pass over a segment's tokens checks every phrase.
+_NICHOLSON_VOCAB: Dict[str, int] = {}
+_NICHOLSON_INDEX = _phrase_index(
+    {"nicholson": sorted(_NICHOLSON_KEY_PHRASES)}, _NICHOLSON_VOCAB
+)
 
 _END_PATTERNS = [r"\bthank you\b", r"\bnext item\b", r"\bmove on\b", r"\bdirector\b", r"\bchair\b", r"\bthat concludes\b", r"\bno further\b"]
 _END_RE = re.compile("|".join(_END_PATTERNS), re.IGNORECASE)
@@ -228,12 +302,12 @@ def load_board_names(path: str | None = None) -> set[str]:
     fp = Path(path) if path else None
     if fp and fp.suffix == ".json":
         if fp.exists():
-            data = json.loads(fp.read_text())
+            data = load_json(fp)
             return {n.strip().lower() for n in data.get("board_members", []) if n.strip()}
         return set()
     if fp is None:
         if PEOPLE_FILE.exists():
-            data = json.loads(PEOPLE_FILE.read_text())
+            data = load_json(PEOPLE_FILE)
             return {n.strip().lower() for n in data.get("board_members", []) if n.strip()}
         fp = BOARD_FILE
     if not fp.exists():
@@ -247,11 +321,11 @@ def load_board_map(path: str | None = None) -> Dict[str, str]:
     if fp and fp.suffix == ".json":
         if not fp.exists():
             return {}
-        data = json.loads(fp.read_text())
+        data = load_json(fp)
         return {n.lower(): n for n in data.get("board_members", []) if n}
     if fp is None:
         if PEOPLE_FILE.exists():
-            data = json.loads(PEOPLE_FILE.read_text())
+            data = load_json(PEOPLE_FILE)
             return {n.lower(): n for n in data.get("board_members", []) if n}
         fp = BOARD_FILE
     if not fp.exists():
@@ -264,10 +338,33 @@ def load_board_map(path: str | None = None) -> Dict[str, str]:
     return mapping
 
 
+def _closest(name: str, choices: Iterable[str], cutoff: float) -> Optional[str]:
+    """Return ``difflib.get_close_matches(name, choices, 1, cutoff)[0]`` or ``None``.
+
+    rapidfuzz's Indel ``ratio`` is never below SequenceMatcher's ratio (its
+    longest common subsequence is at least as long as difflib's matching
+    blocks), but it can be higher, so on its own it would match more
+    loosely.  It is used only as a native prefilter: candidates it rejects
+    can't pass difflib either, and difflib picks among the few survivors
+    exactly as before.
+    """
+    from difflib import get_close_matches
+
+    from rapidfuzz import fuzz, process
+
+    # the small margin keeps exact-boundary scores from float rounding away
+    hits = process.extract(
+        name, choices, scorer=fuzz.ratio, processor=None,
+        score_cutoff=cutoff * 100 - 1e-6, limit=None,
+    )
+    match = get_close_matches(name, [hit[0] for hit in hits], n=1, cutoff=cutoff)
+    return match[0] if match else None
+
+
 def _is_board_member(name: str, board: set[str]) -> bool:
     if not name:
         return False
-    return bool(get_close_matches(name.lower(), list(board), n=1, cutoff=0.75))
+    return _closest(name.lower(), board, 0.75) is not None
 
 
 def normalize_recognized_name(name: str, board_map: Dict[str, str]) -> str:
@@ -277,9 +374,9 @@ def normalize_recognized_name(name: str, board_map: Dict[str, str]) -> str:
     lname = name.lower()
     if lname in board_map:
         return board_map[lname]
-    match = get_close_matches(lname, list(board_map.keys()), n=1, cutoff=0.65)
+    match = _closest(lname, board_map.keys(), 0.65)
     if match:
-        return board_map[match[0]]
+        return board_map[match]
     # attempt to match just on last name
     last = lname.split()[-1]
     last_map = {n.split()[-1].lower(): n for n in board_map.values()}
@@ -288,16 +385,14 @@ def normalize_recognized_name(name: str, board_map: Dict[str, str]) -> str:
     return name
 
 
-def map_nicholson_speaker(diarized_json: str) -> str:
+def map_nicholson_speaker(diarized_json: str | Iterable[dict]) -> str:
     """Return the WhisperX speaker label matching Nicholson."""
-    data = json.loads(Path(diarized_json).read_text())
     counts: Dict[str, int] = {}
-    for seg in data["segments"]:
+    for seg in iter_segments(diarized_json):
         spk = seg.get("speaker")
         if not spk:
             continue
-        text_l = seg["text"].lower()
-        if any(p in text_l for p in _NICHOLSON_KEY_PHRASES):
+        if _find_phrases(_tokenize(seg["text"], _NICHOLSON_VOCAB), _NICHOLSON_INDEX):
             counts[spk] = counts.get(spk, 0) + 1
     if not counts:
         raise RuntimeError("Nicholson phrases not found – update key phrases or re-check diarization.")
@@ -306,35 +401,37 @@ def map_nicholson_speaker(diarized_json: str) -> str:
     return best
 
 
-def map_speaker_by_phrases(diarized_json: str, phrase_map: Dict[str, List[str]]) -> Dict[str, str]:
+def map_speaker_by_phrases(
+    diarized_json: str | Iterable[dict], phrase_map: Dict[str, List[str]]
+) -> Dict[str, str]:
     """Return WhisperX speaker IDs for each name in *phrase_map*.
 
     The *phrase_map* argument maps a display name to one or more key phrases
     uniquely spoken by that person. Each speaker ID is chosen by counting which
     diarized speaker label says the most of that person's phrases, following the
-    same strategy as :func:`map_nicholson_speaker`.
+    same strategy as :func:`map_nicholson_speaker`.  The transcript is scanned
+    once, so *diarized_json* may also be a stream of segments, and each
+    segment is matched against all phrases at once via :func:`_phrase_index`.
     """
 
-    data = json.loads(Path(diarized_json).read_text())
-    segments = data["segments"]
-    result: Dict[str, str] = {}
+    vocab: Dict[str, int] = {}
+    index = _phrase_index(phrase_map, vocab)
+    counts: Dict[str, Dict[str, int]] = {name: {} for name in phrase_map}
+    for seg in iter_segments(diarized_json):
+        spk = seg.get("speaker")
+        if not spk:
+            continue
+        for name in _find_phrases(_tokenize(seg.get("text", ""), vocab), index):
+            counts[name][spk] = counts[name].get(spk, 0) + 1
 
-    for name, phrases in phrase_map.items():
-        counts: Dict[str, int] = {}
-        phr_lower = [p.lower() for p in phrases]
-        for seg in segments:
-            spk = seg.get("speaker")
-            if not spk:
-                continue
-            text_l = seg.get("text", "").lower()
-            if any(p in text_l for p in phr_lower):
-                counts[spk] = counts.get(spk, 0) + 1
-        if not counts:
+    result: Dict[str, str] = {}
+    for name, spk_counts in counts.items():
+        if not spk_counts:
             raise RuntimeError(
                 f"Phrases for {name} not found – update key phrases or re-check diarization."
             )
-        best = max(counts, key=counts.get)
-        print(f"🔍  Identified {name} as {best} (matches={counts[best]})")
+        best = max(spk_counts, key=spk_counts.get)
+        print(f"🔍  Identified {name} as {best} (matches={spk_counts[best]})")
         result[name] = best
 
     return result
@@ -353,16 +450,22 @@ def map_recognized_speakers(
     with the most counts for each name is returned.
     """
 
-    data = json.loads(Path(diarized_json).read_text())
+    data = load_json(Path(diarized_json))
     segments = data["segments"]
     counts: Dict[str, Dict[str, int]] = {name: {} for name in recognition_map}
+    vocab: Dict[str, int] = {}
+    phrase_ids = {
+        name: [_intern(p, vocab) for p in phrases]
+        for name, phrases in recognition_map.items()
+    }
 
     for i, seg in enumerate(segments):
         if seg.get("speaker") != chair_id:
             continue
-        text_l = seg.get("text", "").lower()
-        for name, phrases in recognition_map.items():
-            if any(p.lower() in text_l for p in phrases):
+        ids = _tokenize(seg.get("text", ""), vocab)
+        ids_set = set(ids)
+        for name, phrases in phrase_ids.items():
+            if any(_has_phrase(ids, ids_set, p) for p in phrases):
                 j = i + 1
                 while j < len(segments) and segments[j].get("speaker") == chair_id:
                     j += 1
@@ -416,7 +519,9 @@ _YIELD_RE = re.compile(
 )
 
 
-def map_recognized_auto(diarized_json: str) -> Dict[str, dict]:
+def map_recognized_auto(
+    diarized_json: str | Dict, roll_map: Dict[str, str] | None = None
+) -> Dict[str, dict]:
     """Infer recognized speakers directly from diarized text.
 
     The function first determines the chair using :func:`chair.identify_chair`
@@ -425,14 +530,17 @@ def map_recognized_auto(diarized_json: str) -> Dict[str, dict]:
     counted as that person. Results map each diarized speaker ID to a
     ``{"name": str, "alternatives": list}`` structure containing the most likely
     name and any alternative names detected for that speaker. Names from the roll
-    call are merged into the final mapping.
+    call are merged into the final mapping. *diarized_json* may be a path or the
+    already parsed transcript; pass *roll_map* when the roll call has already
+    been parsed with :func:`chair.parse_roll_call`.
     """
 
-    data = json.loads(Path(diarized_json).read_text())
+    data = load_data(diarized_json)
     segments = data["segments"]
 
-    chair_id = chair.identify_chair(diarized_json)
-    roll_map = chair.parse_roll_call(diarized_json)
+    chair_id = chair.identify_chair(data)
+    if roll_map is None:
+        roll_map = chair.parse_roll_call(data)
     board_map = load_board_map()
 
     counts: Dict[str, Dict[str, int]] = {}
@@ -548,7 +656,7 @@ def add_speaker_labels(
     corresponding name.
     """
 
-    data = json.loads(Path(diarized_json).read_text())
+    data = read_json(diarized_json)
     segments = data["segments"]
     inv = {v: k for k, v in id_map.items()}
     for seg in segments:
@@ -556,13 +664,13 @@ def add_speaker_labels(
         name = inv.get(spk)
         if name:
             seg["label"] = name
-    Path(out_json).write_text(json.dumps(data, indent=2))
-    print(f"✅  labels added → {out_json}")
+    write_json(out_json, data)
+    print(f"✅  labels added → {out_json}", file=status_stream(out_json))
 
 
 def auto_segments_for_speaker(diarized_json: str, speaker_id: str, out_json: str = "segments_to_keep.json") -> None:
     """Dump every segment spoken by *speaker_id* into JSON."""
-    data = json.loads(Path(diarized_json).read_text())
+    data = load_json(Path(diarized_json))
     segs = [{"start": seg["start"], "end": seg["end"]} for seg in data["segments"] if seg.get("speaker") == speaker_id]
     Path(out_json).write_text(json.dumps(segs, indent=2))
     print(f"✅  {len(segs)} Nicholson segment(s) → {out_json}")
@@ -570,15 +678,23 @@ def auto_segments_for_speaker(diarized_json: str, speaker_id: str, out_json: str
 
 def identify_segments(
     diarized_json: str,
-    recognized_map: str = "recognized_map.json",
+    recognized_map: str | Dict[str, dict] = "recognized_map.json",
     out_json: str = "segments_to_keep.json",
     board_file: str | None = None,
+    compact: bool = False,
+    data: Dict | None = None,
 ) -> None:
-    """Create JSON segments for Secretary Nicholson using recognition data."""
+    """Create JSON segments for Secretary Nicholson using recognition data.
+
+    Pass ``compact=True`` when *out_json* is a temporary file that is only
+    read back by code, and *data* when the transcript is already parsed.
+    """
     segment_nicholson(
         diarized_json,
         out_json,
         board_file=board_file,
+        compact=compact,
+        data=data,
     )
 
 
@@ -803,6 +919,8 @@ def segment_nicholson(
     transcript_pdf: str | None = None,
     tsv_file: str | None = None,
     board_file: str | None = None,
+    compact: bool = False,
+    data: Dict | None = None,
     **_,
 ) -> None:
     in_path = Path(diarized_json)
@@ -827,13 +945,14 @@ def segment_nicholson(
         board = load_board_names(board_file)
         segs = build_segments(entries, board=board)
 
-        out_path.write_text(json.dumps(segs, indent=2))
+        write_json(out_path, segs, compact=compact)
         print(f"✅  {len(segs)} segments → {out_path}")
         return
 
     # Fallback to heuristic segmentation using diarized JSON only
     markup_path = in_path.with_name("markup_guide.txt")
-    data = json.loads(in_path.read_text())
+    if data is None:
+        data = read_json(in_path)
     segs_data = data["segments"]
     markup_lines = load_markup(markup_path)
     board = load_board_names(board_file)
@@ -844,7 +963,7 @@ def segment_nicholson(
         print("❌  No Nicholson segments found")
         return
 
-    out_path.write_text(json.dumps(segs, indent=2))
+    write_json(out_path, segs, compact=compact)
     print(f"✅  {len(segs)} segments → {out_path}")
 
 
@@ -853,10 +972,19 @@ def identify_nicholson_segments(json_file: str, out_json: str = "segments_to_kee
     segment_nicholson(json_file, out_json)
 
 
-def apply_name_map(seg_json: str, map_json: str, out_json: Optional[str] = None) -> None:
+def _load_name_map(map_json: str | Dict[str, dict]) -> Dict[str, dict]:
+    """Return *map_json* as a mapping, reading it only when given a path."""
+    if isinstance(map_json, dict):
+        return map_json
+    return load_recognized_map(map_json)
+
+
+def apply_name_map(
+    seg_json: str, map_json: str | Dict[str, dict], out_json: Optional[str] = None
+) -> None:
     """Replace SPEAKER tokens in *seg_json* with names from *map_json*."""
-    segs = json.loads(Path(seg_json).read_text())
-    mapping = json.loads(Path(map_json).read_text())
+    segs = read_json(seg_json)
+    mapping = _load_name_map(map_json)
     repl = {k: v.get("name", k) for k, v in mapping.items()}
     for seg in segs:
         for key in ["text", "pre", "post"]:
@@ -867,14 +995,29 @@ def apply_name_map(seg_json: str, map_json: str, out_json: Optional[str] = None)
                     line = line.replace(spk, name)
                 new_lines.append(line)
             seg[key] = new_lines
-    Path(out_json or seg_json).write_text(json.dumps(segs, indent=2))
-    print(f"✅  names applied → {out_json or seg_json}")
-
-
-def apply_name_map_json(json_file: str, map_json: str, out_json: Optional[str] = None) -> None:
-    """Replace SPEAKER tokens in a diarized JSON transcript using *map_json*."""
-    data = json.loads(Path(json_file).read_text())
-    mapping = json.loads(Path(map_json).read_text())
+    out = out_json or seg_json
+    write_json(out, segs)
+    print(f"✅  names applied → {out}", file=status_stream(out))
+
+
+def apply_name_map_json(
+    json_file: str | Dict,
+    map_json: str | Dict[str, dict],
+    out_json: Optional[str] = None,
+) -> dict:
+    """Replace SPEAKER tokens in a diarized JSON transcript using *map_json*.
+
+    *map_json* may be a path or an already parsed recognized-speaker mapping.
+    The updated transcript is written to disk and also returned so callers can
+    keep working on it without re-reading the file.  A parsed *json_file* is
+    updated in place and written only when *out_json* is given.
+    """
+    if isinstance(json_file, dict):
+        data = json_file
+    else:
+        data = read_json(Path(json_file))
+        out_json = out_json or json_file
+    mapping = _load_name_map(map_json)
     repl = {k: v.get("name", k) for k, v in mapping.items()}
     for seg in data.get("segments", []):
         spk = seg.get("speaker")
@@ -885,36 +1028,39 @@ def apply_name_map_json(json_file: str, map_json: str, out_json: Optional[str] =
             for key, val in repl.items():
                 text = text.replace(key, val)
             seg["text"] = text
-    Path(out_json or json_file).write_text(json.dumps(data, indent=2))
-    print(f"✅  transcript names applied → {out_json or json_file}")
+    if out_json:
+        write_json(out_json, data)
+        print(f"✅  transcript names applied → {out_json}")
+    return data
 
 
 def prune_segments(seg_json: str, out_json: Optional[str] = None) -> None:
     """Remove trivial segments with very few words."""
-    segs = json.loads(Path(seg_json).read_text())
+    segs = read_json(seg_json)
     kept = []
     for seg in segs:
         words = " ".join(seg.get("text", [])).split()
         if len(words) >= 4:
             kept.append(seg)
-    Path(out_json or seg_json).write_text(json.dumps(kept, indent=2))
-    print(f"✅  {len(kept)} segment(s) kept → {out_json or seg_json}")
+    out = out_json or seg_json
+    write_json(out, kept)
+    print(f"✅  {len(kept)} segment(s) kept → {out}", file=status_stream(out))
 
 
 def generate_recognized_directors(
-    recognized_map: str,
+    recognized_map: str | Dict[str, dict],
     board_file: str = str(BOARD_FILE),
     out_file: str = "recognized_directors.txt",
 ) -> None:
     """Write recognized directors matched against the official board list."""
     board = load_board_names(board_file)
-    mapping = json.loads(Path(recognized_map).read_text())
+    mapping = _load_name_map(recognized_map)
     found = []
     for info in mapping.values():
         name = info.get("name", "")
-        match = get_close_matches(name.lower(), list(board), n=1, cutoff=0.75)
+        match = _closest(name.lower(), board, 0.75)
         if match:
-            found.append(match[0])
+            found.append(match)
     Path(out_file).write_text("\n".join(sorted(set(found))) + "\n")
     print(f"✅  recognized directors → {out_file}")
 
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import List, Set, Tuple, Dict
 import difflib
 
+import numpy as np
 from pdfminer.high_level import extract_text
 from .. import parse_pdf_text
 
@@ -12,6 +13,7 @@ __all__ = [
     "clean_recognized_map",
     "extract_transcript_lines",
     "extract_transcript_dialogue",
+    "apply_pdf_transcript_dict",
     "apply_pdf_transcript_json",
     "write_timestamped_transcript",
     "find_timing_anomalies",
@@ -45,8 +47,7 @@ def clean_recognized_map(
     Names are matched against the board member list and optionally against
     names extracted from *pdf_path*.
     """
-    from .nicholson import load_board_map, normalize_recognized_name
-    from difflib import get_close_matches
+    from .nicholson import _closest, load_board_map, normalize_recognized_name
 
     board_map = load_board_map(board_file)
     pdf_names = (
@@ -58,11 +59,9 @@ def clean_recognized_map(
         name = info.get("name", "")
         name = normalize_recognized_name(name, board_map)
         if pdf_names:
-            match = get_close_matches(
-                name.lower(), list(pdf_names.keys()), n=1, cutoff=0.8
-            )
+            match = _closest(name.lower(), pdf_names.keys(), 0.8)
             if match:
-                name = pdf_names[match[0]]
+                name = pdf_names[match]
         alts = [
             normalize_recognized_name(a, board_map)
             for a in info.get("alternatives", [])
@@ -93,11 +92,11 @@ def extract_transcript_dialogue(pdf_path: str) -> List[Tuple[str, str]]:
     return dialogue
 
 
-def apply_pdf_transcript_json(
-    json_file: str, pdf_path: str, out_json: str | None = None
-) -> None:
-    """Replace transcript lines and speakers in ``json_file`` using *pdf_path*."""
-    data = json.loads(Path(json_file).read_text())
+def apply_pdf_transcript_dict(data: Dict, pdf_path: str) -> Dict:
+    """Replace transcript lines and speakers in diarized *data* in place.
+
+    Returns *data* so callers can keep the merged transcript in memory.
+    """
     dialog = extract_transcript_dialogue(pdf_path)
     segs = data.get("segments", [])
     for seg, (speaker, line) in zip(segs, dialog):
@@ -105,6 +104,14 @@ def apply_pdf_transcript_json(
         seg["text"] = line
     if len(dialog) < len(segs):
         del segs[len(dialog) :]
+    return data
+
+
+def apply_pdf_transcript_json(
+    json_file: str, pdf_path: str, out_json: str | None = None
+) -> None:
+    """Replace transcript lines and speakers in ``json_file`` using *pdf_path*."""
+    data = apply_pdf_transcript_dict(json.loads(Path(json_file).read_text()), pdf_path)
     Path(out_json or json_file).write_text(json.dumps(data, indent=2))
     print(f"✅  transcript text replaced → {out_json or json_file}")
 
@@ -153,16 +160,19 @@ def write_timestamped_transcript(
     srt_path: str,
     out_txt: str | None = None,
     json_path: str | None = None,
+    json_data: Dict | List | None = None,
 ) -> None:
     """Write ``out_txt`` with timestamps.
 
     If *json_path* is supplied and exists, timestamps and speaker names are
     taken directly from that JSON file instead of matching ``srt_path`` to the
     PDF text.  This provides a reliable fallback when the SRT and PDF texts do
-    not align well.
+    not align well.  *json_data* does the same for an already parsed file.
     """
-    if json_path and Path(json_path).exists():
-        data = json.loads(Path(json_path).read_text())
+    if json_data is None and json_path and Path(json_path).exists():
+        json_data = json.loads(Path(json_path).read_text())
+    if json_data is not None:
+        data = json_data
         segs = data.get("segments", data)
         out_lines = []
         for seg in segs:
@@ -214,25 +224,25 @@ def find_timing_anomalies(
 
     data = json.loads(Path(json_file).read_text())
     segs = data.get("segments", data)
-    anomalies = []
-    for i, seg in enumerate(segs):
-        start = float(seg.get("start", 0))
-        end = float(seg.get("end", 0))
-        text = str(seg.get("text", ""))
-        words = len(text.split())
-        dur = end - start
-        wps = words / dur if dur > 0 else float("inf")
-        if wps < min_wps or wps > max_wps:
-            anomalies.append(
-                {
-                    "index": i,
-                    "start": start,
-                    "end": end,
-                    "wps": round(wps, 2),
-                    "text": text,
-                }
-            )
-    return anomalies
+    n = len(segs)
+    starts = np.fromiter((float(s.get("start", 0)) for s in segs), dtype=np.float64, count=n)
+    ends = np.fromiter((float(s.get("end", 0)) for s in segs), dtype=np.float64, count=n)
+    texts = [str(s.get("text", "")) for s in segs]
+    words = np.fromiter((len(t.split()) for t in texts), dtype=np.int64, count=n)
+    durs = ends - starts
+    wps = np.full(n, np.inf)
+    np.divide(words, durs, out=wps, where=durs > 0)
+    flagged = np.flatnonzero((wps < min_wps) | (wps > max_wps))
+    return [
+        {
+            "index": int(i),
+            "start": float(starts[i]),
+            "end": float(ends[i]),
+            "wps": round(float(wps[i]), 2),
+            "text": texts[i],
+        }
+        for i in flagged
+    ]
 
 
 def export_pdf_transcript(
@@ -292,8 +302,13 @@ def match_pdf_json(
     for item in lines:
         pdf_words = item["words"]
         window = diar_words[j : j + max(len(pdf_words) * 3, 1)]
+        # Windows are often 200+ words, where autojunk would drop common words
+        # like "the" as anchors; only punctuation-only tokens are junk here.
         sm = difflib.SequenceMatcher(
-            None, [_norm(w) for w in pdf_words], [_norm(w["word"]) for w in window]
+            lambda w: not w,
+            [_norm(w) for w in pdf_words],
+            [_norm(w["word"]) for w in window],
+            autojunk=False,
         )
         words_out = []
         j_offset = j
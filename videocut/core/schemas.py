@@ -0,0 +1,102 @@
+"""Schemas for the small JSON mapping files passed between commands.
+
+``recognized_map.json``, ``speaker_map.json`` and phrase maps are written by
+one command and read back by several others.  Loading them through these
+helpers checks their shape up front so a hand-edited or truncated map fails
+with a clear error instead of part-way through a later step.  With
+``msgspec`` installed the files are decoded and validated in one C pass;
+otherwise the same checks run in Python.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Dict, List, TypedDict
+
+
+class RecognizedSpeaker(TypedDict, total=False):
+    """One entry of ``recognized_map.json``."""
+
+    name: str
+    alternatives: List[str]
+
+
+RecognizedMap = Dict[str, RecognizedSpeaker]
+"""Diarized speaker ID → recognized name and alternatives."""
+
+SpeakerMap = Dict[str, str]
+"""Display name → diarized speaker ID."""
+
+PhraseMap = Dict[str, List[str]]
+"""Display name → key phrases spoken by that person."""
+
+
+try:  # msgspec validates while decoding, without building an untyped tree first
+    import msgspec
+
+    _DECODERS = {
+        "recognized": msgspec.json.Decoder(RecognizedMap),
+        "speaker": msgspec.json.Decoder(SpeakerMap),
+        "phrase": msgspec.json.Decoder(PhraseMap),
+    }
+
+    def _decode(raw: bytes, kind: str, path: str | Path):
+        try:
+            return _DECODERS[kind].decode(raw)
+        except msgspec.DecodeError as exc:
+            raise ValueError(f"{path}: {exc}") from None
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    def _is_str_list(value) -> bool:
+        return isinstance(value, list) and all(isinstance(v, str) for v in value)
+
+    def _valid_speaker(value) -> bool:
+        return (
+            isinstance(value, dict)
+            and isinstance(value.get("name", ""), str)
+            and _is_str_list(value.get("alternatives", []))
+        )
+
+    _CHECKS = {
+        "recognized": (_valid_speaker, "an object with a string 'name'"),
+        "speaker": (lambda v: isinstance(v, str), "a string"),
+        "phrase": (_is_str_list, "a list of strings"),
+    }
+
+    def _decode(raw: bytes, kind: str, path: str | Path):
+        try:
+            data = json.loads(raw)
+        except ValueError as exc:
+            raise ValueError(f"{path}: {exc}") from None
+        if not isinstance(data, dict):
+            raise ValueError(f"{path}: expected an object at the top level")
+        check, expected = _CHECKS[kind]
+        for key, value in data.items():
+            if not check(value):
+                raise ValueError(f"{path}: entry {key!r} must be {expected}")
+        return data
+
+
+def load_recognized_map(path: str | Path) -> RecognizedMap:
+    """Return the validated contents of a ``recognized_map.json`` file."""
+    return _decode(Path(path).read_bytes(), "recognized", path)
+
+
+def load_speaker_map(path: str | Path) -> SpeakerMap:
+    """Return a validated name → speaker ID mapping."""
+    return _decode(Path(path).read_bytes(), "speaker", path)
+
+
+def load_phrase_map(path: str | Path) -> PhraseMap:
+    """Return a validated name → key phrases mapping."""
+    return _decode(Path(path).read_bytes(), "phrase", path)
+
+
+__all__ = [
+    "RecognizedSpeaker",
+    "RecognizedMap",
+    "SpeakerMap",
+    "PhraseMap",
+    "load_recognized_map",
+    "load_speaker_map",
+    "load_phrase_map",
+]
@@ -8,11 +8,12 @@ from pathlib import Path
 from typing import Dict, List
 
 from .. import parse_pdf_text
+from ._jsoncache import load_json, read_json
 
 
 def json_to_tsv(json_path: str, out_tsv: str = "input.tsv") -> None:
     """Convert WhisperX JSON to TSV for spreadsheet editing."""
-    data = json.loads(Path(json_path).read_text())
+    data = read_json(json_path)
     segs = data if isinstance(data, list) else data.get("segments", data)
     with open(out_tsv, "w", newline="") as f:
         wr = csv.writer(f, delimiter="\t")
@@ -28,12 +29,17 @@ def json_to_tsv(json_path: str, out_tsv: str = "input.tsv") -> None:
     print(f"✅  {len(segs)} segment(s) → {out_tsv}")
 
 
-def json_to_markup(json_path: str, out_txt: str = "markup_guide.txt") -> None:
-    """Write ``out_txt`` with ``[start-end] SPEAKER: text`` lines from *json_path*."""
-    if not Path(json_path).exists():
-        sys.exit(f"❌  {json_path} not found")
+def json_to_markup(json_path: str | dict, out_txt: str = "markup_guide.txt") -> None:
+    """Write ``out_txt`` with ``[start-end] SPEAKER: text`` lines from *json_path*.
 
-    data = json.loads(Path(json_path).read_text())
+    *json_path* may also be an already loaded transcript.
+    """
+    if isinstance(json_path, dict):
+        data = json_path
+    elif not Path(json_path).exists():
+        sys.exit(f"❌  {json_path} not found")
+    else:
+        data = load_json(json_path)
     segs = data if isinstance(data, list) else data.get("segments", data)
     lines = []
     for seg in segs:
@@ -85,7 +91,7 @@ def _collect_post(lines: List[dict], end: float, next_start: float | None = None
 
 def json_to_editable(json_path: str, out_json: str = "segments_edit.json", markup: str = "markup_guide.txt") -> None:
     """Create an editable JSON with keep flag and context lines."""
-    data = json.loads(Path(json_path).read_text())
+    data = read_json(json_path)
     segs_in = data if isinstance(data, list) else data.get("segments", data)
     markup_lines = _load_markup(Path(markup))
     segs: List[Dict] = []
@@ -127,7 +133,7 @@ def json_to_editable(json_path: str, out_json: str = "segments_edit.json", marku
 
 def write_segments_txt_from_editable(editable_json: str, out_txt: str = "segments.txt"):
     """Write a full transcript with tabbed lines and =START=/=END= around keep=True segments."""
-    data = json.loads(Path(editable_json).read_text())
+    data = read_json(editable_json)
     output = []
     in_segment = False
 
@@ -170,7 +176,7 @@ def identify_clips_json(edit_json: str = "segments_edit.json", out_json: str = "
     """Save segments with keep true in edit_json to JSON list."""
     if not Path(edit_json).exists():
         sys.exit(f"❌  {edit_json} not found")
-    raw = json.loads(Path(edit_json).read_text())
+    raw = read_json(edit_json)
     segs_in = raw if isinstance(raw, list) else raw.get("segments", raw)
     segs: List[Dict[str, float]] = []
     for seg in segs_in:
@@ -182,12 +188,20 @@ def identify_clips_json(edit_json: str = "segments_edit.json", out_json: str = "
     print(f"✅  {len(segs)} clip(s) flagged → {out_json}")
 
 
+_MARKED_TS_RE = re.compile(r"\s*\[(\d+(?:\.\d*)?)-(\d+(?:\.\d*)?)\]")
+
+
 def extract_marked(markup: str = "markup_guide.txt", out_json: str = "segments_to_keep.json") -> None:
     """Parse markup_guide.txt and dump JSON segment list."""
     if not Path(markup).exists():
         sys.exit("❌  markup_guide.txt not found – run transcription first")
     segs, open_start = [], None
     for ln, line in enumerate(Path(markup).read_text().splitlines(), 1):
+        m = _MARKED_TS_RE.match(line)
+        if m:
+            # fast path for the common well-formed ``[start-end]`` line
+            segs.append({"start": float(m.group(1)), "end": float(m.group(2))})
+            continue
         line = line.strip()
         if line.startswith("[") and "-" in line:
             ts = line.split("]")[0][1:].replace("–", "-")
@@ -207,7 +221,7 @@ def extract_marked(markup: str = "markup_guide.txt", out_json: str = "segments_t
 
 
 def extract_segments_from_json(json_file: str, speaker_match: str, out_txt: str = "segments.txt"):
-    data = json.loads(Path(json_file).read_text())
+    data = read_json(json_file)
     segments = data.get("segments", data)
 
     output = []
@@ -238,25 +252,28 @@ def extract_segments_from_json(json_file: str, speaker_match: str, out_txt: str
 
 
 def segments_json_to_txt(
-    transcript_json: str,
+    transcript_json: str | dict,
     segments_json: str,
     out_txt: str = "segments.txt",
 ) -> None:
     """Write ``out_txt`` with the full transcript and segment markers.
 
-    ``transcript_json`` should be a diarized JSON file containing ``segments``.
+    ``transcript_json`` should be a diarized JSON file containing ``segments``,
+    or that transcript already parsed.
     ``segments_json`` lists ``{"start", "end"}`` dictionaries identifying the
     portions of the transcript to keep. Lines falling inside one of these
     segments are wrapped in ``=START=``/``=END=`` and are tab indented.
     """
-    t_path = Path(transcript_json)
     s_path = Path(segments_json)
-    if not t_path.exists():
+    if not isinstance(transcript_json, dict) and not Path(transcript_json).exists():
         sys.exit(f"❌  {transcript_json} not found")
     if not s_path.exists():
         sys.exit(f"❌  {segments_json} not found")
 
-    data = json.loads(t_path.read_text())
+    if isinstance(transcript_json, dict):
+        data = transcript_json
+    else:
+        data = read_json(transcript_json)
     segs_in = data.get("segments", data)
     transcript_lines = []
     stop_prefixes = parse_pdf_text.STOP_PREFIXES
@@ -275,7 +292,7 @@ def segments_json_to_txt(
             {"start": start, "end": end, "speaker": speaker, "text": text}
         )
 
-    seg_data = json.loads(s_path.read_text())
+    seg_data = read_json(s_path)
     seg_list = seg_data if isinstance(seg_data, list) else seg_data.get("segments", seg_data)
     ranges = [
         (float(s.get("start", 0)), float(s.get("end", 0))) for s in seg_list
@@ -395,7 +412,7 @@ def load_segments(seg_file: str, srt_file: str | None = None) -> list[dict]:
                 segs.append({"start": idx[s]["start"], "end": idx[e]["end"]})
         return segs
     else:
-        raw = json.loads(path.read_text())
+        raw = read_json(path)
         if isinstance(raw, dict) and "segments" in raw:
             raw = raw["segments"]
         try:
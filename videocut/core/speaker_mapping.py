@@ -1,25 +1,39 @@
 """Speaker mapping utilities using speaker embeddings."""
 from __future__ import annotations
-import json
+import functools
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from ._jsoncache import read_json, write_json
+
 __all__ = ["build_speaker_db", "apply_speaker_map"]
 
 
+@functools.cache
+def _load_classifier():
+    """Import speechbrain/torch and load the ECAPA speaker encoder once.
+
+    The heavy imports only happen when an embedding command actually runs,
+    and later calls in the same process reuse the loaded model.
+    """
+    from speechbrain.pretrained import EncoderClassifier
+
+    return EncoderClassifier.from_hparams(
+        source="speechbrain/spkrec-ecapa-voxceleb",
+        run_opts={"device": "cpu"},
+    )
+
+
 def build_speaker_db(samples_dir: str, out_json: str = "speaker_db.json") -> None:
     """Compute embeddings from WAV files in ``samples_dir`` and save to JSON."""
     try:
-        from speechbrain.pretrained import EncoderClassifier
+        import speechbrain.pretrained  # noqa: F401
         import torchaudio
     except Exception as exc:
         raise RuntimeError("speechbrain and torchaudio are required for speaker embedding") from exc
 
-    classifier = EncoderClassifier.from_hparams(
-        source="speechbrain/spkrec-ecapa-voxceleb",
-        run_opts={"device": "cpu"},
-    )
+    classifier = _load_classifier()
 
     db: Dict[str, List[float]] = {}
     for wav in Path(samples_dir).glob("*.wav"):
@@ -30,7 +44,7 @@ def build_speaker_db(samples_dir: str, out_json: str = "speaker_db.json") -> Non
         emb = classifier.encode_batch(waveform).squeeze().tolist()
         db[wav_name] = emb
 
-    Path(out_json).write_text(json.dumps(db, indent=2))
+    write_json(out_json, db)
     print(f"✅  {len(db)} speaker embedding(s) → {out_json}")
 
 
@@ -55,21 +69,18 @@ def apply_speaker_map(
 ) -> None:
     """Replace diarized speaker labels with real names using embeddings."""
     try:
-        from speechbrain.pretrained import EncoderClassifier
+        import speechbrain.pretrained  # noqa: F401
         import torch
         import torchaudio
     except Exception as exc:
         raise RuntimeError("speechbrain and torchaudio are required for speaker mapping") from exc
 
-    classifier = EncoderClassifier.from_hparams(
-        source="speechbrain/spkrec-ecapa-voxceleb",
-        run_opts={"device": "cpu"},
-    )
+    classifier = _load_classifier()
 
-    db_raw = json.loads(Path(db_json).read_text())
+    db_raw = read_json(db_json)
     db = {name: torch.tensor(vec) for name, vec in db_raw.items()}
 
-    data = json.loads(Path(diarized_json).read_text())
+    data = read_json(diarized_json)
     segments = data.get("segments", [])
 
     tmp_wav = Path("_tmp_audio.wav")
@@ -118,7 +129,7 @@ def apply_speaker_map(
             if spk in mapping:
                 seg["speaker"] = mapping[spk]
 
-    Path(out_json or diarized_json).write_text(json.dumps(data, indent=2))
+    write_json(out_json or diarized_json, data)
     if mapping:
         print(f"✅  Applied speaker mapping ({len(mapping)} match(es))")
     else:
@@ -87,6 +87,7 @@ def annotate_srt(
     mapping = {}
     raw = {}
     if Path(name_map).exists():
+        # hand-edited maps may hold non-object entries; skip them, don't fail
         raw = json.loads(Path(name_map).read_text())
         mapping = {k: v.get("name", k) for k, v in raw.items() if isinstance(v, dict)}
 
@@ -115,7 +116,8 @@ def annotate_srt(
             if m:
                 sp = m.group(1)
                 name = mapping.get(sp, sp)
-                line = _SPEAKER_RE.sub(f"{name}: ", line)
+                # the match already located the tag; splice instead of re-scanning
+                line = f"{name}: {line[m.end():]}"
             new_lines.append(line)
         e["lines"] = new_lines
 
@@ -134,8 +136,7 @@ def annotate_srt(
     print(f"✅  wrote {out_file}")
 
 
-_START_RE = re.compile(r"=START-(\d+)=")
-_END_RE = re.compile(r"=END-(\d+)=")
+_MARKER_RE = re.compile(r"=(START|END)-(\d+)=")
 
 
 def segments_from_srt(srt_file: str) -> list[dict]:
@@ -145,12 +146,13 @@ def segments_from_srt(srt_file: str) -> list[dict]:
     segments: list[dict] = []
     for e in entries:
         for line in e["lines"]:
-            m = _START_RE.match(line.strip())
-            if m:
-                starts[int(m.group(1))] = e["start"]
-            m = _END_RE.match(line.strip())
-            if m:
-                idx = int(m.group(1))
+            m = _MARKER_RE.match(line.strip())
+            if not m:
+                continue
+            idx = int(m.group(2))
+            if m.group(1) == "START":
+                starts[idx] = e["start"]
+            else:
                 start = starts.pop(idx, e["start"])
                 segments.append({"start": start, "end": e["end"]})
     return sorted(segments, key=lambda s: s["start"])
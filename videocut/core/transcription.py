@@ -1,5 +1,6 @@
 """Transcription utilities using WhisperX."""
 from __future__ import annotations
+import contextlib
 import json
 import platform
 import subprocess
@@ -10,28 +11,65 @@ from dotenv import load_dotenv
 import requests
 
 from . import pdf_utils, segmentation
+from ._jsoncache import tool_stdout
 
 load_dotenv()
 
 _BASE_DIR = Path(__file__).resolve().parents[2]
 _DEFAULT_WHISPER_BIN = _BASE_DIR / "tools/whisper/whisper"
-_DEFAULT_MODEL = _BASE_DIR / "tools/models/ggml-small.en-q8.bin"
+_MODEL_DIR = _BASE_DIR / "tools/models"
+# 5-bit weights load and run faster than q8_0 on CPU for little accuracy loss
+DEFAULT_QUANT = "q5_1"
 
 
-def _run(cmd: list[str]) -> None:
+def model_path(quant: str = DEFAULT_QUANT) -> Path:
+    """Return the ``ggml-small.en`` model file for *quant* (``fp16`` = unquantized)."""
+    suffix = "" if quant == "fp16" else f"-{quant}"
+    return _MODEL_DIR / f"ggml-small.en{suffix}.bin"
+
+
+_DEFAULT_MODEL = model_path()
+
+
+def _run(cmd: list[str], **kwargs) -> None:
     """Run subprocess command and exit on failure."""
     try:
-        subprocess.run(cmd, check=True)
+        subprocess.run(cmd, check=True, **kwargs)
     except subprocess.CalledProcessError as exc:  # pragma: no cover - passthrough
         raise SystemExit(exc.returncode) from exc
 
 
+@contextlib.contextmanager
+def _wav_stream(video: str):
+    """Yield a pipe carrying *video*'s audio as 16 kHz mono WAV.
+
+    The audio reaches the reader without an intermediate WAV on disk.
+    whisper.cpp reads all of stdin before it starts decoding, so this saves
+    the file round-trip rather than overlapping decoding with inference.
+    If the reader fails, its error is raised in preference to ffmpeg's.
+    """
+    proc = subprocess.Popen(
+        ["ffmpeg", "-v", "error", "-i", video, "-ac", "1", "-ar", "16000",
+         "-f", "wav", "pipe:1"],
+        stdout=subprocess.PIPE,
+    )
+    try:
+        yield proc.stdout
+    except BaseException:
+        proc.stdout.close()
+        proc.wait()
+        raise
+    proc.stdout.close()
+    if proc.wait() != 0:  # pragma: no cover - passthrough
+        raise SystemExit(proc.returncode)
+
+
 def _ensure_model(model: Path) -> None:
     """Download Whisper model from Hugging Face if missing."""
     if model.exists():
         return
     model.parent.mkdir(parents=True, exist_ok=True)
-    url = "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-small.en-q8_0.bin"
+    url = f"https://huggingface.co/ggerganov/whisper.cpp/resolve/main/{model.name}"
     print(f"[videocut] Downloading model → {model} …")
     with requests.get(url, stream=True) as r:  # pragma: no cover - network
         r.raise_for_status()
@@ -41,33 +79,32 @@ def _ensure_model(model: Path) -> None:
                     f.write(chunk)
 
 
-def _transcribe_whispercpp(video: str, whisper_bin: Path = _DEFAULT_WHISPER_BIN, model: Path = _DEFAULT_MODEL) -> None:
-    """Transcribe *video* using whisper.cpp."""
+def _transcribe_whispercpp(
+    video: str,
+    whisper_bin: Path = _DEFAULT_WHISPER_BIN,
+    model: Path = _DEFAULT_MODEL,
+    flash_attn: bool = False,
+) -> None:
+    """Transcribe *video* using whisper.cpp, streaming the audio over stdin.
+
+    *flash_attn* passes ``-fa``, which cuts encoder memory traffic but is
+    rejected by whisper.cpp builds and backends that lack it.
+    """
     base_stem = Path(video).stem
-    wav_path = Path(f"{base_stem}.wav")
-    _run([
-        "ffmpeg",
-        "-y",
-        "-i",
-        video,
-        "-ac",
-        "1",
-        "-ar",
-        "16000",
-        str(wav_path),
-    ])
     _ensure_model(model)
-    _run([
+    cmd = [
         str(whisper_bin),
         "-m",
         str(model),
         "-f",
-        str(wav_path),
-        "-osrt",
-        "-of",
-        base_stem,
-    ])
-    wav_path.unlink(missing_ok=True)
+        "-",
+        "-t",
+        str(max(1, (os.cpu_count() or 2) // 2)),
+    ]
+    if flash_attn:
+        cmd.append("-fa")
+    with _wav_stream(video) as audio:
+        _run([*cmd, "-osrt", "-of", base_stem], stdin=audio, stdout=tool_stdout())
 
 
 def is_apple_silicon() -> bool:
@@ -101,6 +138,69 @@ def transcribe_with_mlx(video_path: str) -> str:
 
 
 
+# Loaded WhisperX models keyed by (model name, device, compute type) so
+# repeated transcriptions in one process skip the multi-second model load.
+_MODEL_CACHE: dict[tuple[str, str, str], object] = {}
+_WHISPERX_MODEL = "small"
+
+
+def _load_whisperx_model(whisperx, device: str):
+    """Return the cached WhisperX ASR model for *device*, loading it once."""
+    key = (_WHISPERX_MODEL, device, compute_type())
+    if key not in _MODEL_CACHE:
+        _MODEL_CACHE[key] = whisperx.load_model(
+            _WHISPERX_MODEL, device, compute_type=key[2]
+        )
+    return _MODEL_CACHE[key]
+
+
+# Alignment models keyed by (language, device), cached like _MODEL_CACHE.
+_ALIGN_CACHE: dict[tuple[str, str], tuple] = {}
+
+
+def _load_whisperx_align(whisperx, language: str, device: str):
+    """Return the cached ``(align_model, metadata)`` pair, loading it once."""
+    key = (language, device)
+    if key not in _ALIGN_CACHE:
+        _ALIGN_CACHE[key] = whisperx.load_align_model(language, device)
+    return _ALIGN_CACHE[key]
+
+
+def _transcribe_whisperx_inprocess(
+    whisperx, torch, video: str, hf_token: str | None, diarize: bool, progress: bool = True
+) -> None:
+    """Transcribe *video* with an in-process WhisperX model.
+
+    Produces the same ``<stem>.json``/``.srt``/``.tsv`` outputs as the
+    ``whisperx`` CLI in the working directory.  Relies on WhisperX's Python
+    API (``DiarizationPipeline``, ``utils.get_writer``), which changes between
+    releases; :func:`transcribe` falls back to the CLI if a call here fails.
+    """
+    device = "cuda" if torch is not None and torch.cuda.is_available() else "cpu"
+    model = _load_whisperx_model(whisperx, device)
+    audio = whisperx.load_audio(video)
+    result = model.transcribe(audio, print_progress=progress)
+    language = result.get("language", "en")
+
+    align_model, meta = _load_whisperx_align(whisperx, language, device)
+    result = whisperx.align(
+        result["segments"], align_model, meta, audio, device, print_progress=progress
+    )
+    if diarize:
+        diarize_model = whisperx.DiarizationPipeline(use_auth_token=hf_token, device=device)
+        result = whisperx.assign_word_speakers(diarize_model(audio), result)
+
+    result["language"] = language
+    from whisperx.utils import get_writer
+
+    writer = get_writer("all", ".")
+    writer(
+        result,
+        video,
+        {"highlight_words": False, "max_line_count": None, "max_line_width": None},
+    )
+
+
 def transcribe(
     video: str,
     hf_token: str | None = None,
@@ -109,16 +209,24 @@ def transcribe(
     progress: bool = True,
     pdf_path: str | None = None,
     backend: str = "whisperx",
+    quant: str = DEFAULT_QUANT,
+    inprocess: bool = False,
+    flash_attn: bool = False,
 ) -> None:
     """Run WhisperX on *video* and produce ``markup_guide.txt``.
 
     If ``speaker_db`` is provided, diarized speaker labels will be mapped to real
     names using embeddings after transcription. Set ``progress`` to ``False`` to
-    suppress the WhisperX progress output.
+    suppress the WhisperX progress output. *quant* selects the whisper.cpp
+    model file for the ``whispercpp`` backend (see :func:`model_path`), and
+    *flash_attn* turns on its flash attention.
+    Set *inprocess* to run WhisperX through its Python API and keep the
+    loaded models for later calls; without it, or if that fails, the
+    ``whisperx`` CLI is used.
     """
     if backend == "whispercpp":
         print("[INFO] Using whisper.cpp backend")
-        _transcribe_whispercpp(video)
+        _transcribe_whispercpp(video, model=model_path(quant), flash_attn=flash_attn)
         return
     if backend == "mlx":
         print("[INFO] Using mlx-whisper backend")
@@ -126,27 +234,40 @@ def transcribe(
         with open("markup_guide.txt", "w") as f:
             f.write(result)
         return
-    try:  # pragma: no cover - optional heavy deps may be missing
-        import torch  # noqa: F401
-        import whisperx  # noqa: F401
-    except ModuleNotFoundError:  # pragma: no cover - graceful fallback
-        torch = None
-        whisperx = None
 
     out_json = f"{Path(video).stem}.json"
     srt_path = Path(video).with_suffix(".srt")
-    cmd = ["whisperx", video, "--compute_type", compute_type(), "--output_dir", "."]
-    if progress:
-        cmd += ["--print_progress", "True"]
-    if diarize:
-        if not hf_token:
-            sys.exit("❌  --diarize requires --hf_token or HF_TOKEN env var")
-        cmd += ["--diarize", "--hf_token", hf_token]
-
-    print("🧠  WhisperX …")
-    env = os.environ.copy()
-    env.setdefault("PYTHONWARNINGS", "ignore")
-    subprocess.run(cmd, check=True, env=env)
+    if diarize and not hf_token:
+        sys.exit("❌  --diarize requires --hf_token or HF_TOKEN env var")
+
+    done = False
+    if inprocess:
+        try:  # pragma: no cover - optional heavy deps may be missing
+            import torch
+            import whisperx
+        except ModuleNotFoundError:
+            print("⚠️  whisperx is not importable – using the whisperx CLI")
+        else:
+            print("🧠  WhisperX (in-process) …")
+            try:
+                _transcribe_whisperx_inprocess(
+                    whisperx, torch, video, hf_token, diarize, progress
+                )
+                done = True
+            except (AttributeError, ImportError, TypeError) as exc:
+                # API drift between whisperx releases; the CLI is stable
+                print(f"⚠️  in-process WhisperX failed ({exc}) – using the whisperx CLI")
+    if not done:
+        cmd = ["whisperx", video, "--compute_type", compute_type(), "--output_dir", "."]
+        if progress:
+            cmd += ["--print_progress", "True"]
+        if diarize:
+            cmd += ["--diarize", "--hf_token", hf_token]
+
+        print("🧠  WhisperX …")
+        env = os.environ.copy()
+        env.setdefault("PYTHONWARNINGS", "ignore")
+        subprocess.run(cmd, check=True, env=env, stdout=tool_stdout())
     if not Path(out_json).exists():
         sys.exit(f"❌  Expected {out_json} not produced")
 
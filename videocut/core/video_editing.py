@@ -1,9 +1,13 @@
 """Video editing helpers using FFmpeg."""
 from __future__ import annotations
+import bisect
 import subprocess
 import json
+import os
 import sys
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 from . import segmentation, alignment
@@ -19,6 +23,8 @@ FADE_SEC = 0.033      # 1-frame fade in & out
 TARGET_W, TARGET_H = 1280, 720
 TARGET_FPS = 30
 BUFFER_SEC = 10.0
+KEYFRAME_TOL_SEC = 0.02  # cuts this close to a keyframe are stream copied
+PROBE_JOBS = min(os.cpu_count() or 1, 8)  # concurrent ffprobe runs
 
 
 def _parse_time(ts: str) -> float:
@@ -79,37 +85,152 @@ def _build_faded_clip(src: Path, dst: Path) -> None:
     ], check=True)
 
 
+def _keyframe_times(input_video: str) -> list[float] | None:
+    """Return sorted video keyframe timestamps, or ``None`` if probing fails.
+
+    ``-skip_frame nokey`` makes ffprobe decode keyframes only, and the
+    output is read line by line as it streams in.
+    """
+    cmd = [
+        "ffprobe", "-v", "error", "-select_streams", "v:0", "-skip_frame", "nokey",
+        "-show_entries", "frame=pts_time", "-of", "csv=p=0", input_video
+    ]
+    times = []
+    try:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True) as proc:
+            for line in proc.stdout:
+                value = line.split(",")[0].strip()
+                if value and value != "N/A":
+                    times.append(float(value))
+    except OSError:
+        return None
+    if proc.returncode != 0:
+        return None
+    return sorted(times)
+
+
+def _on_keyframe(t: float, keyframes: list[float]) -> bool:
+    i = bisect.bisect_left(keyframes, t - KEYFRAME_TOL_SEC)
+    return i < len(keyframes) and keyframes[i] <= t + KEYFRAME_TOL_SEC
+
+
+def _fade_clip(i: int, out_dir: str) -> None:
+    tmp = Path(out_dir) / f"tmp_{i:03d}.mp4"
+    _build_faded_clip(tmp, Path(out_dir) / f"clip_{i:03d}.mp4")
+    tmp.unlink()
+
+
+def _cut_clip(
+    input_video: str, seg: dict, i: int, out_dir: str, reencode: bool = False
+) -> None:
+    """Cut segment *i* into ``clip_{i:03d}.mp4`` and normalize it.
+
+    The seek happens before ``-i`` so ffmpeg jumps straight to the start
+    instead of decoding everything before it.  Stream copy can only start on
+    a keyframe; with *reencode* the cut is decoded into a lossless
+    intermediate so it starts on the exact frame.
+    """
+    tmp = Path(out_dir) / f"tmp_{i:03d}.mp4"
+    print(f"🎬  clip_{i:03d}  {seg['start']:.2f}–{seg['end']:.2f}")
+    if reencode:
+        codec = ["-c:v", "libx264", "-preset", "ultrafast", "-qp", "0", "-c:a", "aac"]
+    else:
+        codec = ["-c", "copy", "-avoid_negative_ts", "make_zero"]
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-v",
+            "error",
+            "-y",
+            "-ss",
+            str(seg["start"]),
+            "-i",
+            input_video,
+            "-t",
+            str(seg["end"] - seg["start"]),
+            *codec,
+            str(tmp),
+        ],
+        check=True,
+    )
+    _fade_clip(i, out_dir)
+
+
+def _copy_clips(input_video: str, items: list[tuple[int, dict]], out_dir: str) -> None:
+    """Stream copy every ``(i, seg)`` in *items* with a single ffmpeg run.
+
+    Each clip gets its own input with an input-side ``-ss``/``-t`` so the
+    copy starts on the keyframe at or before the cut, exactly as in
+    :func:`_cut_clip`; output-side seeking would drop the leading
+    non-keyframes and start the video after the audio.  One process still
+    handles every clip instead of spawning an ffmpeg per cut.
+    """
+    cmd = ["ffmpeg", "-v", "error", "-y"]
+    for i, seg in items:
+        cmd += ["-ss", str(seg["start"]), "-t", str(seg["end"] - seg["start"]), "-i", input_video]
+    for n, (i, seg) in enumerate(items):
+        print(f"🎬  clip_{i:03d}  {seg['start']:.2f}–{seg['end']:.2f}")
+        cmd += [
+            "-map", f"{n}:v:0", "-map", f"{n}:a:0?",
+            "-c", "copy", "-avoid_negative_ts", "make_zero",
+            str(Path(out_dir) / f"tmp_{i:03d}.mp4"),
+        ]
+    subprocess.run(cmd, check=True)
+
+
+def default_jobs() -> int:
+    """Return the default number of concurrent ffmpeg clip jobs."""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
 def generate_clips_from_segments(
     input_video: str,
     segments: list[dict],
     out_dir: str = "clips",
+    jobs: int | None = None,
+    reencode: bool | None = None,
 ) -> None:
-    """Cut *input_video* into clips based on *segments*."""
+    """Cut *input_video* into clips based on *segments*.
+
+    Clips are stream copied unless *reencode* is set; by default only clips
+    whose start misses a keyframe are re-encoded, and every clip is
+    re-encoded when the keyframes cannot be probed.  All stream-copied
+    clips are extracted by one ffmpeg run.  Re-encoded cuts and
+    the per-clip fade pass are independent ffmpeg runs, so up to *jobs* of
+    them (default half the CPU count) are run at once.
+    """
     Path(out_dir).mkdir(exist_ok=True)
-    for i, seg in enumerate(segments):
-        tmp = Path(out_dir) / f"tmp_{i:03d}.mp4"
-        final = Path(out_dir) / f"clip_{i:03d}.mp4"
-        print(f"🎬  clip_{i:03d}  {seg['start']:.2f}–{seg['end']:.2f}")
-        subprocess.run(
-            [
-                "ffmpeg",
-                "-v",
-                "error",
-                "-y",
-                "-ss",
-                str(seg["start"]),
-                "-to",
-                str(seg["end"]),
-                "-i",
-                input_video,
-                "-c",
-                "copy",
-                str(tmp),
-            ],
-            check=True,
-        )
-        _build_faded_clip(tmp, final)
-        tmp.unlink()
+    if reencode is None:
+        keyframes = _keyframe_times(input_video)
+        modes = [
+            keyframes is None or not _on_keyframe(seg["start"], keyframes)
+            for seg in segments
+        ]
+    else:
+        modes = [reencode] * len(segments)
+    # keyframe-aligned cuts are extracted together; the rest need their own run
+    copied = [(i, seg) for i, seg in enumerate(segments) if not modes[i]]
+    if len(copied) > 1:
+        _copy_clips(input_video, copied, out_dir)
+        tasks = [(_fade_clip, i, out_dir) for i, _ in copied]
+        tasks += [
+            (_cut_clip, input_video, seg, i, out_dir, True)
+            for i, seg in enumerate(segments) if modes[i]
+        ]
+    else:
+        tasks = [
+            (_cut_clip, input_video, seg, i, out_dir, modes[i])
+            for i, seg in enumerate(segments)
+        ]
+    jobs = jobs or default_jobs()
+    if jobs == 1 or len(tasks) <= 1:
+        for fn, *args in tasks:
+            fn(*args)
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(fn, *args) for fn, *args in tasks]
+            for fut in futures:
+                fut.result()
     print(f"✅  {len(segments)} polished clip(s) in {out_dir}/")
 
 
@@ -205,6 +326,102 @@ def _segments_with_text(txt_file: str) -> list[dict]:
     return segs
 
 
+def _align_segments(
+    input_video: str,
+    segments_file: str,
+    out_dir: str,
+    srt_file: str | None = None,
+) -> tuple[list[dict], dict]:
+    """Return aligned ``[{start, end}]`` segments and their timestamp report.
+
+    Each segment from *segments_file* is cut with a buffer, aligned against
+    its snippet text and trimmed to the first and last aligned word.
+    """
+    parsed = _segments_with_text(segments_file)
+
+    spans: list[tuple[int, float, float, str]] = []
+    if parsed and "start" in parsed[0]:
+        # new timestamp-based format
+        for i, seg in enumerate(parsed):
+            spans.append((i, seg["start"], seg["end"], seg["text"]))
+    else:
+        if srt_file is None:
+            srt_file = str(Path(input_video).with_suffix(".srt"))
+        if not Path(srt_file).exists():
+            sys.exit(f"❌  SRT file '{srt_file}' required for segments.txt")
+
+        entries = _load_srt_entries(Path(srt_file))
+        idx = {e["number"]: e for e in entries}
+        for i, seg in enumerate(parsed):
+            if seg.get("start_num") not in idx or seg.get("end_num") not in idx:
+                continue
+            spans.append((
+                i,
+                idx[seg["start_num"]]["start"],
+                idx[seg["end_num"]]["end"],
+                seg["text"],
+            ))
+
+    final: list[dict] = []
+    timestamps: dict = {}
+    Path(out_dir).mkdir(exist_ok=True)
+    for i, orig_start, orig_end, text in spans:
+        buf_start = max(0.0, orig_start - BUFFER_SEC)
+        buf_end = orig_end + BUFFER_SEC
+
+        buf_path = Path(out_dir) / f"buffer_{i:03d}.mp4"
+        subprocess.run([
+            "ffmpeg",
+            "-v",
+            "error",
+            "-y",
+            "-ss",
+            str(buf_start),
+            "-to",
+            str(buf_end),
+            "-i",
+            input_video,
+            "-c",
+            "copy",
+            str(buf_path),
+        ], check=True)
+
+        txt_path = Path(out_dir) / f"clip_{i:03d}_snippet.txt"
+        txt_path.write_text(text + "\n")
+        aligned_json = Path(out_dir) / f"clip_{i:03d}_aligned.json"
+        alignment.align_with_transcript(
+            str(buf_path), str(txt_path), str(aligned_json)
+        )
+
+        words = json.loads(aligned_json.read_text())
+        if words:
+            rel_start = float(words[0]["start"])
+            rel_end = float(words[-1]["end"])
+        else:
+            rel_start = 0.0
+            rel_end = buf_end - buf_start
+
+        abs_start = buf_start + rel_start
+        abs_end = buf_start + rel_end
+
+        final.append({"start": abs_start, "end": abs_end})
+        timestamps[f"clip_{i:03d}"] = {
+            "original": {
+                "start": f"{orig_start:.3f}",
+                "end": f"{orig_end:.3f}",
+            },
+            "aligned": {
+                "start": f"{abs_start:.3f}",
+                "end": f"{abs_end:.3f}",
+            },
+        }
+
+        buf_path.unlink(missing_ok=True)
+        txt_path.unlink(missing_ok=True)
+
+    return final, timestamps
+
+
 def generate_and_align(
     input_video: str,
     segments_file: str = "segments_to_keep.json",
@@ -216,144 +433,7 @@ def generate_and_align(
         sys.exit(f"❌  {segments_file} missing – run clip identification")
 
     if segments_file.endswith(".txt"):
-        parsed = _segments_with_text(segments_file)
-
-        # new timestamp-based format
-        if parsed and "start" in parsed[0]:
-            final: list[dict] = []
-            timestamps: dict = {}
-            Path(out_dir).mkdir(exist_ok=True)
-            for i, seg in enumerate(parsed):
-                orig_start = seg["start"]
-                orig_end = seg["end"]
-                buf_start = max(0.0, orig_start - BUFFER_SEC)
-                buf_end = orig_end + BUFFER_SEC
-
-                buf_path = Path(out_dir) / f"buffer_{i:03d}.mp4"
-                subprocess.run([
-                    "ffmpeg",
-                    "-v",
-                    "error",
-                    "-y",
-                    "-ss",
-                    str(buf_start),
-                    "-to",
-                    str(buf_end),
-                    "-i",
-                    input_video,
-                    "-c",
-                    "copy",
-                    str(buf_path),
-                ], check=True)
-
-                txt_path = Path(out_dir) / f"clip_{i:03d}_snippet.txt"
-                txt_path.write_text(seg["text"] + "\n")
-                aligned_json = Path(out_dir) / f"clip_{i:03d}_aligned.json"
-                alignment.align_with_transcript(
-                    str(buf_path), str(txt_path), str(aligned_json)
-                )
-
-                words = json.loads(aligned_json.read_text())
-                if words:
-                    rel_start = float(words[0]["start"])
-                    rel_end = float(words[-1]["end"])
-                else:
-                    rel_start = 0.0
-                    rel_end = buf_end - buf_start
-
-                abs_start = buf_start + rel_start
-                abs_end = buf_start + rel_end
-
-                final.append({"start": abs_start, "end": abs_end})
-                timestamps[f"clip_{i:03d}"] = {
-                    "original": {
-                        "start": f"{orig_start:.3f}",
-                        "end": f"{orig_end:.3f}",
-                    },
-                    "aligned": {
-                        "start": f"{abs_start:.3f}",
-                        "end": f"{abs_end:.3f}",
-                    },
-                }
-
-                buf_path.unlink(missing_ok=True)
-                txt_path.unlink(missing_ok=True)
-
-            if final:
-                generate_clips_from_segments(input_video, final, out_dir)
-                Path(out_dir, "timestamps.json").write_text(
-                    json.dumps(timestamps, indent=2)
-                )
-        else:
-            if srt_file is None:
-                srt_file = str(Path(input_video).with_suffix(".srt"))
-            if not Path(srt_file).exists():
-                sys.exit(f"❌  SRT file '{srt_file}' required for segments.txt")
-
-            entries = _load_srt_entries(Path(srt_file))
-            idx = {e["number"]: e for e in entries}
-
-            final: list[dict] = []
-            timestamps: dict = {}
-            Path(out_dir).mkdir(exist_ok=True)
-            for i, seg in enumerate(parsed):
-                if seg.get("start_num") not in idx or seg.get("end_num") not in idx:
-                    continue
-                orig_start = idx[seg["start_num"]]["start"]
-                orig_end = idx[seg["end_num"]]["end"]
-                buf_start = max(0.0, orig_start - BUFFER_SEC)
-                buf_end = orig_end + BUFFER_SEC
-
-                buf_path = Path(out_dir) / f"buffer_{i:03d}.mp4"
-                subprocess.run([
-                    "ffmpeg",
-                    "-v",
-                    "error",
-                    "-y",
-                    "-ss",
-                    str(buf_start),
-                    "-to",
-                    str(buf_end),
-                    "-i",
-                    input_video,
-                    "-c",
-                    "copy",
-                    str(buf_path),
-                ], check=True)
-
-                txt_path = Path(out_dir) / f"clip_{i:03d}_snippet.txt"
-                txt_path.write_text(seg["text"] + "\n")
-                aligned_json = Path(out_dir) / f"clip_{i:03d}_aligned.json"
-                alignment.align_with_transcript(
-                    str(buf_path), str(txt_path), str(aligned_json)
-                )
-
-                words = json.loads(aligned_json.read_text())
-                if words:
-                    rel_start = float(words[0]["start"])
-                    rel_end = float(words[-1]["end"])
-                else:
-                    rel_start = 0.0
-                    rel_end = buf_end - buf_start
-
-                abs_start = buf_start + rel_start
-                abs_end = buf_start + rel_end
-
-                final.append({"start": abs_start, "end": abs_end})
-                timestamps[f"clip_{i:03d}"] = {
-                    "original": {
-                        "start": f"{orig_start:.3f}",
-                        "end": f"{orig_end:.3f}",
-                    },
-                    "aligned": {
-                        "start": f"{abs_start:.3f}",
-                        "end": f"{abs_end:.3f}",
-                    },
-                }
-
-                buf_path.unlink(missing_ok=True)
-                txt_path.unlink(missing_ok=True)
-
+        final, timestamps = _align_segments(input_video, segments_file, out_dir, srt_file)
         if final:
             generate_clips_from_segments(input_video, final, out_dir)
             Path(out_dir, "timestamps.json").write_text(json.dumps(timestamps, indent=2))
@@ -362,11 +442,113 @@ def generate_and_align(
         generate_clips_from_segments(input_video, segs, out_dir)
 
 
+def _has_audio(input_video: str) -> bool:
+    """Return ``True`` if *input_video* has at least one audio stream."""
+    out = subprocess.check_output([
+        "ffprobe", "-v", "error", "-select_streams", "a", "-show_entries",
+        "stream=index", "-of", "csv=p=0", input_video
+    ], text=True)
+    return bool(out.strip())
+
+
+def render_segments(
+    input_video: str,
+    segments: list[dict],
+    out_file: str = "final_video.mp4",
+) -> None:
+    """Cut *segments* from *input_video* and join them in one ffmpeg pass.
+
+    The clips get the same normalization, fades and white flashes as
+    :func:`generate_clips_from_segments` followed by :func:`concatenate_clips`,
+    but the output is not identical: cuts here are frame-exact rather than
+    snapped to keyframes, and the video is encoded once instead of twice.
+    Each segment is its own input seeked with ``-ss``/``-t``, so only the
+    kept spans are decoded.  A source without audio gets silence.
+    """
+    if not segments:
+        sys.exit("❌  No segments to render")
+
+    audio = _has_audio(input_video)
+    cmd = ["ffmpeg", "-v", "error", "-y"]
+    for seg in segments:
+        dur = float(seg["end"]) - float(seg["start"])
+        cmd += ["-ss", str(seg["start"]), "-t", str(dur), "-i", input_video]
+
+    parts: list[str] = []
+    labels: list[str] = []
+    for i, seg in enumerate(segments):
+        dur = float(seg["end"]) - float(seg["start"])
+        end_time = max(dur - FADE_SEC, 0)
+        parts.append(
+            f"[{i}:v]fps={TARGET_FPS},"
+            f"scale={TARGET_W}:{TARGET_H}:force_original_aspect_ratio=decrease,"
+            f"pad={TARGET_W}:{TARGET_H}:(ow-iw)/2:(oh-ih)/2:color=white,"
+            f"format=yuv420p,setsar=1,setpts=PTS-STARTPTS,"
+            f"fade=t=in:st=0:d={FADE_SEC},fade=t=out:st={end_time}:d={FADE_SEC}[v{i}]"
+        )
+        if audio:
+            parts.append(
+                f"[{i}:a]asetpts=PTS-STARTPTS,aresample=48000,"
+                f"aformat=channel_layouts=stereo,"
+                f"afade=t=in:st=0:d={FADE_SEC},afade=t=out:st={end_time}:d={FADE_SEC}[a{i}]"
+            )
+        else:
+            parts.append(f"anullsrc=r=48000:cl=stereo,atrim=duration={dur}[a{i}]")
+        labels.append(f"[v{i}][a{i}]")
+        if i < len(segments) - 1:
+            parts.append(
+                f"color=c=0xfafafa:s={TARGET_W}x{TARGET_H}:r={TARGET_FPS}:d={WHITE_FLASH_SEC},"
+                f"format=yuv420p,setsar=1[fv{i}]"
+            )
+            parts.append(
+                f"anullsrc=r=48000:cl=stereo,atrim=duration={WHITE_FLASH_SEC}[fa{i}]"
+            )
+            labels.append(f"[fv{i}][fa{i}]")
+    parts.append(f"{''.join(labels)}concat=n={len(labels)}:v=1:a=1[outv][outa]")
+
+    cmd += [
+        "-filter_complex", ";".join(parts),
+        "-map", "[outv]", "-map", "[outa]",
+        "-r", str(TARGET_FPS),
+        "-c:v", "libx264", "-preset", "veryfast", "-crf", "20",
+        "-c:a", "aac", "-b:a", "128k", out_file,
+    ]
+    subprocess.run(cmd, check=True)
+    print(f"🏁  {out_file} assembled ({len(segments)} segments + white flashes, single pass)")
+
+
+def generate_and_concatenate(
+    input_video: str,
+    segments_file: str = "segments_to_keep.json",
+    out_file: str = "final_video.mp4",
+    srt_file: str | None = None,
+    work_dir: str = "clips",
+) -> None:
+    """Align segments like :func:`generate_and_align` and render *out_file* directly.
+
+    Only ``timestamps.json`` is written to *work_dir*; no per-clip files are
+    kept between the cut and the concatenation.
+    """
+    if not Path(segments_file).exists():
+        sys.exit(f"❌  {segments_file} missing – run clip identification")
+
+    if segments_file.endswith(".txt"):
+        final, timestamps = _align_segments(input_video, segments_file, work_dir, srt_file)
+        if not final:
+            sys.exit(f"❌  No segments found in {segments_file}")
+        Path(work_dir, "timestamps.json").write_text(json.dumps(timestamps, indent=2))
+    else:
+        final = json.loads(Path(segments_file).read_text())
+    render_segments(input_video, final, out_file)
+
+
 def clip_segments(
     input_video: str,
     segments_file: str = "segments_to_keep.json",
     out_dir: str = "clips",
     srt_file: str | None = None,
+    jobs: int | None = None,
+    reencode: bool | None = None,
 ) -> None:
     """Generate clips exactly as specified in the segments file."""
     if not Path(segments_file).exists():
@@ -385,14 +567,136 @@ def clip_segments(
     else:
         segs = json.loads(Path(segments_file).read_text())
 
-    generate_clips_from_segments(input_video, segs, out_dir)
+    generate_clips_from_segments(input_video, segs, out_dir, jobs, reencode)
+
+
+def _probe_stream_params(clip: Path) -> tuple:
+    """Return the codec/format parameters that must match for stream copy."""
+    info = json.loads(subprocess.check_output([
+        "ffprobe", "-v", "error", "-show_entries",
+        "stream=codec_type,codec_name,profile,width,height,pix_fmt,r_frame_rate,"
+        "time_base,sample_rate,channels",
+        "-of", "json", str(clip)
+    ], text=True))
+    params = []
+    for st in info.get("streams", []):
+        if st.get("codec_type") == "video":
+            params.append(("video", st.get("codec_name"), st.get("profile"),
+                           st.get("width"), st.get("height"), st.get("pix_fmt"),
+                           st.get("r_frame_rate"), st.get("time_base")))
+        elif st.get("codec_type") == "audio":
+            params.append(("audio", st.get("codec_name"), st.get("sample_rate"),
+                           st.get("channels"), st.get("time_base")))
+    return tuple(params)
+
+
+def _flash_compatible(params: tuple) -> bool:
+    """Return ``True`` if :func:`_make_flash_clip` can encode to *params*.
+
+    The flash is always libx264/yuv420p with AAC audio, so only clips in that
+    encoding can be joined with it by stream copy.
+    """
+    for p in params:
+        if p[0] == "video" and (p[1], p[5]) != ("h264", "yuv420p"):
+            return False
+        if p[0] == "audio" and p[1] != "aac":
+            return False
+    return True
+
+
+def _make_flash_clip(dst: Path, params: tuple) -> None:
+    """Encode one white flash clip matching *params* so it can be stream-copied."""
+    video = next(p for p in params if p[0] == "video")
+    audio = next((p for p in params if p[0] == "audio"), None)
+    _, _, profile, w, h, _, fps, time_base = video
+    cmd = [
+        "ffmpeg", "-v", "error", "-y",
+        "-f", "lavfi", "-i", f"color=c=0xfafafa:s={w}x{h}:r={fps}:d={WHITE_FLASH_SEC}",
+    ]
+    if audio is not None:
+        cmd += ["-f", "lavfi", "-i", f"anullsrc=r={audio[2]}:cl=stereo",
+                "-ac", str(audio[3]), "-c:a", "aac", "-b:a", "128k"]
+    cmd += [
+        "-t", str(WHITE_FLASH_SEC),
+        "-c:v", "libx264", "-preset", "veryfast", "-crf", "20", "-pix_fmt", "yuv420p",
+    ]
+    profile = (profile or "").lower().replace("constrained ", "")
+    if profile in ("baseline", "main", "high"):
+        cmd += ["-profile:v", profile]
+    if time_base and "/" in time_base:
+        # the concat demuxer copies timestamps, so the flash must share the clips' timescale
+        cmd += ["-video_track_timescale", time_base.split("/", 1)[1]]
+    cmd.append(str(dst))
+    subprocess.run(cmd, check=True)
+
+
+def _concat_stream_copy(clips: List[Path], params: tuple, out_file: str) -> bool:
+    """Join *clips* with white flashes using the concat demuxer (no re-encode).
+
+    Returns ``False`` without writing *out_file* when the encoded flash does
+    not probe identical to the clips, as the demuxer would then splice
+    mismatched streams.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        flash = Path(tmp) / "flash.mp4"
+        if len(clips) > 1:  # a lone clip needs no transition to be encoded
+            _make_flash_clip(flash, params)
+            if _probe_stream_params(flash) != params:
+                return False
+        entries: List[Path] = []
+        for idx, c in enumerate(clips):
+            entries.append(c)
+            if idx < len(clips) - 1:
+                entries.append(flash)
+        list_file = Path(tmp) / "concat.txt"
+        list_file.write_text("".join(
+            "file '{}'\n".format(str(p.resolve()).replace("'", "'\\''")) for p in entries
+        ))
+        subprocess.run([
+            "ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", str(list_file),
+            "-c", "copy", out_file
+        ], check=True)
+    return True
+
+
+def _list_clips(clips_dir: str) -> List[Path]:
+    """Return the ``clip_*.mp4`` files in *clips_dir* in name order.
+
+    ``os.scandir`` hands back names and file types from a single directory
+    read, where ``Path.glob`` builds a path object and may stat every entry.
+    """
+    try:
+        with os.scandir(clips_dir) as it:
+            names = sorted(
+                e.name for e in it
+                if e.name.startswith("clip_") and e.name.endswith(".mp4") and e.is_file()
+            )
+    except FileNotFoundError:
+        return []
+    return [Path(clips_dir, n) for n in names]
 
 
 def concatenate_clips(clips_dir: str = "clips", out_file: str = "final_video.mp4") -> None:
-    clips = sorted(Path(clips_dir).glob("clip_*.mp4"))
+    clips = _list_clips(clips_dir)
     if not clips:
         sys.exit("❌  No clips found – run generate-and-align or clip first")
 
+    # Clips produced by _build_faded_clip share one encoding, so they can be
+    # stream-copied; only mismatched inputs need the filter graph re-encode.
+    # each probe is its own short ffprobe run; overlap them instead of
+    # paying the process start-up latency once per clip
+    with ThreadPoolExecutor(max_workers=min(len(clips), PROBE_JOBS)) as pool:
+        params = list(pool.map(_probe_stream_params, clips))
+    if (
+        params[0]
+        and any(p[0] == "video" for p in params[0])
+        and all(p == params[0] for p in params)
+        and (len(clips) == 1 or _flash_compatible(params[0]))
+        and _concat_stream_copy(clips, params[0], out_file)
+    ):
+        print(f"🏁  {out_file} assembled ({len(clips)} clips + white flashes, stream copy)")
+        return
+
     w, h = map(str, subprocess.check_output([
         "ffprobe", "-v", "error", "-select_streams", "v:0", "-show_entries", "stream=width,height",
         "-of", "csv=p=0", str(clips[0])
@@ -435,6 +739,8 @@ def concatenate_clips(clips_dir: str = "clips", out_file: str = "final_video.mp4
 __all__ = [
     "generate_clips_from_segments",
     "generate_and_align",
+    "generate_and_concatenate",
+    "render_segments",
     "clip_segments",
     "concatenate_clips",
 ]
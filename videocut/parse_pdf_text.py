@@ -1,6 +1,5 @@
 import re
 from pathlib import Path
-from pdfminer.high_level import extract_text
 
 # Stop parsing once any of these patterns are encountered. The PDF contains
 # appended public comment emails after the actual meeting transcript which
@@ -22,6 +21,9 @@ SPEAKER_RE = re.compile(r"^([A-Z][A-Z'\- ]+):\s*(.*)")
 
 def parse_pdf(pdf_path: str) -> list[str]:
     """Return cleaned transcript lines."""
+    # imported here so modules that only need the constants stay light
+    from pdfminer.high_level import extract_text
+
     text = extract_text(pdf_path)
     lines = []
     current = None
@@ -185,3 +185,7 @@ def main(debug: bool = False):
     rows = load_rows()
     seg_lines = build_segments(rows, debug=debug)
     pathlib.Path("segments.txt").write_text("\n".join(seg_lines) + "\n")
+
+
+if __name__ == "__main__":
+    main()